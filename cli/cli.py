@@ -1,5 +1,6 @@
 import click
 from cli.commands.auth import auth
+from cli.commands.build import build
 from cli.commands.collect import collect
 from cli.commands.clean import clean
 from cli.commands.compute import compute
@@ -19,6 +20,7 @@ from cli.commands.save import save
 from cli.commands.status import status
 from cli.commands.url import url
 from cli.commands.view import view
+from cli.commands.worker import worker
 
 
 @click.group()
@@ -27,6 +29,7 @@ def cli():
 
 
 cli.add_command(auth)
+cli.add_command(build)
 cli.add_command(collect)
 cli.add_command(clean)
 cli.add_command(compute)
@@ -46,3 +49,4 @@ cli.add_command(save)
 cli.add_command(status)
 cli.add_command(url)
 cli.add_command(view)
+cli.add_command(worker)
@@ -0,0 +1,23 @@
+import click
+from connector import SSPIDatabaseConnector
+from cli.utilities import stream_response
+
+
+@click.command(help="Incrementally rebuild a series from raw data through finalization")
+@click.argument("series_code", type=str)
+@click.option("--remote", "-r", is_flag=True, help="Send the request to the remote server")
+@click.option("--refresh", "-R", multiple=True, required=False, help="Re-collect the source of this dataset")
+@click.option("--refresh-all", default=False, is_flag=True, help="Re-collect every source for the series")
+@click.option("--force", "-f", default=False, is_flag=True, help="Rebuild every clean, indicator and finalize step")
+def build(series_code, refresh: list[str], refresh_all: bool, force: bool, remote: bool):
+    connector = SSPIDatabaseConnector()
+    series_code = series_code.upper()
+    params = [f"refresh={code.upper()}" for code in refresh]
+    if refresh_all:
+        params.append("refreshAll=true")
+    if force:
+        params.append("force=true")
+    request_string = f"/api/v1/build/{series_code}"
+    if params:
+        request_string += "?" + "&".join(params)
+    stream_response(connector.call(request_string, method="POST", remote=remote, stream=True))
@@ -7,8 +7,11 @@ from cli.utilities import stream_response
 @click.command(help="Clean raw data to prepare datasets")
 @click.argument("series_code", type=str)
 @click.option("--remote", "-r", is_flag=True, help="Send the request to the remote server")
-def clean(series_code, remote: bool):
+@click.option("--force", "-f", default=False, is_flag=True, help="Clean datasets whose raw data is unchanged since the last clean")
+def clean(series_code, remote: bool, force: bool):
     connector = SSPIDatabaseConnector()
     series_code = series_code.upper()
     request_string = f"/api/v1/clean/{series_code}"
+    if force:
+        request_string += "?force=true"
     stream_response(connector.call(request_string, remote=remote, stream=True, timeout=300))
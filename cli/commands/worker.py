@@ -0,0 +1,18 @@
+import click
+
+
+@click.command(help="Run queued custom scoring jobs in a local process pool (local only)")
+@click.option("--processes", "-p", type=int, default=None, help="Number of scoring processes (default: one per core)")
+@click.option("--poll-interval", type=float, default=1.0, help="Seconds between checks of the job queue")
+def worker(processes: int | None, poll_interval: float):
+    """
+    Claim PENDING scoring jobs queued by web workers running with
+    SCORING_WORKER_MODE=queue and run their pipelines until interrupted.
+    """
+    import logging
+    from sspi_flask_app.api.resources.scoring_worker import run_worker
+
+    logging.basicConfig(level=logging.INFO)
+    click.secho("Scoring worker started; press Ctrl-C to stop", fg="green")
+    claimed = run_worker(max_workers=processes, poll_interval=poll_interval)
+    click.secho(f"Scoring worker stopped after {claimed} jobs", fg="green")
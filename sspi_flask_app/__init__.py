@@ -153,6 +153,7 @@ def init_app(Config):
         from sspi_flask_app.api.core.sspi import compute_bp
         from sspi_flask_app.api.core.sspi import impute_bp
         from sspi_flask_app.api.core.dataset import dataset_bp
+        from sspi_flask_app.api.core.build import build_bp
         from sspi_flask_app.api.core.dashboard import dashboard_bp
         from sspi_flask_app.api.core.delete import delete_bp
         from sspi_flask_app.api.core.download import download_bp
@@ -179,8 +180,12 @@ def init_app(Config):
         # Initialize MongoDB indexes for the worker-safe scoring job store
         from sspi_flask_app.models.database import sspi_scoring_jobs
         sspi_scoring_jobs.create_indexes()
+        # Initialize MongoDB indexes for the build orchestrator state
+        from sspi_flask_app.models.database import sspi_build_state
+        sspi_build_state.create_indexes()
         # Register Blueprints
         api_bp.register_blueprint(dataset_bp)
+        api_bp.register_blueprint(build_bp)
         api_bp.register_blueprint(compute_bp)
         api_bp.register_blueprint(dashboard_bp)
         api_bp.register_blueprint(delete_bp)
@@ -0,0 +1,179 @@
+from flask import Blueprint, Response, current_app, request
+from functools import partial
+import logging
+from flask_login import current_user
+
+from sspi_flask_app import csrf
+from sspi_flask_app.api.core.dataset import clean_task, collect_task
+from sspi_flask_app.api.core.datasets import (
+    dataset_cleaner_registry,
+    dataset_collector_registry)
+from sspi_flask_app.api.core.finalize import finalize_sspi_dynamic_score_iterator
+from sspi_flask_app.api.core.sspi import call_compute, call_impute
+from sspi_flask_app.api.resources.build_graph import BuildNode, digest_of, run_build
+from sspi_flask_app.auth.decorators import admin_required, require_bearer_for_writes
+from sspi_flask_app.models.coverage import DataCoverage
+from sspi_flask_app.models.database import (
+    sspi_build_state,
+    sspi_clean_api_data,
+    sspi_metadata,
+    sspi_raw_api_data,
+)
+
+log = logging.getLogger(__name__)
+
+build_bp = Blueprint(
+    "build_bp",
+    __name__,
+    template_folder="templates",
+    static_folder="static",
+)
+
+# CSRF-exempt for CLI (Bearer) access, so writes require Bearer auth (see
+# dataset_bp)
+build_bp.before_request(require_bearer_for_writes)
+
+
+@build_bp.route("/build/<series_code>", methods=["POST"])
+@csrf.exempt  # API endpoint accessed programmatically (CLI/scripts), not browser forms
+@admin_required
+def build(series_code: str):
+    """
+    Incrementally rebuild a series from raw data through the dynamic score
+    finalization, running only the stale nodes of the dependency graph.
+
+    Raw data is collected only for sources with nothing stored, unless a
+    refresh is requested. Clean, indicator and finalize nodes rerun only when
+    the digest of their inputs differs from the one recorded at their last
+    build.
+
+    :param series_code: An ItemCode, DatasetCode or ALL
+    ---
+    :url_param refresh: Dataset codes whose sources should be re-collected
+    :url_param refreshAll: If True, re-collect every source
+    :url_param force: If True, rebuild every clean, indicator and finalize node
+    """
+    refresh = [code.upper() for code in request.args.getlist("refresh")]
+    refresh_all = request.args.get("refreshAll", "false").lower() == "true"
+    force = request.args.get("force", "false").lower() == "true"
+    make_ctx = current_app.test_request_context
+    user_obj = getattr(current_user, "_get_current_object", lambda: current_user)()
+    user_id = getattr(user_obj, "get_id", lambda: None)()
+    username = current_user.username if current_user.is_authenticated else "Anonymous"
+    nodes = build_plan(
+        series_code, refresh, refresh_all, username, make_ctx, user_obj, user_id,
+        force=force
+    )
+    return Response(
+        run_build(nodes, sspi_build_state, force=force),
+        mimetype="text/event-stream"
+    )
+
+
+def build_plan(series_code, refresh, refresh_all, username, make_ctx, user_obj, user_id,
+               force=False) -> list[BuildNode]:
+    """
+    Build the node graph for series_code:
+        raw:<DatasetCode> -> clean:<DatasetCode> -> indicator:<IndicatorCode> -> finalize:score
+    There is one raw node per RawDocumentSet, named after the first dataset
+    drawing on it (as in reduce_dataset_list). With force, finalize:score
+    rescores every country-year instead of only those whose inputs changed.
+    """
+    target_series = "SSPI" if series_code.upper() == "ALL" else series_code.upper()
+    dataset_list = sspi_metadata.get_dataset_dependencies(target_series)
+    indicator_codes = sspi_metadata.get_indicator_dependencies(target_series)
+    sources = {ds: source_info_or_none(ds) for ds in dataset_list}
+    nodes = []
+    raw_node_ids = {}
+    for ds in dataset_list:
+        source_info = sources[ds]
+        collector = dataset_collector_registry.get(ds)
+        if source_info is None or collector is None or ds in raw_node_ids:
+            continue
+        sharing = [d for d in dataset_list if sources[d] == source_info]
+        node_id = f"raw:{ds}"
+        for d in sharing:
+            raw_node_ids[d] = node_id
+        nodes.append(BuildNode(
+            node_id, [],
+            partial(collect_task, ds, collector, username=username),
+            partial(sspi_raw_api_data.source_digest, source_info),
+            always_run=refresh_all or any(d in refresh for d in sharing),
+            external=True,
+        ))
+    for i, ds in enumerate(dataset_list):
+        cleaner = dataset_cleaner_registry.get(ds)
+        if cleaner is None:
+            continue
+        source_info = sources[ds]
+        if source_info is None:
+            # Without a RawDocumentSet to compare against, always re-clean
+            input_digest = no_digest
+        else:
+            input_digest = partial(sspi_raw_api_data.source_digest, source_info)
+        nodes.append(BuildNode(
+            f"clean:{ds}",
+            [raw_node_ids[ds]] if ds in raw_node_ids else [],
+            partial(clean_task, ds, cleaner, i, len(dataset_list)),
+            input_digest,
+        ))
+    node_ids = {node.node_id for node in nodes}
+    indicator_digests = {}
+    for ic in indicator_codes:
+        dataset_codes = sspi_metadata.get_item_detail(ic).get("DatasetCodes", [])
+        input_digest = partial(indicator_input_digest, dataset_codes)
+        indicator_digests[ic] = input_digest
+        nodes.append(BuildNode(
+            f"indicator:{ic}",
+            [f"clean:{ds}" for ds in dataset_codes if f"clean:{ds}" in node_ids],
+            partial(indicator_task, ic, make_ctx, user_obj, user_id),
+            input_digest,
+        ))
+    nodes.append(BuildNode(
+        "finalize:score",
+        [f"indicator:{ic}" for ic in indicator_codes],
+        partial(finalize_score_task, incremental=not force),
+        partial(finalize_input_digest, indicator_digests),
+    ))
+    return nodes
+
+
+def source_info_or_none(dataset_code: str) -> dict | None:
+    try:
+        return sspi_metadata.get_source_info(dataset_code)
+    except (ValueError, KeyError):
+        return None
+
+
+def no_digest() -> None:
+    return None
+
+
+def indicator_input_digest(dataset_codes: list[str]) -> str:
+    return digest_of(sspi_clean_api_data.data_versions(dataset_codes))
+
+
+def finalize_input_digest(indicator_digests: dict) -> str:
+    return digest_of({
+        "Indicators": {ic: digest() for ic, digest in indicator_digests.items()},
+        "Metadata": sspi_metadata.generation(),
+    })
+
+
+def indicator_task(indicator_code, make_ctx, user_obj, user_id):
+    for stage, call in (("Compute", call_compute), ("Impute", call_impute)):
+        rv = call(indicator_code, make_ctx, user_obj, user_id)
+        if rv is None:
+            yield f"No {stage.lower()} route for {indicator_code}\n"
+            continue
+        status = getattr(rv, "status_code", 200)
+        yield f"{stage} {indicator_code}: {status}\n"
+        if status >= 400:
+            raise RuntimeError(f"{stage} {indicator_code} returned {status}")
+
+
+def finalize_score_task(incremental=True):
+    coverage = DataCoverage(2000, 2023, "SSPI67")
+    yield from finalize_sspi_dynamic_score_iterator(
+        coverage.complete(), list(coverage.country_codes), incremental=incremental
+    )
@@ -2,9 +2,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     lookup_database,
     country_code_to_name,
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     generate_series_levels,
     generate_series_groups,
     jsonify_df
@@ -22,6 +20,7 @@ from flask import (
 )
 from sspi_flask_app.models.sspi import SSPI, FastSSPI
 from sspi_flask_app.models.coverage import DataCoverage
+from sspi_flask_app.models.panel_files import load_panel, panel_directory
 from flask_login import login_required
 from sspi_flask_app.models.database import (
     sspi_static_data_2018,
@@ -153,8 +152,9 @@ def get_dynamic_indicator_line_data(indicator_code):
     if country_query:
         query["CCode"] = {"$in": country_query}
 
-    # find() already returns a materialized list
-    dynamic_score_data = sspi_indicator_dynamic_line_data.find(query)
+    # find() already returns a materialized list; no ObjectIds survive the
+    # default projection, so skip the extended-JSON conversion
+    dynamic_score_data = sspi_indicator_dynamic_line_data.find(query, codec=None)
 
     if not dynamic_score_data:
         # No chart data available for this indicator
@@ -338,7 +338,7 @@ def get_dataset_panel_data(dataset_code):
     dataset_detail = sspi_metadata.get_dataset_detail(dataset_code)
     if not dataset_detail:
         abort(404, description=f"Dataset code '{dataset_code}' not found")
-    panel_data_datasets = sspi_panel_data.find({"DatasetCode": dataset_code})
+    panel_data_datasets = sspi_panel_data.find({"DatasetCode": dataset_code}, codec=None)
     year_labels = list(range(2000, datetime.now().year + 1))
     group_options = sspi_metadata.country_groups()
     country_group_map = sspi_metadata.country_group_map()
@@ -661,8 +661,8 @@ def do_backward_extrapolate(year: int):
     if not all(isinstance(item, dict) for item in data):
         return jsonify({"error": "All items in data must be dictionaries"}), 400
     if series_id:
-        return parse_json(extrapolate_backward(data, year, series_id=series_id))
-    return parse_json(extrapolate_backward(data, year))
+        return parse_json(extrapolate_and_interpolate(data, year, None, series_id=series_id, interpolate=False))
+    return parse_json(extrapolate_and_interpolate(data, year, None, interpolate=False))
 
 
 @dashboard_bp.route("/utilities/extrapolate/forward/<int:year>", methods=["POST"])
@@ -683,8 +683,8 @@ def do_forward_extrapolate(year: int):
     if not all(isinstance(item, dict) for item in data):
         return jsonify({"error": "All items in data must be dictionaries"}), 400
     if series_id:
-        return parse_json(extrapolate_forward(data, year, series_id=series_id))
-    return parse_json(extrapolate_forward(data, year))
+        return parse_json(extrapolate_and_interpolate(data, None, year, series_id=series_id, interpolate=False))
+    return parse_json(extrapolate_and_interpolate(data, None, year, interpolate=False))
 
 
 @dashboard_bp.route("/utilities/interpolate/linear", methods=["POST"])
@@ -703,7 +703,7 @@ def do_linear_interpolate():
         return jsonify({"error": "Data must be a list"}), 400
     if not all(isinstance(item, dict) for item in data):
         return jsonify({"error": "All items in data must be dictionaries"}), 400
-    return parse_json(interpolate_linear(data))
+    return parse_json(extrapolate_and_interpolate(data))
 
 
 @dashboard_bp.route("/utilities/panel/levels", methods=["POST"])
@@ -906,7 +906,7 @@ def get_series_panel_plot(series_id):
             return f"{identifiers['IndicatorCode']} (Series Hash: {series_id})"
         return f"Panel Plot (Series Hash: {series_id})"
 
-    panel_data = sspi_panel_data.find({"SeriesIdentifier": series_id}, {"_id": 0})
+    panel_data = sspi_panel_data.find({"SeriesIdentifier": series_id}, {"_id": 0}, codec=None)
     min_year = panel_data[0]["minYear"]
     max_year = panel_data[0]["maxYear"]
     has_score = panel_data[0].get("score", None) is not None
@@ -1347,7 +1347,7 @@ def dynamic_stack_data(country_code, root_item_code):
         "CCode": country_code,
         "ICode": {"$in": child_codes + [root_item_code]},
     }
-    data = sspi_item_dynamic_line_data.find(mongo_query)
+    data = sspi_item_dynamic_line_data.find(mongo_query, codec=None)
 
     # Define explicit pillar order for consistent stacking
     # In stacked charts, last dataset appears at TOP of stack
@@ -1743,6 +1743,43 @@ def globe_data():
     return sspi_globe_data.find({})[0]
 
 
+def panel_series(panel_name, axis, array_key, series_code, field):
+    """
+    Slice one series out of a memory-mapped panel file written at
+    finalization, as the country documents fetch_series returns.
+
+    Returns None when the panel file has not been written or does not
+    contain the series, so callers can fall back to the line data.
+    """
+    panel = load_panel(panel_directory(), panel_name)
+    if panel is None:
+        return None
+    row = panel.position(axis, series_code)
+    if row is None:
+        return None
+    values = panel[array_key][row]
+    observed = ~np.isnan(values)
+    country_lookup = {c["CountryCode"]: c for c in sspi_metadata.country_details()}
+    years = panel.index["Years"]
+    data = []
+    for i, country_code in enumerate(panel.index["CountryCodes"]):
+        if not observed[i].any():
+            continue
+        detail = country_lookup.get(country_code, {})
+        data.append({
+            "CCode": country_code,
+            "CName": detail.get("Country", country_code),
+            "CFlag": detail.get("Flag", ""),
+            "CGroup": detail.get("CountryGroups", []),
+            "years": years,
+            field: [
+                float(value) if present else None
+                for value, present in zip(values[i], observed[i])
+            ],
+        })
+    return data
+
+
 def fetch_series(series_code):
     """
     Determine series type and fetch from appropriate collection.
@@ -1766,8 +1803,8 @@ def fetch_series(series_code):
 
             if item_type == "Indicator":
                 # Fetch from indicator collection
-                data = parse_json(
-                    sspi_indicator_dynamic_line_data.find({"ICode": series_code})
+                data = sspi_indicator_dynamic_line_data.find(
+                    {"ICode": series_code}, codec=None
                 )
                 return data, {
                     "code": series_code,
@@ -1777,10 +1814,12 @@ def fetch_series(series_code):
                 }
 
             elif item_type in ["Pillar", "Category", "SSPI"]:
-                # Fetch from item collection
-                data = parse_json(
-                    sspi_item_dynamic_line_data.find({"ICode": series_code})
-                )
+                # Slice the item panel file, else fetch from item collection
+                data = panel_series("items", "ItemCodes", "scores", series_code, "score")
+                if data is None:
+                    data = sspi_item_dynamic_line_data.find(
+                        {"ICode": series_code}, codec=None
+                    )
                 return data, {
                     "code": series_code,
                     "name": item_detail.get("ItemName", series_code),
@@ -1794,10 +1833,12 @@ def fetch_series(series_code):
     try:
         dataset_detail = sspi_metadata.get_dataset_detail(series_code)
         if dataset_detail:
-            # Fetch from panel data
-            data = parse_json(
-                sspi_panel_data.find({"DatasetCode": series_code})
-            )
+            # Slice the dataset panel file, else fetch from panel data
+            data = panel_series("datasets", "DatasetCodes", "values", series_code, "value")
+            if data is None:
+                data = sspi_panel_data.find(
+                    {"DatasetCode": series_code}, codec=None
+                )
             return data, {
                 "code": series_code,
                 "name": dataset_detail.get("DatasetName", series_code),
@@ -1968,7 +2009,9 @@ def fast_score():
     coverage = DataCoverage(2000, 2023, "SSPI67", countries=country_codes)
     complete_indicators = coverage.complete()
     details_for_scoring = sspi_metadata.item_details(indicator_filter=complete_indicators)
-    indicator_order_map = {d["ItemCode"]: d["ItemOrder"] for d in details_for_scoring if d["ItemType"] == "Indicator"}
+    fast_sspi = FastSSPI(item_details=details_for_scoring)
+    # Order each ScoreArray as the rows of the FastSSPI score matrix
+    indicator_order_map = {code: i for i, code in enumerate(fast_sspi.indicator_codes)}
     order_map_literal = {"$literal": indicator_order_map}
     min_year = 2000
     max_year = 2023
@@ -2078,7 +2121,6 @@ def fast_score():
         indicator_score_matrix[row_idx] = doc["ScoreArray"]
         row_idx += 1
     indicator_score_matrix = np.vstack(indicator_score_matrix).astype(float)  # shape: (rows, k_indicators)
-    fast_sspi = FastSSPI(item_details=details_for_scoring)
     sspi_score_matrix = fast_sspi.score_matrix  # shape: (k_indicators, k_items)
     item_codes = fast_sspi.item_list
     n_items = len(item_codes)
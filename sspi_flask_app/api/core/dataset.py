@@ -1,4 +1,5 @@
 from flask import Blueprint, Response, jsonify, render_template, request
+from functools import partial
 import logging
 from flask_login import current_user, login_required
 
@@ -7,6 +8,7 @@ from sspi_flask_app.api.core.datasets import (
     dataset_collector_registry)
 
 from sspi_flask_app.auth.decorators import admin_required, require_bearer_for_writes
+from sspi_flask_app.api.resources.dataset_scheduler import run_dataset_tasks
 from sspi_flask_app.api.resources.utilities import (
     check_raw_document_set_coverage,
     parse_json,
@@ -102,18 +104,33 @@ def collect_iterator(dataset_list, **kwargs):
     """
     reduced_dataset_list = reduce_dataset_list(dataset_list)
     log.info(reduced_dataset_list)
-    for ds in reduced_dataset_list:
-        source_info = sspi_metadata.get_source_info(ds)
-        if sspi_raw_api_data.raw_data_available(source_info):
-            sspi_raw_api_data.delete_many(
-                sspi_raw_api_data.build_source_query(source_info)
-            )
+    tasks = []
     for ds in reduced_dataset_list:
         collector = dataset_collector_registry.get(ds)
         if not collector:
             yield f"error: No collector implemented for dataset {ds}!\n"
         else:
-            yield from collector(**kwargs)
+            tasks.append((ds, partial(collect_task, ds, collector, **kwargs)))
+    yield from run_dataset_tasks(tasks)
+
+
+def collect_task(ds, collector, **kwargs):
+    """
+    Collect a RawDocumentSet next to the existing one, then keep whichever
+    is current: if the source returned identical content the new documents
+    are discarded and the downstream datasets are left marked as clean.
+    """
+    source_info = sspi_metadata.get_source_info(ds)
+    previous_ids = sspi_raw_api_data.document_ids(source_info)
+    try:
+        yield from collector(**kwargs)
+    except BaseException:
+        sspi_raw_api_data.discard_new_documents(source_info, previous_ids)
+        raise
+    downstream_datasets = sspi_metadata.get_downstream_datasets(source_info)
+    changed, _ = sspi_raw_api_data.replace_or_keep(source_info, previous_ids, downstream_datasets)
+    if not changed:
+        yield "Raw data unchanged since last collection; kept existing documents\n"
 
 
 @dataset_bp.route("/clean/<series_code>", methods=["GET"])        
@@ -125,14 +142,26 @@ def clean_series_code(series_code: str):
         if not cleaner:
             return jsonify({"error": f"No cleaner implemented for dataset {dataset_list[0]}!"}), 400
         else:
-            return parse_json(cleaner())
-    return Response(clean_iterator(dataset_list), mimetype="text/event-stream")
+            result = cleaner()
+            sspi_raw_api_data.mark_cleaned(dataset_list[0])
+            return parse_json(result)
+    force = request.args.get("force", "false").lower() == "true"
+    return Response(clean_iterator(dataset_list, force=force), mimetype="text/event-stream")
 
-def clean_iterator(dataset_list):
+def clean_iterator(dataset_list, force=False):
+    tasks = []
     for i, ds in enumerate(dataset_list):
         cleaner = dataset_cleaner_registry.get(ds, None)
         if not cleaner:
             yield f"error: No cleaner implemented for dataset {ds}!\n"
+        elif not force and not sspi_raw_api_data.needs_cleaning(ds):
+            yield f"Skipping dataset {ds}: raw data unchanged since last clean\n"
         else:
-            yield f"Cleaning dataset {ds} ( {i +1} of {len(dataset_list)} )\n"
-            cleaner()
+            tasks.append((ds, partial(clean_task, ds, cleaner, i, len(dataset_list))))
+    yield from run_dataset_tasks(tasks)
+
+
+def clean_task(ds, cleaner, i, n):
+    yield f"Cleaning dataset {ds} ( {i + 1} of {n} )\n"
+    cleaner()
+    sspi_raw_api_data.mark_cleaned(ds)
@@ -1,12 +1,25 @@
 from io import BytesIO
-from flask import Blueprint, request, send_file, jsonify
+from itertools import chain
+from flask import Blueprint, Response, request, send_file, jsonify, stream_with_context
 import pandas as pd
 from pymongo.errors import OperationFailure
 
-from ..resources.utilities import lookup_database, parse_json, public_databases
+from ..resources.utilities import (
+    lookup_database,
+    public_databases,
+    build_columnar_table,
+    serialize_columnar_table,
+    stream_csv,
+    stream_ndjson
+)
 from ..resources.query_builder import get_query_params
 from sspi_flask_app.models.database import sspidb, sspi_metadata
-from sspi_flask_app.models.errors import InvalidDatabaseError, InvalidQueryError
+from sspi_flask_app.models.database.mongo_wrapper import extended_json_codec
+from sspi_flask_app.models.errors import (
+    InvalidDatabaseError,
+    InvalidDocumentFormatError,
+    InvalidQueryError
+)
 import json
 
 
@@ -23,21 +36,21 @@ ic_choices = sspi_metadata.indicator_codes()
 cg_choices = sspi_metadata.country_groups()
 
 
-def fetch_data_for_download(request_args):
+def resolve_download_query(request_args):
     """
-    Fetches data for download using the shared query builder.
-    Unsupported parameters for the selected database are silently ignored.
+    Resolves the download database and MongoDB query using the shared query
+    builder. Unsupported parameters for the selected database are silently
+    ignored.
 
     Args:
         request_args: Flask request.args (ImmutableMultiDict)
 
     Returns:
-        list: List of documents matching the query
+        tuple: (database wrapper, MongoDB query dictionary)
 
     Raises:
         InvalidDatabaseError: If the requested database is not allowed
         InvalidQueryError: If query parameters are invalid
-        OperationFailure: If database operation fails
     """
     # Get and validate database name
     database_name = request_args.get("database", default="sspi_static_data_2018")
@@ -55,10 +68,60 @@ def fetch_data_for_download(request_args):
     # Build query using shared query builder
     # The query builder will handle database-specific schemas and ignore unsupported parameters
     mongo_query = get_query_params(request, database)
+    return database, mongo_query
+
 
-    # Execute query and return results
-    data_to_download = parse_json(database.find(mongo_query, options={"_id": 0}))
-    return data_to_download
+def fetch_data_for_download(request_args):
+    """
+    Fetches data for download using the shared query builder.
+    Unsupported parameters for the selected database are silently ignored.
+
+    Args:
+        request_args: Flask request.args (ImmutableMultiDict)
+
+    Returns:
+        list: List of documents matching the query
+
+    Raises:
+        InvalidDatabaseError: If the requested database is not allowed
+        InvalidQueryError: If query parameters are invalid
+        OperationFailure: If database operation fails
+    """
+    database, mongo_query = resolve_download_query(request_args)
+    return database.find(mongo_query, options={"_id": 0})
+
+
+def iter_data_for_download(request_args):
+    """
+    Streaming counterpart of fetch_data_for_download: returns the first
+    matching document (None if the query matched nothing) and an iterator
+    over all matching documents, including the first, read straight off the
+    Mongo cursor.
+
+    The first document is fetched eagerly so that query errors and empty
+    results can still be reported with a proper status code before the
+    streamed response begins.
+
+    Raises:
+        InvalidDatabaseError: If the requested database is not allowed
+        InvalidQueryError: If query parameters are invalid
+        OperationFailure: If database operation fails
+    """
+    database, mongo_query = resolve_download_query(request_args)
+    documents = database.iter_find(
+        mongo_query, options={"_id": 0}, codec=extended_json_codec
+    )
+    first_document = next(documents, None)
+    if first_document is None:
+        return None, iter(())
+    return first_document, chain([first_document], documents)
+
+
+def no_data_response():
+    return jsonify({
+        "warning": "No data matched your query criteria",
+        "hint": "Try broadening your search parameters or use /download/databases to see supported parameters"
+    }), 404
 
 
 @download_bp.route("/databases")
@@ -97,6 +160,9 @@ def download_csv():
         - timePeriod: Time period labels to expand (e.g., "2000-2004")
         - YearRangeStart / YearRangeEnd: Year range to include
 
+        - stream: If "true", write rows as the cursor produces them instead of
+          building the file in memory. Columns are taken from the first row.
+
     Note: Not all parameters are supported by all databases. Use /download/databases
     to see which parameters are supported by each database.
 
@@ -104,13 +170,20 @@ def download_csv():
         CSV file download or JSON error message
     """
     try:
+        if request.args.get("stream", "").lower() == "true":
+            first_document, documents = iter_data_for_download(request.args)
+            if first_document is None:
+                return no_data_response()
+            return Response(
+                stream_with_context(stream_csv(documents)),
+                mimetype='text/csv',
+                headers={"Content-Disposition": "attachment; filename=SSPIData.csv"}
+            )
+
         data_to_download = fetch_data_for_download(request.args)
 
         if not data_to_download:
-            return jsonify({
-                "warning": "No data matched your query criteria",
-                "hint": "Try broadening your search parameters or use /download/databases to see supported parameters"
-            }), 404
+            return no_data_response()
 
         df = pd.DataFrame(data_to_download).to_csv()
         mem = BytesIO()
@@ -157,10 +230,7 @@ def download_json():
         data_to_download = fetch_data_for_download(request.args)
 
         if not data_to_download:
-            return jsonify({
-                "warning": "No data matched your query criteria",
-                "hint": "Try broadening your search parameters or use /download/databases to see supported parameters"
-            }), 404
+            return no_data_response()
 
         mem = BytesIO()
         mem.write(json.dumps(data_to_download).encode('utf-8'))
@@ -179,3 +249,106 @@ def download_json():
         return jsonify({"error": "Database Operation Failed: " + str(e)}), 500
     except Exception as e:
         return jsonify({"error": "Unexpected Error: " + str(e)}), 500
+
+
+@download_bp.route("/ndjson")
+def download_ndjson():
+    """
+    Download data from the database as newline-delimited JSON, streamed one
+    document per line as the query produces them. Memory use is constant in
+    the size of the result and the first line is sent before the query
+    finishes.
+
+    Accepts the same query parameters as /download/json.
+
+    Returns:
+        NDJSON stream or JSON error message
+    """
+    try:
+        first_document, documents = iter_data_for_download(request.args)
+        if first_document is None:
+            return no_data_response()
+        return Response(
+            stream_with_context(stream_ndjson(documents)),
+            mimetype='application/x-ndjson',
+            headers={"Content-Disposition": "attachment; filename=SSPIData.ndjson"}
+        )
+    except InvalidDatabaseError as e:
+        return jsonify({"error": str(e)}), 400
+    except InvalidQueryError as e:
+        return jsonify({"error": str(e)}), 400
+    except OperationFailure as e:
+        return jsonify({"error": "Database Operation Failed: " + str(e)}), 500
+    except Exception as e:
+        return jsonify({"error": "Unexpected Error: " + str(e)}), 500
+
+
+COLUMNAR_FORMATS = {
+    "parquet": ("application/vnd.apache.parquet", "SSPIData.parquet"),
+    "arrow": ("application/vnd.apache.arrow.file", "SSPIData.arrow"),
+}
+
+
+def download_columnar(file_format: str):
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return jsonify({
+            "error": f"{file_format.title()} export is unavailable: pyarrow is not installed"
+        }), 501
+    try:
+        database, mongo_query = resolve_download_query(request.args)
+        table = build_columnar_table(
+            database.iter_find(mongo_query, options={"_id": 0})
+        )
+        if table.num_rows == 0:
+            return no_data_response()
+        mimetype, download_name = COLUMNAR_FORMATS[file_format]
+        return send_file(
+            serialize_columnar_table(table, file_format),
+            mimetype=mimetype,
+            download_name=download_name,
+            as_attachment=True
+        )
+    except InvalidDatabaseError as e:
+        return jsonify({"error": str(e)}), 400
+    except InvalidQueryError as e:
+        return jsonify({"error": str(e)}), 400
+    except InvalidDocumentFormatError as e:
+        return jsonify({"error": str(e)}), 400
+    except OperationFailure as e:
+        return jsonify({"error": "Database Operation Failed: " + str(e)}), 500
+    except Exception as e:
+        return jsonify({"error": "Unexpected Error: " + str(e)}), 500
+
+
+@download_bp.route("/parquet")
+def download_parquet():
+    """
+    Download data from the database as a Parquet file.
+
+    Code columns (CountryCode, ItemCode, DatasetCode, ...) are dictionary
+    encoded, Year is stored as int16 and Score/Value as float64, so the file
+    is a fraction of the size of the CSV export and loads without text
+    parsing (e.g. pandas.read_parquet).
+
+    Accepts the same query parameters as /download/csv.
+
+    Returns:
+        Parquet file download or JSON error message
+    """
+    return download_columnar("parquet")
+
+
+@download_bp.route("/arrow")
+def download_arrow():
+    """
+    Download data from the database as an Arrow IPC (Feather v2) file with
+    the same column typing as /download/parquet.
+
+    Accepts the same query parameters as /download/csv.
+
+    Returns:
+        Arrow IPC file download or JSON error message
+    """
+    return download_columnar("arrow")
@@ -27,12 +27,20 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json
 )
 from sspi_flask_app.models.coverage import DataCoverage
-from sspi_flask_app.models.sspi import SSPI
-from sspi_flask_app.models.rank import SSPIRankingTable
+from sspi_flask_app.models.sspi import SSPI, FastSSPI
+from sspi_flask_app.models.rank import rank_groups, rank_scores
+from sspi_flask_app.models.panel_files import (
+    MISSING_RANK,
+    PANEL_MIN_YEAR,
+    panel_directory,
+    write_panel,
+)
 import re
 import os
 import json
+import hashlib
 import pycountry
+import numpy as np
 from datetime import datetime
 
 
@@ -74,6 +82,8 @@ def finalize_iterator(local_path, endpoints):
         yield finalize_dataset_range() 
         yield "Finalizing Dataset Panel\n"
         yield finalize_dataset_panel() 
+        yield "Finalizing Panel Files\n"
+        yield finalize_panel_files()
         yield "Finalization Complete\n"
     except Exception as e:
         yield f"error: Finalization failed with exception: {str(e)}\n"
@@ -119,8 +129,8 @@ def finalize_sspi_static_rank_data():
         for item_code, rank_dict in rank_dict.items():
             if item_code in score_group_dictionary:
                 score_group_dictionary[item_code][i].update(rank_dict)
+    rank_groups(score_group_dictionary.values())
     for item_code in sspi_item_codes:
-        SSPIRankingTable(score_group_dictionary[item_code])
         score_group_dictionary[item_code] = sorted(
             score_group_dictionary[item_code], key=lambda x: x["Rank"]
         )
@@ -423,7 +433,7 @@ def finalize_dynamic_line_indicator_datasets():
         for code in indicator_codes
     }
     all_countries = set()
-    for ind_data in sspi_indicator_data.find({
+    for ind_data in sspi_indicator_data.iter_find({
         "IndicatorCode": {"$in": indicator_codes},
         "Year": {"$gte": min_year, "$lte": max_year}
     }, {"CountryCode": 1}):
@@ -505,7 +515,7 @@ def finalize_dynamic_line_indicator_datasets():
         }
     ]
     yield "Executing Aggregation Pipeline\n"
-    grouped_data_cursor = sspi_indicator_data.aggregate(pipeline)
+    grouped_data_cursor = sspi_indicator_data.iter_aggregate(pipeline)
     yield "Processing Indicator Line Data\n"
     documents = []
     BATCH_SIZE = 500
@@ -608,7 +618,7 @@ def finalize_dynamic_line_score_datasets():
         if item.get("ItemCode")
     }
     all_countries = set()
-    for item_data in sspi_item_data.find({}, {"CountryCode": 1}):
+    for item_data in sspi_item_data.iter_find({}, {"CountryCode": 1}):
         all_countries.add(item_data["CountryCode"])
 
     country_details_lookup = {
@@ -648,7 +658,7 @@ def finalize_dynamic_line_score_datasets():
     ]
 
     yield "Executing Aggregation Pipeline\n"
-    grouped_data_cursor = sspi_item_data.aggregate(pipeline)
+    grouped_data_cursor = sspi_item_data.iter_aggregate(pipeline)
 
     yield "Processing Score Line Data\n"
     documents = []
@@ -763,7 +773,7 @@ def finalize_matrix_iterator(local_path, endpoints):
             }
         }
     ]
-    result = sspi_indicator_data.aggregate(pipeline)
+    result = sspi_indicator_data.iter_aggregate(pipeline)
     sspi49_countries = set(sspi_metadata.country_group("SSPI49"))
     sspi_extended_countries = set(sspi_metadata.country_group("SSPIExtended"))
     indicator_details, indicator_map = sspi_metadata.indicator_details(), {}
@@ -799,8 +809,12 @@ def finalize_matrix_iterator(local_path, endpoints):
 def finalize_sspi_dynamic_score():
     """
     Prepare the data for a Chart.js line plot
+
+    Pass Incremental=true to rescore only the country-years whose indicator
+    data (or the scoring metadata) changed since the last finalization.
     """
     countries = request.args.getlist("CountryCode")
+    incremental = request.args.get("Incremental", "").lower() == "true"
     country_group = request.args.get("CountryGroup")
     if country_group is None:
         country_group = "SSPI67"
@@ -809,11 +823,37 @@ def finalize_sspi_dynamic_score():
     country_list = list(coverage.country_codes)
     app.logger.info(f"country_list: {country_list}")
     app.logger.info(f"indicator_list: {indicator_list}")
-    return Response(finalize_sspi_dynamic_score_iterator(indicator_list, country_list), mimetype='text/event-stream')
+    return Response(
+        finalize_sspi_dynamic_score_iterator(indicator_list, country_list, incremental=incremental),
+        mimetype='text/event-stream'
+    )
 
 
-def finalize_sspi_dynamic_score_iterator(indicator_codes: list[str], country_codes: list[str] | None = None):
-    sspi_item_data.delete_many({})
+def country_year_fingerprint(indicator_data: list[dict], scoring_key: str) -> str:
+    """
+    Hash the indicator data a country-year is scored from, together with a
+    key identifying the scoring metadata, so unchanged inputs can be skipped
+    """
+    # $push order across the unioned collections is not guaranteed
+    canonical = sorted(
+        json.dumps(obs, sort_keys=True, separators=(',', ':'), default=str)
+        for obs in indicator_data
+    )
+    json_str = json.dumps([scoring_key, canonical], separators=(',', ':'))
+    return hashlib.sha256(json_str.encode('utf-8')).hexdigest()[:32]
+
+
+def finalize_sspi_dynamic_score_iterator(indicator_codes: list[str], country_codes: list[str] | None = None, incremental: bool = False):
+    """
+    Score every country-year and store the results in sspi_item_data.
+
+    With incremental=True, existing results are kept and only country-years
+    whose input fingerprint differs from the stored one are rescored and
+    replaced; country-years that no longer have input data are removed.
+    """
+    if not incremental:
+        sspi_item_data.delete_many({})
+        sspi_item_data.clear_fingerprints()
     # Filter to only complete indicators to avoid scoring incomplete categories
     if country_codes is None:
         country_codes = sspi_metadata.country_group("SSPI67")
@@ -829,6 +869,12 @@ def finalize_sspi_dynamic_score_iterator(indicator_codes: list[str], country_cod
     # This ensures we can enrich computed items (pillars, categories) with metadata
     all_details = sspi_metadata.item_details()
     item_detail_lookup = {detail.get("ItemCode"): detail for detail in all_details if detail.get("ItemCode")}
+    # Any change to the scoring tree or the enrichment metadata invalidates
+    # every stored fingerprint
+    scoring_key = hashlib.sha256(
+        json.dumps([details_for_scoring, all_details], sort_keys=True, default=str).encode('utf-8')
+    ).hexdigest()
+    stored_fingerprints = sspi_item_data.fingerprints() if incremental else {}
 
     yield "Building Aggregation Pipeline\n"
 
@@ -898,53 +944,72 @@ def finalize_sspi_dynamic_score_iterator(indicator_codes: list[str], country_cod
 
     yield "Executing Aggregation Pipeline\n"
     # Execute aggregation - returns cursor of pre-grouped country-year data
-    grouped_data_cursor = sspi_indicator_data.aggregate(pipeline)
+    grouped_data_cursor = sspi_indicator_data.iter_aggregate(pipeline)
 
     yield "Scoring Data with Batch Inserts\n"
 
-    # Batch insert configuration for better performance
-    BATCH_SIZE = 500  # Insert every 500 documents to balance memory and DB performance
-    documents = []
+    # Country-years are scored together through one FastSSPI panel per batch
+    BATCH_SIZE = 200  # Country-years per batch; ~4,000 item documents per insert
+    fast_sspi = FastSSPI(details_for_scoring)
+    name_priority = ["Indicator", "Category", "Pillar", "Name", "ItemName"]
+    pending_data = []
+    batch_fingerprints = {}
+    seen_country_years = set()
     count = 0
+    skipped = 0
     total_documents_inserted = 0
-    # Process cursor without loading everything into memory
-    for group in grouped_data_cursor:
-        country_code = group["CountryCode"]
-        year = group["Year"]
-        indicator_data = group["Data"]
-        count += 1
-        if count % 100 == 0:
-            yield f"Scoring {country_code} ({year}) - Group {count}\n"
-        sspi = SSPI(details_for_scoring, indicator_data)
-        scores = sspi.to_score_documents(country_code)
 
+    def flush():
+        documents = fast_sspi.to_score_documents(pending_data)
         # Enrich score documents with metadata using pre-built lookup
-        for doc in scores:
-            item_code = doc["ItemCode"]
-            if item_code in item_detail_lookup:
-                detail = item_detail_lookup[item_code]
+        for doc in documents:
+            detail = item_detail_lookup.get(doc["ItemCode"])
+            if detail:
                 doc["Children"] = detail.get("Children", [])
-
                 # Add ItemName from metadata - use most specific name available
-                name_priority = ["Indicator", "Category", "Pillar", "Name", "ItemName"]
                 for name_key in name_priority:
                     if name_key in detail and detail[name_key]:
                         doc["ItemName"] = detail[name_key]
                         break
-
-            documents.append(doc)
-
-        # Batch insert when we hit the batch size threshold
-        if len(documents) >= BATCH_SIZE:
+        # Replace the previous results of the rescored country-years, then
+        # record their fingerprints only once the new scores are stored
+        if incremental:
+            sspi_item_data.delete_country_years(list(batch_fingerprints))
+        if documents:
             sspi_item_data.insert_many(documents)
-            total_documents_inserted += len(documents)
-            documents = []  # Clear batch
+        sspi_item_data.insert_fingerprints(batch_fingerprints)
+        pending_data.clear()
+        batch_fingerprints.clear()
+        return len(documents)
+
+    # Process cursor without loading everything into memory
+    for group in grouped_data_cursor:
+        country_code = group["CountryCode"]
+        year = group["Year"]
+        indicator_data = group["Data"]
+        count += 1
+        if count % 100 == 0:
+            yield f"Scoring {country_code} ({year}) - Group {count}\n"
+        fingerprint = country_year_fingerprint(indicator_data, scoring_key)
+        seen_country_years.add((country_code, year))
+        if stored_fingerprints.get((country_code, year)) == fingerprint:
+            skipped += 1
+            continue
+        batch_fingerprints[(country_code, year)] = fingerprint
+        pending_data.extend(indicator_data)
+        if len(batch_fingerprints) >= BATCH_SIZE:
+            total_documents_inserted += flush()
 
     # Insert any remaining documents
-    if documents:
-        sspi_item_data.insert_many(documents)
-        total_documents_inserted += len(documents)
-        yield f"Inserted final {len(documents)} documents\n"
+    if batch_fingerprints:
+        inserted = flush()
+        total_documents_inserted += inserted
+        yield f"Inserted final {inserted} documents\n"
+
+    if incremental:
+        removed = [cy for cy in stored_fingerprints if cy not in seen_country_years]
+        sspi_item_data.delete_country_years(removed)
+        yield f"Skipped {skipped} unchanged country-years, removed {len(removed)}\n"
 
     yield f"Scoring Complete - Total: {total_documents_inserted} documents inserted\n"
 
@@ -1185,7 +1250,7 @@ def finalize_dataset_panel():
     min_year = 2000
     max_year = 2023
     dataset_codes = sspi_metadata.dataset_codes()
-    panel_data = sspi_clean_api_data.aggregate([
+    panel_data = sspi_clean_api_data.iter_aggregate([
         {
             "$match": {
                 "DatasetCode": {"$in": dataset_codes},
@@ -1276,3 +1341,79 @@ def finalize_dataset_panel():
     if batch:
         count += sspi_panel_data.insert_many(batch)
     return f"Finalized {count} observations of Dataset Panel Data"
+
+
+def fill_panel(documents, row_field: str, value_field: str, row_codes: list[str],
+               country_codes: list[str], years: list[int]) -> np.ndarray:
+    """
+    Place each document's value_field in a (row, country, year) array, with
+    NaN where there is no numeric observation
+    """
+    panel = np.full((len(row_codes), len(country_codes), len(years)), np.nan)
+    row_index = {code: i for i, code in enumerate(row_codes)}
+    country_index = {code: i for i, code in enumerate(country_codes)}
+    for doc in documents:
+        row = row_index.get(doc.get(row_field))
+        country = country_index.get(doc.get("CountryCode"))
+        year = doc.get("Year")
+        value = doc.get(value_field)
+        if row is None or country is None or not isinstance(year, int):
+            continue
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            continue
+        if years[0] <= year <= years[-1]:
+            panel[row, country, year - years[0]] = value
+    return panel
+
+
+@finalize_bp.route("/finalize/panel/files")
+@admin_required
+def finalize_panel_files():
+    """
+    Write memory-mapped panel files of item scores and ranks and of the clean
+    dataset values, which dashboard endpoints slice instead of querying
+    """
+    # Same year window as the dynamic line data the panels stand in for
+    max_year = datetime.now().year
+    years = list(range(PANEL_MIN_YEAR, max_year + 1))
+    country_codes = sorted(c["CountryCode"] for c in sspi_metadata.country_details())
+    year_query = {"Year": {"$gte": PANEL_MIN_YEAR, "$lte": max_year}}
+    directory = panel_directory()
+    item_codes = sorted(sspi_item_data.distinct("ItemCode"))
+    scores = fill_panel(
+        sspi_item_data.iter_find(
+            year_query, {"_id": 0, "ItemCode": 1, "CountryCode": 1, "Year": 1, "Score": 1}
+        ),
+        "ItemCode", "Score", item_codes, country_codes, years
+    )
+    # Ranks are among the SSPI67 countries, as in the dynamic rank data
+    rank_group = "SSPI67"
+    group_countries = set(sspi_metadata.country_group(rank_group) or [])
+    group_mask = np.array([code in group_countries for code in country_codes], dtype=bool)
+    ranks = np.full(scores.shape, MISSING_RANK, dtype=np.int16)
+    group_ranks, _ = rank_scores(scores[:, group_mask, :], axis=1)
+    ranks[:, group_mask, :] = np.where(group_ranks > 0, group_ranks, MISSING_RANK)
+    write_panel(directory, "items", {"scores": scores, "ranks": ranks}, {
+        "ItemCodes": item_codes,
+        "CountryCodes": country_codes,
+        "Years": years,
+        "RankGroup": rank_group,
+    })
+    dataset_codes = sorted(sspi_metadata.dataset_codes())
+    values = fill_panel(
+        sspi_clean_api_data.iter_find(
+            {"DatasetCode": {"$in": dataset_codes}, **year_query},
+            {"_id": 0, "DatasetCode": 1, "CountryCode": 1, "Year": 1, "Value": 1}
+        ),
+        "DatasetCode", "Value", dataset_codes, country_codes, years
+    )
+    write_panel(directory, "datasets", {"values": values}, {
+        "DatasetCodes": dataset_codes,
+        "CountryCodes": country_codes,
+        "Years": years,
+        "DataVersions": sspi_clean_api_data.data_versions(dataset_codes),
+    })
+    return (
+        f"Wrote panel files for {len(item_codes)} items and "
+        f"{len(dataset_codes)} datasets over {len(country_codes)} countries\n"
+    )
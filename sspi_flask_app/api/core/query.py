@@ -1,9 +1,16 @@
-from flask import Blueprint, jsonify, request
+from itertools import chain
+
+from flask import Blueprint, Response, jsonify, request, stream_with_context
 from pymongo.errors import OperationFailure
 
-from sspi_flask_app.api.resources.utilities import lookup_database, parse_json
+from sspi_flask_app.api.resources.utilities import (
+    lookup_database,
+    parse_json,
+    stream_ndjson
+)
 from sspi_flask_app.api.resources.query_builder import get_query_params
 from sspi_flask_app.models.database import sspi_metadata
+from sspi_flask_app.models.database.mongo_wrapper import extended_json_codec
 from sspi_flask_app.models.errors import InvalidDatabaseError, InvalidQueryError
 
 query_bp = Blueprint(
@@ -21,9 +28,20 @@ def query_database(database_string):
         database = lookup_database(database_string)
         query_params = get_query_params(request, database)
         limit = request.args.get("limit", type=int)
-        return jsonify(
-            parse_json(database.find(query_params, options={"_id": 0}, limit=limit))
-        )
+        if request.args.get("format") == "ndjson":
+            # Stream one document per line straight off the cursor; the first
+            # document is pulled eagerly so query errors still map to a 400
+            documents = database.iter_find(
+                query_params, options={"_id": 0}, limit=limit, codec=extended_json_codec
+            )
+            first_document = next(documents, None)
+            if first_document is not None:
+                documents = chain([first_document], documents)
+            return Response(
+                stream_with_context(stream_ndjson(documents)),
+                mimetype="application/x-ndjson"
+            )
+        return jsonify(database.find(query_params, options={"_id": 0}, limit=limit))
     except InvalidDatabaseError as e:
         return jsonify({"error": "Invalid Database Provided: " + str(e)}), 400
     except InvalidQueryError as e:
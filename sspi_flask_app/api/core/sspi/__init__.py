@@ -86,6 +86,10 @@ def _call_internal(fn, path, make_ctx, user_obj, user_id):
 
 
 def call_compute(indicator_code, make_ctx, user_obj, user_id):
+    # make_ctx is bound to the app, so callers outside the compute routes
+    # (e.g. the build orchestrator) get the registries built on first use
+    if not _REGISTRY_INITIALIZED:
+        _build_registries_via(make_ctx.__self__)
     fn = _COMPUTE_REGISTRY.get(indicator_code.upper())
     if fn is None:
         return None
@@ -94,6 +98,8 @@ def call_compute(indicator_code, make_ctx, user_obj, user_id):
 
 
 def call_impute(indicator_code, make_ctx, user_obj, user_id):
+    if not _REGISTRY_INITIALIZED:
+        _build_registries_via(make_ctx.__self__)
     fn = _IMPUTE_REGISTRY.get(indicator_code.upper())
     if fn is None:
         return None
@@ -8,9 +8,7 @@ from sspi_flask_app.api.resources.utilities import (
     goalpost,
     slice_dataset,
     score_indicator,
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     impute_reference_class_average)
 
 from sspi_flask_app.auth.decorators import admin_required
@@ -68,15 +66,15 @@ def impute_fdepth():
     incomplete_dposit = slice_dataset(incomplete_fdepth, "DPOSIT")
     obs_credit = clean_credit + incomplete_credit
     obs_dposit = clean_dposit + incomplete_dposit
-    forward_credit = extrapolate_forward(obs_credit, 2023, impute_only=True)
+    forward_credit = extrapolate_and_interpolate(obs_credit, None, 2023, interpolate=False, impute_only=True)
     # return parse_json(obs_credit)
-    backward_credit = extrapolate_backward(obs_credit, 2000, impute_only=True)
-    interpolated_credit = interpolate_linear(obs_credit, impute_only=True)
+    backward_credit = extrapolate_and_interpolate(obs_credit, 2000, None, interpolate=False, impute_only=True)
+    interpolated_credit = extrapolate_and_interpolate(obs_credit, impute_only=True)
     # return parse_json(obs_credit)
     all_credit = obs_credit + forward_credit + backward_credit + interpolated_credit
-    forward_dposit = extrapolate_forward(obs_dposit, 2023, impute_only=True)
-    backward_dposit = extrapolate_backward(obs_dposit, 2000, impute_only=True)
-    interpolated_dposit = interpolate_linear(obs_dposit, impute_only=True)
+    forward_dposit = extrapolate_and_interpolate(obs_dposit, None, 2023, interpolate=False, impute_only=True)
+    backward_dposit = extrapolate_and_interpolate(obs_dposit, 2000, None, interpolate=False, impute_only=True)
+    interpolated_dposit = extrapolate_and_interpolate(obs_dposit, impute_only=True)
     gbr_dposit = impute_reference_class_average("GBR", 2000, 2023, "Intermediate", "DPOSIT", clean_dposit)
     all_dposit = obs_dposit + forward_dposit + backward_dposit + interpolated_dposit + gbr_dposit
     clean_list, incomplete_list = score_indicator(
@@ -4,9 +4,7 @@ from flask_login import current_user, login_required
 
 from sspi_flask_app.api.core.sspi import compute_bp, impute_bp
 from sspi_flask_app.api.resources.utilities import (
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     parse_json,
     score_indicator,
     regression_imputation,
@@ -45,9 +43,9 @@ def impute_ginipt():
     sspi_imputed_data.delete_many({"IndicatorCode": "GINIPT"})
     clean_ginipt = sspi_indicator_data.find({"IndicatorCode": "GINIPT"})
     ginipt_dataset = sspi_clean_api_data.find({"DatasetCode": "WB_GINIPT"})
-    forward = extrapolate_forward(ginipt_dataset, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(ginipt_dataset, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(ginipt_dataset, ["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(ginipt_dataset, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(ginipt_dataset, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(ginipt_dataset, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("GINIPT")
     imputed_ginipt, _ = score_indicator(
         forward + backward + interpolated, "GINIPT",
@@ -4,8 +4,7 @@ from flask_login import current_user, login_required
 
 from sspi_flask_app.api.core.sspi import compute_bp, impute_bp
 from sspi_flask_app.api.resources.utilities import (
-    extrapolate_backward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     parse_json,
     score_indicator,
     goalpost)
@@ -41,8 +40,8 @@ def impute_crptax():
     app.logger.info("Running /api/v1/impute/CRPTAX")
     sspi_imputed_data.delete_many({"IndicatorCode": "CRPTAX"})
     clean_crptax = sspi_clean_api_data.find({"DatasetCode": "TF_CRPTAX"})
-    backward = extrapolate_backward(clean_crptax, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(clean_crptax, ["CountryCode", "DatasetCode"], impute_only=True)
+    backward = extrapolate_and_interpolate(clean_crptax, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(clean_crptax, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("CRPTAX")
     imputed_crptax, _ = score_indicator(
         backward + interpolated, "CRPTAX",
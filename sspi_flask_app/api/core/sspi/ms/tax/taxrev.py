@@ -4,9 +4,7 @@ from flask_login import current_user, login_required
 
 from sspi_flask_app.api.core.sspi import compute_bp, impute_bp
 from sspi_flask_app.api.resources.utilities import (
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     impute_reference_class_average,
     parse_json,
     score_indicator,
@@ -44,9 +42,9 @@ def impute_taxrev():
     app.logger.info("Running /api/v1/impute/TAXREV")
     sspi_imputed_data.delete_many({"IndicatorCode": "TAXREV"})
     clean_taxrev = sspi_clean_api_data.find({"DatasetCode": "WB_TAXREV"})
-    forward = extrapolate_forward(clean_taxrev, 2023, series_id=["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(clean_taxrev, 2000, series_id=["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(clean_taxrev, series_id=["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(clean_taxrev, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(clean_taxrev, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(clean_taxrev, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     imputed_taxrev = forward + backward + interpolated
     # Handle VNM, NGA, VEN, DZA : each is missing all observations
     vnm_taxrev = impute_reference_class_average("VNM", 2000, 2023, "Dataset", "WB_TAXREV", clean_taxrev)
@@ -2,7 +2,7 @@ from flask import current_app as app
 from flask_login import login_required
 
 from sspi_flask_app.api.core.sspi import compute_bp, impute_bp
-from sspi_flask_app.api.resources.utilities import goalpost, parse_json, score_indicator, extrapolate_backward, extrapolate_forward, interpolate_linear
+from sspi_flask_app.api.resources.utilities import goalpost, parse_json, score_indicator, extrapolate_and_interpolate
 from sspi_flask_app.models.database import (
     sspi_clean_api_data,
     sspi_imputed_data,
@@ -34,9 +34,9 @@ def impute_colbar():
     app.logger.info("Running /api/v1/compute/COLBAR")
     sspi_imputed_data.delete_many({"IndicatorCode": "COLBAR"})
     clean_colbar = sspi_clean_api_data.find({"DatasetCode": "ILO_COLBAR"})
-    backward = extrapolate_backward(clean_colbar, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    forward = extrapolate_forward(clean_colbar, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(clean_colbar, ["CountryCode", "DatasetCode"], impute_only=True)
+    backward = extrapolate_and_interpolate(clean_colbar, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    forward = extrapolate_and_interpolate(clean_colbar, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(clean_colbar, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     ## Implement Country by Country Calue Imputations Here
     lg, ug = sspi_metadata.get_goalposts("COLBAR")
     imputed_colbar, _ = score_indicator(
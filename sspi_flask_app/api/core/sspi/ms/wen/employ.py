@@ -12,9 +12,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear
+    extrapolate_and_interpolate
 )
 
 
@@ -39,9 +37,9 @@ def impute_employ():
     app.logger.info("Running /api/v1/compute/EMPLOY")
     sspi_imputed_data.delete_many({"IndicatorCode": "EMPLOY"})
     clean_employ = sspi_clean_api_data.find({"DatasetCode": "ILO_EMPLOY_TO_POP"})
-    backward = extrapolate_backward(clean_employ, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    forward = extrapolate_forward(clean_employ, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(clean_employ, ["CountryCode", "DatasetCode"], impute_only=True)
+    backward = extrapolate_and_interpolate(clean_employ, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    forward = extrapolate_and_interpolate(clean_employ, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(clean_employ, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("EMPLOY")
     imputed_employ, _ = score_indicator(
         forward + backward + interpolated, "EMPLOY",
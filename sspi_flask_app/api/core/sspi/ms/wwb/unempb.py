@@ -12,9 +12,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     impute_reference_class_average
 )
 
@@ -40,9 +38,9 @@ def impute_unempb():
     app.logger.info("Running /api/v1/compute/UNEMPB")
     sspi_imputed_data.delete_many({"IndicatorCode": "UNEMPB"})
     clean_unempb = sspi_clean_api_data.find({"DatasetCode": "UNSDG_BENFTS_UNEMP"})
-    backward = extrapolate_backward(clean_unempb, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    forward = extrapolate_forward(clean_unempb, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(clean_unempb, ["CountryCode", "DatasetCode"], impute_only=True)
+    backward = extrapolate_and_interpolate(clean_unempb, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    forward = extrapolate_and_interpolate(clean_unempb, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(clean_unempb, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("UNEMPB")
     isl_imputed = impute_reference_class_average(
         "ISL", 2000, 2023, "Dataset", "UNSDG_BENFTS_UNEMP", clean_unempb
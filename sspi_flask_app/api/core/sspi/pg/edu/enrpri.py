@@ -4,10 +4,8 @@ from flask_login import current_user, login_required
 
 from sspi_flask_app.api.core.sspi import compute_bp, impute_bp
 from sspi_flask_app.api.resources.utilities import (
-    extrapolate_backward,
-    extrapolate_forward,
+    extrapolate_and_interpolate,
     impute_reference_class_average,
-    interpolate_linear,
     parse_json,
     score_indicator,
     goalpost)
@@ -43,9 +41,9 @@ def impute_enrpri():
     app.logger.info("Running /api/v1/impute/ENRPRI")
     sspi_imputed_data.delete_many({"IndicatorCode": "ENRPRI"})
     clean_enrpri = sspi_clean_api_data.find({"DatasetCode": "UIS_ENRPRI"})
-    forward = extrapolate_forward(clean_enrpri, 2023, series_id=["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(clean_enrpri, 2000, series_id=["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(clean_enrpri, series_id=["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(clean_enrpri, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(clean_enrpri, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(clean_enrpri, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     imputed_enrpri = forward + backward + interpolated
     # chn_enrpri = impute_reference_class_average("CHN", 2000, 2023, "Dataset", "UIS_ENRPRI", clean_enrpri)
     lg, ug = sspi_metadata.get_goalposts("ENRPRI")
@@ -11,9 +11,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_forward,
-    extrapolate_backward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     impute_reference_class_average)
 
 from sspi_flask_app.auth.decorators import admin_required
@@ -41,9 +39,9 @@ def impute_enrsec():
     app.logger.info("Running /api/v1/impute/ENRSEC")
     sspi_imputed_data.delete_many({"IndicatorCode": "ENRSEC"})
     clean_enrsec = sspi_clean_api_data.find({"DatasetCode": "UIS_ENRSEC"})
-    forward = extrapolate_forward(clean_enrsec, 2023, series_id=["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(clean_enrsec, 2000, series_id=["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(clean_enrsec, series_id=["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(clean_enrsec, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(clean_enrsec, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(clean_enrsec, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     chn_enrsec = impute_reference_class_average("CHN", 2000, 2023, "Dataset", "UIS_ENRSEC", clean_enrsec)
     nga_enrsec = impute_reference_class_average("NGA", 2000, 2023, "Dataset", "UIS_ENRSEC", clean_enrsec)
     imputed_enrsec = forward + backward + interpolated + chn_enrsec + nga_enrsec
@@ -5,9 +5,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_forward,
-    extrapolate_backward,
-    interpolate_linear)
+    extrapolate_and_interpolate)
 
 from sspi_flask_app.auth.decorators import admin_required
 from sspi_flask_app.models.database import (
@@ -38,9 +36,9 @@ def compute_puptch():
 def impute_puptch():
     sspi_imputed_data.delete_many({"IndicatorCode": "PUPTCH"})
     puptch_clean = sspi_clean_api_data.find({"DatasetCode": "WB_PUPTCH"})
-    forward = extrapolate_forward(puptch_clean, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(puptch_clean, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(puptch_clean, ["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(puptch_clean, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(puptch_clean, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(puptch_clean, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("PUPTCH")
     scored_list, _ = score_indicator(
         forward + backward + interpolated, "PUPTCH",
@@ -4,7 +4,7 @@ from flask_login import current_user, login_required
 
 from sspi_flask_app.api.core.sspi import compute_bp, impute_bp
 from sspi_flask_app.api.resources.utilities import (
-    extrapolate_backward,
+    extrapolate_and_interpolate,
     parse_json,
     score_indicator,
     goalpost)
@@ -39,7 +39,7 @@ def compute_yrsedu():
 def impute_yrsedu():
     sspi_imputed_data.delete_many({"IndicatorCode": "YRSEDU"})
     clean_data = sspi_clean_api_data.find({"DatasetCode": "UIS_YRSEDU"})
-    imputations = extrapolate_backward(clean_data, 2000, series_id=["CountryCode", "DatasetCode"], impute_only=True)
+    imputations = extrapolate_and_interpolate(clean_data, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("YRSEDU")
     scored_list, _ = score_indicator(
         imputations, "YRSEDU",
@@ -5,9 +5,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     impute_reference_class_average)
 
 from sspi_flask_app.auth.decorators import admin_required
@@ -42,9 +40,9 @@ def impute_armexp():
     app.logger.info("Running /api/v1/impute/ARMEXP")
     sspi_imputed_data.delete_many({"IndicatorCode": "ARMEXP"})
     clean_armexp = sspi_clean_api_data.find({"DatasetCode": "SIPRI_ARMEXP"})
-    forward = extrapolate_forward(clean_armexp, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(clean_armexp, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(clean_armexp, ["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(clean_armexp, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(clean_armexp, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(clean_armexp, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     impute_are = impute_reference_class_average(
         "ARE", 2000, 2023, "Dataset", "SIPRI_ARMEXP", clean_armexp
     )
@@ -5,9 +5,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     impute_dataset_value)
 
 from sspi_flask_app.auth.decorators import admin_required
@@ -38,9 +36,9 @@ def compute_milexp():
 def impute_milexp():
     sspi_imputed_data.delete_many({"IndicatorCode": "MILEXP"})
     clean_milexp = sspi_clean_api_data.find({"DatasetCode": "SIPRI_MILEXP"})
-    forward = extrapolate_forward(clean_milexp, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(clean_milexp, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(clean_milexp, ["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(clean_milexp, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(clean_milexp, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(clean_milexp, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("MILEXP")
     milexp_isl = impute_dataset_value("ISL", 2000, 2023, "SIPRI_MILEXP", 0, clean_milexp[0]["Unit"])
     imputed_milexp, _ = score_indicator(
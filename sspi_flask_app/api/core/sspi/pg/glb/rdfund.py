@@ -12,9 +12,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     impute_reference_class_average,
     filter_imputations
 )
@@ -49,16 +47,16 @@ def impute_rdfund():
         return (unsdg_edurdp_score + unsdg_nrsrch_score) / 2
     sspi_imputed_data.delete_many({"IndicatorCode": "RDFUND"})
     unsdg_rdpgdp = sspi_clean_api_data.find({"DatasetCode": "UNSDG_RDPGDP"})
-    rdpgdp_forward = extrapolate_forward(unsdg_rdpgdp, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    rdpgdp_backward = extrapolate_backward(unsdg_rdpgdp, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    rdpgdp_interpolated = interpolate_linear(unsdg_rdpgdp, ["CountryCode", "DatasetCode"], impute_only=True)
+    rdpgdp_forward = extrapolate_and_interpolate(unsdg_rdpgdp, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    rdpgdp_backward = extrapolate_and_interpolate(unsdg_rdpgdp, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    rdpgdp_interpolated = extrapolate_and_interpolate(unsdg_rdpgdp, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     rdpgdp_ref_average_bgd = impute_reference_class_average(
         "BGD", 2000, 2023, "Dataset", "UNSDG_RDPGDP", unsdg_rdpgdp
     )
     unsdg_nrsrch = sspi_clean_api_data.find({"DatasetCode": "UNSDG_NRSRCH"})
-    nrsrch_forward = extrapolate_forward(unsdg_nrsrch, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    nrsrch_backward = extrapolate_backward(unsdg_nrsrch, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    nrsrch_interpolated = interpolate_linear(unsdg_nrsrch, ["CountryCode", "DatasetCode"], impute_only=True)
+    nrsrch_forward = extrapolate_and_interpolate(unsdg_nrsrch, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    nrsrch_backward = extrapolate_and_interpolate(unsdg_nrsrch, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    nrsrch_interpolated = extrapolate_and_interpolate(unsdg_nrsrch, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     nrsrch_ref_average_per = impute_reference_class_average(
         "PER", 2000, 2023, "Dataset", "UNSDG_NRSRCH", unsdg_nrsrch
     )
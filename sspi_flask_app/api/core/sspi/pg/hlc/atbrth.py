@@ -11,9 +11,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_forward,
-    extrapolate_backward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     impute_reference_class_average)
 
 from sspi_flask_app.auth.decorators import admin_required
@@ -40,14 +38,14 @@ def compute_atbrth():
 def impute_atbrth():
     sspi_imputed_data.delete_many({"IndicatorCode": "ATBRTH"})
     atbrth_clean = sspi_clean_api_data.find({"DatasetCode": "WHO_ATBRTH"})
-    forward = extrapolate_forward(atbrth_clean, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(atbrth_clean, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(atbrth_clean, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(atbrth_clean, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
     atbrth_che = impute_reference_class_average("CHE", 2000, 2023, "Dataset", "WHO_ATBRTH", atbrth_clean)
     atbrth_gbr = impute_reference_class_average("GBR", 2000, 2023, "Dataset", "WHO_ATBRTH", atbrth_clean)
     atbrth_nld = impute_reference_class_average("NLD", 2000, 2023, "Dataset", "WHO_ATBRTH", atbrth_clean)
     atbrth_bel = impute_reference_class_average("BEL", 2000, 2023, "Dataset", "WHO_ATBRTH", atbrth_clean)
     atbrth_swe = impute_reference_class_average("SWE", 2000, 2023, "Dataset", "WHO_ATBRTH", atbrth_clean)
-    interpolated = interpolate_linear(atbrth_clean, ["CountryCode", "DatasetCode"], impute_only=True)
+    interpolated = extrapolate_and_interpolate(atbrth_clean, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("ATBRTH")
     scored_list, _ = score_indicator(
         forward + backward + interpolated + atbrth_che + atbrth_gbr + atbrth_nld + atbrth_bel + atbrth_swe, 
@@ -11,9 +11,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     regression_imputation)
 
 from sspi_flask_app.auth.decorators import admin_required
@@ -50,9 +48,9 @@ def impute_cstunt():
     sspi_imputed_data.delete_many({"IndicatorCode": "CSTUNT"})
     clean_cstunt = sspi_indicator_data.find({"IndicatorCode": "CSTUNT"})
     cstunt_dataset = sspi_clean_api_data.find({"DatasetCode": "UNSDG_CSTUNT"})
-    forward = extrapolate_forward(cstunt_dataset, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(cstunt_dataset, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(cstunt_dataset, ["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(cstunt_dataset, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(cstunt_dataset, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(cstunt_dataset, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("CSTUNT")
     imputed_cstunt, _ = score_indicator(
         forward + backward + interpolated, "CSTUNT",
@@ -11,9 +11,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_forward,
-    extrapolate_backward,
-    interpolate_linear)
+    extrapolate_and_interpolate)
 
 from sspi_flask_app.auth.decorators import admin_required
 
@@ -37,9 +35,9 @@ def compute_physpc():
 def impute_physpc():
     sspi_imputed_data.delete_many({"IndicatorCode": "PHYSPC"})
     physpc_clean = sspi_clean_api_data.find({"DatasetCode": "WHO_PHYSPC"})
-    forward = extrapolate_forward(physpc_clean, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(physpc_clean, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(physpc_clean, ["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(physpc_clean, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(physpc_clean, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(physpc_clean, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("PHYSPC")
     imputed_list, _ = score_indicator(
         forward + backward + interpolated, "PHYSPC", 
@@ -10,8 +10,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_backward,
-    extrapolate_forward
+    extrapolate_and_interpolate
 )
 from flask_login import login_required, current_user
 from sspi_flask_app.auth.decorators import admin_required
@@ -39,8 +38,8 @@ def impute_sansrv():
     app.logger.info("Running /api/v1/impute/SANSRV")
     sspi_imputed_data.delete_many({"IndicatorCode": "SANSRV"})
     sansrv_clean = sspi_clean_api_data.find({"DatasetCode": "WB_SANSRV"})
-    forward_imputations = extrapolate_forward(sansrv_clean, 2023, series_id=["CountryCode", "DatasetCode"], impute_only=True)
-    backward_imputations = extrapolate_backward(sansrv_clean, 2000, series_id=["CountryCode", "DatasetCode"], impute_only=True)
+    forward_imputations = extrapolate_and_interpolate(sansrv_clean, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward_imputations = extrapolate_and_interpolate(sansrv_clean, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("SANSRV")
     scored_list, _ = score_indicator(
         forward_imputations + backward_imputations, "SANSRV",
@@ -11,7 +11,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_forward)
+    extrapolate_and_interpolate)
 
 from sspi_flask_app.auth.decorators import admin_required
 
@@ -44,8 +44,8 @@ def compute_edemoc():
 def impute_edemoc():
     sspi_imputed_data.delete_many({"IndicatorCode": "EDEMOC"})
     edemoc_clean = sspi_clean_api_data.find({"DatasetCode": "VDEM_EDEMOC"})
-    edemoc_clean = extrapolate_forward(
-        edemoc_clean, 2023, series_id=["CountryCode", "DatasetCode"], impute_only=True
+    edemoc_clean = extrapolate_and_interpolate(
+        edemoc_clean, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True
     )
     lg, ug = sspi_metadata.get_goalposts("EDEMOC")
     scored_list, _ = score_indicator(
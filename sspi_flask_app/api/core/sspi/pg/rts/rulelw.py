@@ -11,7 +11,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_forward)
+    extrapolate_and_interpolate)
 
 from sspi_flask_app.auth.decorators import admin_required
 
@@ -36,8 +36,8 @@ def compute_rulelw():
 def impute_rulelw():
     sspi_imputed_data.delete_many({"IndicatorCode": "RULELW"})
     rulelw_clean = sspi_clean_api_data.find({"DatasetCode": "VDEM_RULELW"})
-    rulelw_clean = extrapolate_forward(
-        rulelw_clean, 2023, series_id=["CountryCode", "DatasetCode"], impute_only=True
+    rulelw_clean = extrapolate_and_interpolate(
+        rulelw_clean, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True
     )
     lg, ug = sspi_metadata.get_goalposts("RULELW")
     scored_list, _ = score_indicator(
@@ -12,9 +12,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    interpolate_linear,
-    extrapolate_backward,
-    extrapolate_forward)
+    extrapolate_and_interpolate)
 
 from sspi_flask_app.auth.decorators import admin_required
 
@@ -39,9 +37,9 @@ def compute_murder():
 def impute_murder():
     sspi_imputed_data.delete_many({"IndicatorCode": "MURDER"})
     murder_clean = sspi_clean_api_data.find({"DatasetCode": "WB_MURDER"})
-    interpolate = interpolate_linear(murder_clean, series_id=["CountryCode", "DatasetCode"], impute_only=True)
-    forward = extrapolate_forward(murder_clean, 2023, series_id=["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(murder_clean, 2000, series_id=["CountryCode", "DatasetCode"], impute_only=True)
+    interpolate = extrapolate_and_interpolate(murder_clean, series_id=["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(murder_clean, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(murder_clean, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
     lg, ug = sspi_metadata.get_goalposts("MURDER")
     imputed_list, _ = score_indicator(
         interpolate + forward + backward, "MURDER",
@@ -7,9 +7,7 @@ from sspi_flask_app.api.resources.utilities import (
     goalpost,
     parse_json,
     score_indicator,
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     impute_reference_class_average)
 
 from sspi_flask_app.auth.decorators import admin_required
@@ -44,9 +42,9 @@ def impute_prison():
     app.logger.info("Running /api/v1/impute/PRISON")
     sspi_imputed_data.delete_many({"IndicatorCode": "PRISON"})
     unodc_pripop = sspi_clean_api_data.find({"DatasetCode": "UNODC_PRIPOP"})
-    forward = extrapolate_forward(unodc_pripop, 2023, ["CountryCode", "DatasetCode"], impute_only=True)
-    backward = extrapolate_backward(unodc_pripop, 2000, ["CountryCode", "DatasetCode"], impute_only=True)
-    interpolated = interpolate_linear(unodc_pripop, ["CountryCode", "DatasetCode"], impute_only=True)
+    forward = extrapolate_and_interpolate(unodc_pripop, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    backward = extrapolate_and_interpolate(unodc_pripop, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True)
+    interpolated = extrapolate_and_interpolate(unodc_pripop, series_id=["CountryCode", "DatasetCode"], impute_only=True)
     prison_chn = impute_reference_class_average(
         "CHN", 2000, 2023, "Dataset", "UNODC_PRIPOP", unodc_pripop
     )
@@ -13,9 +13,7 @@ from sspi_flask_app.models.database import (
 )
 from sspi_flask_app.auth.decorators import admin_required
 from sspi_flask_app.api.resources.utilities import (
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     slice_dataset,
     filter_imputations,
     impute_reference_class_average
@@ -68,14 +66,8 @@ def impute_biodiv():
         reference_class_averages.extend(
             impute_reference_class_average(country, 2000, 2023, "Dataset", "UNSDG_MARINE", unsdg_marine)
         )
-    imputed_marine = extrapolate_backward(
-        unsdg_marine, 2000, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_marine = extrapolate_forward(
-        imputed_marine, 2023, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_marine = interpolate_linear(
-        imputed_marine, series_id=["CountryCode", "DatasetCode"]
+    imputed_marine = extrapolate_and_interpolate(
+        unsdg_marine, 2000, 2023, series_id=["CountryCode", "DatasetCode"]
     )
     # Extract and impute UNSDG_TERRST data  
     unsdg_terrst = sspi_clean_api_data.find(
@@ -86,14 +78,8 @@ def impute_biodiv():
         reference_class_averages.extend(
             impute_reference_class_average(country, 2000, 2023, "Dataset", "UNSDG_TERRST", unsdg_terrst)
         )
-    imputed_terrst = extrapolate_backward(
-        unsdg_terrst, 2000, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_terrst = extrapolate_forward(
-        imputed_terrst, 2023, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_terrst = interpolate_linear(
-        imputed_terrst, series_id=["CountryCode", "DatasetCode"]
+    imputed_terrst = extrapolate_and_interpolate(
+        unsdg_terrst, 2000, 2023, series_id=["CountryCode", "DatasetCode"]
     )
     # Extract and impute UNSDG_FRSHWT data
     unsdg_frshwt = sspi_clean_api_data.find(
@@ -104,14 +90,8 @@ def impute_biodiv():
         reference_class_averages.extend(
             impute_reference_class_average(country, 2000, 2023, "Dataset", "UNSDG_FRSHWT", unsdg_frshwt)
         )
-    imputed_frshwt = extrapolate_backward(
-        unsdg_frshwt, 2000, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_frshwt = extrapolate_forward(
-        imputed_frshwt, 2023, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_frshwt = interpolate_linear(
-        imputed_frshwt, series_id=["CountryCode", "DatasetCode"]
+    imputed_frshwt = extrapolate_and_interpolate(
+        unsdg_frshwt, 2000, 2023, series_id=["CountryCode", "DatasetCode"]
     )
     overall_biodiv, missing_imputations = score_indicator(
         imputed_terrst + imputed_marine + imputed_frshwt + reference_class_averages, "BIODIV",
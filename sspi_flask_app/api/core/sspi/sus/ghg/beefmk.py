@@ -13,8 +13,7 @@ from sspi_flask_app.api.resources.utilities import (
     goalpost,
     parse_json,
     score_indicator,
-    extrapolate_forward,
-    extrapolate_backward,
+    extrapolate_and_interpolate,
     impute_reference_class_average
 )
 
@@ -79,11 +78,11 @@ def impute_beefmk():
     clean_list = sspi_indicator_data.find(mongo_query)
     
     # Extrapolate indicator scores backward to 2000 and forward to 2023
-    imputed_backward = extrapolate_backward(
-        clean_list, 2000, series_id=["CountryCode", "IndicatorCode"], impute_only=True
+    imputed_backward = extrapolate_and_interpolate(
+        clean_list, 2000, None, series_id=["CountryCode", "IndicatorCode"], interpolate=False, impute_only=True
     )
-    imputed_forward = extrapolate_forward(
-        clean_list, 2023, series_id=["CountryCode", "IndicatorCode"], impute_only=True
+    imputed_forward = extrapolate_and_interpolate(
+        clean_list, None, 2023, series_id=["CountryCode", "IndicatorCode"], interpolate=False, impute_only=True
     )
     imputed_beefmk = imputed_backward + imputed_forward
     
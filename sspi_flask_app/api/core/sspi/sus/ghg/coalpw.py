@@ -13,9 +13,7 @@ from sspi_flask_app.api.resources.utilities import (
     goalpost,
     parse_json,
     score_indicator,
-    extrapolate_forward,
-    extrapolate_backward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     impute_reference_class_average
 )
 import pandas as pd
@@ -106,16 +104,16 @@ def impute_coalpw():
         
         # Extrapolate and interpolate existing data to fill temporal gaps
         if dataset_data:
-            extrapolated_backward = extrapolate_backward(
-                dataset_data, 2000, series_id=["CountryCode", "DatasetCode"], impute_only=True
+            extrapolated_backward = extrapolate_and_interpolate(
+                dataset_data, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True
             )
-            extrapolated_forward = extrapolate_forward(
-                dataset_data, 2023, series_id=["CountryCode", "DatasetCode"], impute_only=True
+            extrapolated_forward = extrapolate_and_interpolate(
+                dataset_data, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True
             )
             
             # Combine for interpolation
             all_data = dataset_data + extrapolated_backward + extrapolated_forward
-            interpolated = interpolate_linear(
+            interpolated = extrapolate_and_interpolate(
                 all_data, series_id=["CountryCode", "DatasetCode"], impute_only=True
             )
             
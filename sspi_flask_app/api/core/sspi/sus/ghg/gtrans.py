@@ -14,7 +14,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     slice_dataset,
-    extrapolate_forward,
+    extrapolate_and_interpolate,
     filter_imputations
 )
 
@@ -50,8 +50,8 @@ def impute_gtrans():
         slice_dataset(incomplete_list, "WB_POPULN")
     clean_iea_tco2em = slice_dataset(clean_list, "IEA_TCO2EM") + \
         slice_dataset(incomplete_list, "IEA_TCO2EM")
-    imputed_iea_tco2em = extrapolate_forward(
-        clean_iea_tco2em, 2023, series_id=["CountryCode", "DatasetCode"]
+    imputed_iea_tco2em = extrapolate_and_interpolate(
+        clean_iea_tco2em, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False
     )
     lg, ug = sspi_metadata.get_goalposts("GTRANS")
     overall_gtrans, missing_imputations = score_indicator(
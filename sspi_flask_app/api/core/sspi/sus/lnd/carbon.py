@@ -13,7 +13,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     goalpost,
     score_indicator,
-    extrapolate_forward,
+    extrapolate_and_interpolate,
     impute_reference_class_average
 )
 
@@ -13,7 +13,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     goalpost,
     score_indicator,
-    extrapolate_forward,
+    extrapolate_and_interpolate,
     slice_dataset,
     filter_imputations,
     impute_reference_class_average
@@ -66,8 +66,8 @@ def impute_defrst():
     clean_list = sspi_indicator_data.find(mongo_query)
     
     # Extrapolate indicator scores forward to 2023
-    imputed_defrst = extrapolate_forward(
-        clean_list, 2023, series_id=["CountryCode", "IndicatorCode"], impute_only=True
+    imputed_defrst = extrapolate_and_interpolate(
+        clean_list, None, 2023, series_id=["CountryCode", "IndicatorCode"], interpolate=False, impute_only=True
     )
     
     # Handle countries with no data using reference class average
@@ -15,9 +15,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_backward,
-    extrapolate_forward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     slice_dataset,
     filter_imputations,
     impute_reference_class_average
@@ -64,14 +62,8 @@ def impute_watman():
         """
         
         # Extrapolate WUSEFF backward to 2000-2005 for baseline  
-        extended_wuseff = extrapolate_backward(
-            wuseff_data, 2000, series_id=["CountryCode", "DatasetCode"]
-        )
-        extended_wuseff = extrapolate_forward(
-            extended_wuseff, 2023, series_id=["CountryCode", "DatasetCode"]
-        )
-        extended_wuseff = interpolate_linear(
-            extended_wuseff, series_id=["CountryCode", "DatasetCode"]
+        extended_wuseff = extrapolate_and_interpolate(
+            wuseff_data, 2000, 2023, series_id=["CountryCode", "DatasetCode"]
         )
         
         # Group by country and compute 2000-2005 baseline average
@@ -148,11 +140,9 @@ def impute_watman():
     # Extract existing CWUEFF data and extrapolate 
     clean_cwueff = slice_dataset(clean_list, "UNSDG_CWUEFF") + \
         slice_dataset(incomplete_list, "UNSDG_CWUEFF")
-    imputed_cwueff = extrapolate_backward(
-        clean_cwueff, 2000, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_cwueff = extrapolate_forward(
-        imputed_cwueff, 2023, series_id=["CountryCode", "DatasetCode"]
+    imputed_cwueff = extrapolate_and_interpolate(
+        clean_cwueff, 2000, 2023, series_id=["CountryCode", "DatasetCode"],
+        interpolate=False,
     )
     
     # Get WUSEFF data to create synthetic CWUEFF for missing countries
@@ -180,11 +170,9 @@ def impute_watman():
     # Extract and impute WTSTRS data
     clean_wtstrs = slice_dataset(clean_list, "UNSDG_WTSTRS") + \
         slice_dataset(incomplete_list, "UNSDG_WTSTRS")
-    imputed_wtstrs = extrapolate_backward(
-        clean_wtstrs, 2000, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_wtstrs = extrapolate_forward(
-        imputed_wtstrs, 2023, series_id=["CountryCode", "DatasetCode"]
+    imputed_wtstrs = extrapolate_and_interpolate(
+        clean_wtstrs, 2000, 2023, series_id=["CountryCode", "DatasetCode"],
+        interpolate=False,
     )
     
     # Combine all CWUEFF sources
@@ -3,9 +3,7 @@ from flask_login import login_required
 
 from sspi_flask_app.api.core.sspi import compute_bp, impute_bp
 from sspi_flask_app.api.resources.utilities import (
-    extrapolate_forward,
-    extrapolate_backward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     goalpost,
     parse_json,
     score_indicator,
@@ -122,16 +120,16 @@ def impute_altnrg():
         
         # Extrapolate and interpolate existing data to fill temporal gaps
         if dataset_data:
-            extrapolated_backward = extrapolate_backward(
-                dataset_data, 2000, series_id=["CountryCode", "DatasetCode"], impute_only=True
+            extrapolated_backward = extrapolate_and_interpolate(
+                dataset_data, 2000, None, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True
             )
-            extrapolated_forward = extrapolate_forward(
-                dataset_data, 2023, series_id=["CountryCode", "DatasetCode"], impute_only=True
+            extrapolated_forward = extrapolate_and_interpolate(
+                dataset_data, None, 2023, series_id=["CountryCode", "DatasetCode"], interpolate=False, impute_only=True
             )
             
             # Combine for interpolation
             all_data = dataset_data + extrapolated_backward + extrapolated_forward
-            interpolated = interpolate_linear(
+            interpolated = extrapolate_and_interpolate(
                 all_data, series_id=["CountryCode", "DatasetCode"], impute_only=True
             )
             
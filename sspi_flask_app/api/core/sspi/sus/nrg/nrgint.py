@@ -3,7 +3,7 @@ from flask_login import login_required
 
 from sspi_flask_app.api.core.sspi import compute_bp, impute_bp
 from sspi_flask_app.api.resources.utilities import (
-    extrapolate_forward,
+    extrapolate_and_interpolate,
     parse_json,
     score_indicator,
     goalpost)
@@ -39,6 +39,6 @@ def compute_nrgint():
 def impute_nrgint():
     sspi_imputed_data.delete_many({"IndicatorCode": "NRGINT"})
     clean_data = sspi_indicator_data.find({"IndicatorCode": "NRGINT"})
-    imputations = extrapolate_forward(clean_data, 2023, impute_only=True)
+    imputations = extrapolate_and_interpolate(clean_data, None, 2023, interpolate=False, impute_only=True)
     sspi_imputed_data.insert_many(imputations)
     return parse_json(imputations)
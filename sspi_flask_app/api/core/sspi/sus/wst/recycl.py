@@ -12,8 +12,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_forward,
-    extrapolate_backward,
+    extrapolate_and_interpolate,
     impute_reference_class_average
 )
 
@@ -47,11 +46,11 @@ def impute_recycl():
     clean_list = sspi_indicator_data.find(mongo_query)
     
     # Extrapolate indicator scores backward to 2000 and forward to 2023
-    imputed_backward = extrapolate_backward(
-        clean_list, 2000, series_id=["CountryCode", "IndicatorCode"], impute_only=True
+    imputed_backward = extrapolate_and_interpolate(
+        clean_list, 2000, None, series_id=["CountryCode", "IndicatorCode"], interpolate=False, impute_only=True
     )
-    imputed_forward = extrapolate_forward(
-        clean_list, 2023, series_id=["CountryCode", "IndicatorCode"], impute_only=True
+    imputed_forward = extrapolate_and_interpolate(
+        clean_list, None, 2023, series_id=["CountryCode", "IndicatorCode"], interpolate=False, impute_only=True
     )
     imputed_recycl = imputed_backward + imputed_forward
     
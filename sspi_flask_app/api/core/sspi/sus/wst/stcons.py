@@ -6,9 +6,7 @@ from sspi_flask_app.api.resources.utilities import (
     parse_json,
     score_indicator,
     goalpost,
-    extrapolate_forward,
-    extrapolate_backward,
-    interpolate_linear,
+    extrapolate_and_interpolate,
     impute_reference_class_average,
     filter_imputations)
 
@@ -63,14 +61,8 @@ def impute_stcons():
         reference_class_averages.extend(
             impute_reference_class_average(country, 2000, 2023, "Dataset", "WID_CARBON_TOT_P0P100", wid_p0p100)
         )
-    imputed_p0p100 = extrapolate_backward(
-        wid_p0p100, 2000, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_p0p100 = extrapolate_forward(
-        imputed_p0p100, 2023, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_p0p100 = interpolate_linear(
-        imputed_p0p100, series_id=["CountryCode", "DatasetCode"]
+    imputed_p0p100 = extrapolate_and_interpolate(
+        wid_p0p100, 2000, 2023, series_id=["CountryCode", "DatasetCode"]
     )
 
     # Extract and impute WID_CARBON_TOT_P90P100 data
@@ -80,14 +72,8 @@ def impute_stcons():
         reference_class_averages.extend(
             impute_reference_class_average(country, 2000, 2023, "Dataset", "WID_CARBON_TOT_P90P100", wid_p90p100)
         )
-    imputed_p90p100 = extrapolate_backward(
-        wid_p90p100, 2000, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_p90p100 = extrapolate_forward(
-        imputed_p90p100, 2023, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_p90p100 = interpolate_linear(
-        imputed_p90p100, series_id=["CountryCode", "DatasetCode"]
+    imputed_p90p100 = extrapolate_and_interpolate(
+        wid_p90p100, 2000, 2023, series_id=["CountryCode", "DatasetCode"]
     )
 
     # Extract and impute FPI_ECOFPT_PER_CAP data
@@ -97,14 +83,8 @@ def impute_stcons():
         reference_class_averages.extend(
             impute_reference_class_average(country, 2000, 2023, "Dataset", "FPI_ECOFPT_PER_CAP", fpi_ecofpt)
         )
-    imputed_fpi = extrapolate_backward(
-        fpi_ecofpt, 2000, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_fpi = extrapolate_forward(
-        imputed_fpi, 2023, series_id=["CountryCode", "DatasetCode"]
-    )
-    imputed_fpi = interpolate_linear(
-        imputed_fpi, series_id=["CountryCode", "DatasetCode"]
+    imputed_fpi = extrapolate_and_interpolate(
+        fpi_ecofpt, 2000, 2023, series_id=["CountryCode", "DatasetCode"]
     )
 
     # Combine all imputed datasets and score the indicator
@@ -1,13 +1,26 @@
 import requests
-import time
 import pycountry
 from bs4 import BeautifulSoup
+from ..resources.fetch_engine import fetch_engine
 from ..resources.utilities import string_to_float
 from sspi_flask_app.models.database import sspi_raw_api_data
 import urllib3
 import ssl
 
-def collect_oecd_indicator(oecd_indicator_code, **kwargs):
+class CustomHttpAdapter(requests.adapters.HTTPAdapter):
+    # "Transport adapter" that allows us to use custom ssl_context.
+
+    def __init__(self, ssl_context=None, **kwargs):
+        self.ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False):
+        self.poolmanager = urllib3.poolmanager.PoolManager(
+            num_pools=connections, maxsize=maxsize,
+            block=block, ssl_context=self.ssl_context)
+
+
+def get_legacy_session():
     """
     The CustomHTTPAdapter class and the legacy session are necessary to connect to the OECD SDMX API
     because OECD does not support RFC 5746 secure renegotiation, which is the default for OpenSSL 3
@@ -15,35 +28,28 @@ def collect_oecd_indicator(oecd_indicator_code, **kwargs):
     See Harry Mallon's answer and ahmkara's elaboration on StackOverflow:
     https://stackoverflow.com/questions/71603314/ssl-error-unsafe-legacy-renegotiation-disabled/71646353#71646353
     """
-    class CustomHttpAdapter(requests.adapters.HTTPAdapter):
-        # "Transport adapter" that allows us to use custom ssl_context.
+    ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
+    ctx.options |= 0x4  # OP_LEGACY_SERVER_CONNECT
+    session = requests.session()
+    session.mount('https://', CustomHttpAdapter(ctx))
+    return session
 
-        def __init__(self, ssl_context=None, **kwargs):
-            self.ssl_context = ssl_context
-            super().__init__(**kwargs)
 
-        def init_poolmanager(self, connections, maxsize, block=False):
-            self.poolmanager = urllib3.poolmanager.PoolManager(
-                num_pools=connections, maxsize=maxsize,
-                block=block, ssl_context=self.ssl_context)
+# Built once and pooled by the fetch engine rather than once per request
+fetch_engine.register_session("stats.oecd.org", get_legacy_session())
 
-    def get_legacy_session():
-        ctx = ssl.create_default_context(ssl.Purpose.SERVER_AUTH)
-        ctx.options |= 0x4  # OP_LEGACY_SERVER_CONNECT
-        session = requests.session()
-        session.mount('https://', CustomHttpAdapter(ctx))
-        return session
 
+def collect_oecd_indicator(oecd_indicator_code, **kwargs):
     sdmx_url_oecd_metadata = f"https://stats.oecd.org/RestSDMX/sdmx.ashx/GetKeyFamily/{
         oecd_indicator_code}"
     sdmx_url_oecd = f"https://stats.oecd.org/restsdmx/sdmx.ashx/GetData/{
         oecd_indicator_code}"
     yield "Sending Metadata Request to OECD SDMX API\n"
-    metadata_obj = get_legacy_session().get(sdmx_url_oecd_metadata)
+    metadata_obj = fetch_engine.get(sdmx_url_oecd_metadata, "OECD")
     metadata = str(metadata_obj.content)
     yield "Metadata Received from OECD SDMX API.  Sending Data Request to OECD SDMX API\n"
     yield "Sending Data Request to OECD SDMX API\n"
-    response_obj = get_legacy_session().get(sdmx_url_oecd)
+    response_obj = fetch_engine.get(sdmx_url_oecd, "OECD")
     observation = str(response_obj.content)
     yield "Data Received from OECD SDMX API.  Storing Data in SSPI Raw Data\n"
     source_info = {
@@ -176,14 +182,14 @@ def collect_oecd_sdmx_data(oecd_series_code, query_parameters="", metadata_url="
     metadata = None
     if metadata_url:
         yield f"Sending Metadata Request to OECD SDMX API ({metadata_url})\n"
-        meta_res = requests.get(metadata_url)
+        meta_res = fetch_engine.get(metadata_url, "OECD")
         metadata = str(meta_res.content)
     yield "Sending Data Request to OECD SDMX API\n"
     base_url = "https://sdmx.oecd.org/public/rest/data/"
     if not query_parameters:
         query_parameters = "startPeriod=1990&dimensionAtObservation=AllDimensions"
     url = f"{base_url}{oecd_series_code}?{query_parameters}"
-    res = requests.get(url)
+    res = fetch_engine.get(url, "OECD")
     raw_data = str(res.content)
     source_info = {
         "OrganizationName": "Organisation for Economic Development and Coorperation",
@@ -212,7 +218,7 @@ def collect_oecd_sdmx_data_foraid(oecd_series_code, filter_parameters="....", qu
         yield f"Processing group of countries: {g}\n"
     if metadata_url:
         yield f"Sending Metadata Request to OECD SDMX API ({metadata_url})\n"
-        meta_res = requests.get(metadata_url)
+        meta_res = fetch_engine.get(metadata_url, "OECD")
         metadata = str(meta_res.content)
     for cou_g in country_groups:
         yield f"Sending Data Request to OECD SDMX API for {cou_g}\n"
@@ -223,7 +229,7 @@ def collect_oecd_sdmx_data_foraid(oecd_series_code, filter_parameters="....", qu
             query_parameters = "startPeriod=1990&dimensionAtObservation=AllDimensions"
         url = f"{base_url}{
             oecd_series_code}/{cou_filter_parameters}?{query_parameters}"
-        res = requests.get(url)
+        res = fetch_engine.get(url, "OECD")
         source_info = {
             "OrganizationName": "Organisation for Economic Development and Coorperation",
             "OrganizationCode": "OECD",
@@ -240,7 +246,6 @@ def collect_oecd_sdmx_data_foraid(oecd_series_code, filter_parameters="....", qu
         sspi_raw_api_data.raw_insert_one(
             raw_data, source_info, Metadata=metadata, **kwargs
         )
-        time.sleep(15)
     yield f"Data collection complete for OECD series {oecd_series_code}\n"
 
 
@@ -4,8 +4,8 @@ from sspi_flask_app.api.resources.utilities import (
     format_m49_as_string,
     string_to_float,
 )
+from sspi_flask_app.api.resources.fetch_engine import fetch_engine
 import json
-import time
 import requests
 import math
 
@@ -18,13 +18,13 @@ def collect_sdg_indicator_data(sdg_indicator_code: str, **kwargs):
     url_source = "https://unstats.un.org/SDGAPI/v1/sdg/Indicator/PivotData?"
     sdg_series_url = url_source + url_params # This URL identifies RawDocumentSets for SDG
     sdg_series_url_w_options = sdg_series_url + url_options
-    response = requests.get(sdg_series_url_w_options)
+    response = fetch_engine.get(sdg_series_url_w_options, "UNSDG")
     nPages = response.json().get('totalPages')
     yield f"Iterating through {nPages} pages of source data for SDG {sdg_indicator_code}\n"
-    for p in range(1, nPages + 1):
-        new_url = f"{sdg_series_url_w_options}&page={p}"
+    page_urls = [f"{sdg_series_url_w_options}&page={p}" for p in range(1, nPages + 1)]
+    responses = fetch_engine.fetch_pages(page_urls, "UNSDG")
+    for p, (new_url, response) in enumerate(zip(page_urls, responses), start=1):
         yield "Fetching data for page {0} of {1}\n".format(p, nPages)
-        response = requests.get(new_url)
         data_list = response.json().get('data')
         source_info = {
             "OrganizationName": "United Nations Sustainable Development Goals",
@@ -34,11 +34,11 @@ def collect_sdg_indicator_data(sdg_indicator_code: str, **kwargs):
             "BaseURL": sdg_series_url,
             "URL": new_url
         }
-        count = sspi_raw_api_data.raw_insert_many(
+        chunks = sspi_raw_api_data.raw_insert_many_chunks(
             data_list, source_info, **kwargs
         )
-        yield f"Inserted {count} new observations into SSPI Raw Data\n"
-        time.sleep(1)
+        for count in chunks:
+            yield f"Inserted {count} new observations into SSPI Raw Data\n"
     yield f"Collection complete for SDG {sdg_indicator_code}\n"
 
 
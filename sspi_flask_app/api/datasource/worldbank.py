@@ -1,7 +1,7 @@
 from sspi_flask_app.models.database import sspi_raw_api_data
-import requests
-import time
+from itertools import chain
 from pycountry import countries
+from ..resources.fetch_engine import fetch_engine
 from ..resources.utilities import string_to_float
 
 
@@ -9,12 +9,13 @@ def collect_wb_data(world_bank_indicator_code, **kwargs):
     yield f"Collecting data for World Bank Indicator {world_bank_indicator_code}\n"
     base_url = f"https://api.worldbank.org/v2/country/all/indicator/{world_bank_indicator_code}"
     url_w_options = base_url + "?per_page=1000&format=json"
-    response = requests.get(url_w_options).json()
+    first_url = f"{url_w_options}&page=1"
+    response = fetch_engine.get(first_url, "WB").json()
     total_pages = response[0]['pages']
-    for p in range(1, total_pages+1):
-        new_url = f"{url_w_options}&page={p}"
+    page_urls = [f"{url_w_options}&page={p}" for p in range(2, total_pages + 1)]
+    pages = chain([response], (r.json() for r in fetch_engine.fetch_pages(page_urls, "WB")))
+    for p, (new_url, response) in enumerate(zip([first_url] + page_urls, pages), start=1):
         yield f"Sending Request for page {p} of {total_pages}\n"
-        response = requests.get(new_url).json()
         document_list = response[1]
         source_info = {
             "OrganizationName": "World Bank",
@@ -24,9 +25,9 @@ def collect_wb_data(world_bank_indicator_code, **kwargs):
             "URL": new_url,
             "BaseURL": base_url
         }
-        count = sspi_raw_api_data.raw_insert_many(document_list, source_info, **kwargs)
-        yield f"Inserted {count} new observations into sspi_raw_api_data\n"
-        time.sleep(0.5)
+        chunks = sspi_raw_api_data.raw_insert_many_chunks(document_list, source_info, **kwargs)
+        for count in chunks:
+            yield f"Inserted {count} new observations into sspi_raw_api_data\n"
     yield f"Collection complete for World Bank Indicator {world_bank_indicator_code}"
 
 
@@ -0,0 +1,189 @@
+"""
+Dependency-aware incremental build of the pipeline DAG.
+
+Nodes are pipeline steps (raw:<DatasetCode>, clean:<DatasetCode>,
+indicator:<IndicatorCode>, finalize:score), each with the nodes it depends
+on and a callable producing the digest of its inputs. run_build executes the
+graph in topological order on a bounded worker pool:
+
+- a node runs once all of its dependencies have finished
+- a node whose input digest matches the one recorded at its last build is
+  skipped as fresh, so an unchanged upstream stops the cascade
+- a node whose dependency failed is blocked rather than run
+
+Progress lines from all nodes are merged into one stream, followed by a
+per-node timing table.
+"""
+
+import hashlib
+import json
+import logging
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator
+
+from sspi_flask_app.api.resources.dataset_scheduler import prefix_line
+
+log = logging.getLogger(__name__)
+
+MAX_BUILD_WORKERS = 4
+
+
+@dataclass
+class BuildNode:
+    node_id: str
+    dependencies: list[str]
+    run: Callable[[], Iterable[str] | None]
+    # Digest of the node's inputs; None means unknown and always counts as stale
+    input_digest: Callable[[], str | None]
+    # Run even when the input digest is unchanged (e.g. a requested refresh)
+    always_run: bool = False
+    # External nodes (raw collection) fetch from outside APIs: they run only
+    # when their data is missing (digest None) or always_run is set, never
+    # because of a digest mismatch or force
+    external: bool = False
+
+
+def is_stale(node: BuildNode, digest: str | None, recorded: str | None, force: bool) -> bool:
+    if node.always_run or digest is None:
+        return True
+    if node.external:
+        return False
+    return force or digest != recorded
+
+
+def digest_of(value) -> str:
+    """
+    Stable digest of a JSON-serializable value, for composing node inputs
+    """
+    payload = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def topological_order(nodes: list[BuildNode]) -> list[str]:
+    """
+    Return the node ids in dependency order. Raises a ValueError on unknown
+    dependencies or cycles.
+    """
+    by_id = {node.node_id: node for node in nodes}
+    remaining = {}
+    dependents = {node_id: [] for node_id in by_id}
+    for node in nodes:
+        for dependency in node.dependencies:
+            if dependency not in by_id:
+                raise ValueError(f"{node.node_id} depends on unknown node {dependency}")
+            dependents[dependency].append(node.node_id)
+        remaining[node.node_id] = len(node.dependencies)
+    ready = [node_id for node_id, count in remaining.items() if count == 0]
+    order = []
+    while ready:
+        node_id = ready.pop(0)
+        order.append(node_id)
+        for dependent in dependents[node_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                ready.append(dependent)
+    if len(order) != len(nodes):
+        cycle = sorted(set(by_id) - set(order))
+        raise ValueError(f"Build graph has a cycle through {', '.join(cycle)}")
+    return order
+
+
+def format_timing_table(results: dict[str, tuple[str, float]]) -> list[str]:
+    width = max([len(node_id) for node_id in results] + [4])
+    lines = [f"{'Node':<{width}}  {'Status':<7}  {'Seconds':>8}\n"]
+    for node_id, (status, seconds) in results.items():
+        lines.append(f"{node_id:<{width}}  {status:<7}  {seconds:>8.1f}\n")
+    return lines
+
+
+def run_build(
+    nodes: list[BuildNode],
+    build_state,
+    force: bool = False,
+    max_workers: int = MAX_BUILD_WORKERS,
+) -> Iterator[str]:
+    """
+    Build the stale nodes of the graph and yield progress lines, each
+    prefixed with its node id, then a timing table and a summary.
+
+    Node statuses: built, fresh (inputs unchanged, skipped), failed, and
+    blocked (a dependency failed or was blocked).
+    :param build_state: SSPIBuildState recording each node's input digest
+    :param force: Rebuild every derived node regardless of its recorded
+    digest (external nodes still only run when their data is missing)
+    """
+    order = topological_order(nodes)
+    by_id = {node.node_id: node for node in nodes}
+    dependents = {node_id: [] for node_id in by_id}
+    for node in nodes:
+        for dependency in node.dependencies:
+            dependents[dependency].append(node.node_id)
+    remaining = {node.node_id: len(node.dependencies) for node in nodes}
+    recorded = build_state.input_digests(order)
+    results: dict[str, tuple[str, float]] = {}
+    messages = queue.Queue()
+
+    def work(node):
+        start = time.perf_counter()
+        try:
+            digest = node.input_digest()
+            if not is_stale(node, digest, recorded.get(node.node_id), force):
+                messages.put((node.node_id, "fresh", time.perf_counter() - start))
+                return
+            for line in node.run() or ():
+                messages.put(prefix_line(node.node_id, line))
+            # Recorded after the run: for raw nodes the run itself is what
+            # changes the input (the collected RawDocumentSet)
+            digest = node.input_digest()
+            elapsed = time.perf_counter() - start
+            if digest is not None:
+                build_state.record(node.node_id, digest, elapsed)
+            messages.put((node.node_id, "built", elapsed))
+        except Exception as e:
+            log.exception(f"Build node {node.node_id} failed")
+            messages.put(prefix_line(node.node_id, f"error: {e!r}"))
+            messages.put((node.node_id, "failed", time.perf_counter() - start))
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="sspi-build"
+    )
+
+    def finish(node_id, status, seconds):
+        # Record a result and schedule (or block) the dependents it releases
+        results[node_id] = (status, seconds)
+        for dependent in dependents[node_id]:
+            remaining[dependent] -= 1
+            if remaining[dependent] == 0:
+                schedule(dependent)
+
+    def schedule(node_id):
+        node = by_id[node_id]
+        if any(results[d][0] in ("failed", "blocked") for d in node.dependencies):
+            finish(node_id, "blocked", 0.0)
+        else:
+            executor.submit(work, node)
+
+    try:
+        for node_id in order:
+            if remaining[node_id] == 0:
+                schedule(node_id)
+        while len(results) < len(nodes):
+            message = messages.get()
+            if isinstance(message, str):
+                yield message
+                continue
+            node_id, status, seconds = message
+            if status != "fresh":
+                yield f"{node_id}: {status} in {seconds:.1f}s\n"
+            finish(node_id, status, seconds)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+    yield from format_timing_table({node_id: results[node_id] for node_id in order})
+    counts = {}
+    for status, _ in results.values():
+        counts[status] = counts.get(status, 0) + 1
+    summary = ", ".join(f"{counts.get(s, 0)} {s}" for s in ("built", "fresh", "failed", "blocked"))
+    yield f"Build complete: {summary}\n"
@@ -20,6 +20,8 @@ from collections import defaultdict
 from dataclasses import dataclass
 from typing import Any
 
+import numpy as np
+
 from sspi_flask_app.api.resources.score_function_validator import (
     validate_score_function,
     safe_eval,
@@ -33,6 +35,7 @@ from sspi_flask_app.api.resources.utilities import (
     goalpost,
     impute_dataset,
 )
+from sspi_flask_app.models.rank import rank_scores
 
 logger = logging.getLogger(__name__)
 
@@ -697,13 +700,14 @@ def compute_ranks(
     """
     Compute ranks for all items by country within each year.
 
-    Higher scores get better (lower) ranks.
+    Higher scores get better (lower) ranks; tied scores share the minimum
+    rank (see models.rank.rank_scores).
 
     Args:
         all_scores: Dict mapping item_code -> list of score docs
 
     Returns:
-        Same structure with 'rank' field added to each document
+        Same structure with 'rank' and 'tie' fields added to each document
     """
     ranked_scores = {}
 
@@ -715,17 +719,14 @@ def compute_ranks(
 
         ranked_docs = []
         for year, year_docs in by_year.items():
-            # Sort by score descending (higher score = better = rank 1)
-            sorted_docs = sorted(
-                year_docs,
-                key=lambda d: d.get("score") or 0,
-                reverse=True
-            )
-
-            # Assign ranks
-            for rank, doc in enumerate(sorted_docs, start=1):
+            # Scores are stored x100; rank on the 0-1 scale the fast
+            # engine uses so both apply the same tie tolerance
+            scores = np.array([(d.get("score") or 0) / 100 for d in year_docs])
+            ranks, ties = rank_scores(scores, axis=0)
+            for doc, rank, tie in zip(year_docs, ranks, ties):
                 doc_copy = dict(doc)
-                doc_copy["rank"] = rank
+                doc_copy["rank"] = int(rank)
+                doc_copy["tie"] = bool(tie)
                 ranked_docs.append(doc_copy)
 
         ranked_scores[item_code] = ranked_docs
@@ -0,0 +1,85 @@
+"""
+Bounded worker pool for running dataset collectors and cleaners concurrently.
+
+Each task is a dataset code paired with a callable returning an iterable of
+progress lines (collectors are generators; cleaners are wrapped in one).
+run_dataset_tasks runs the tasks on a thread pool and merges their progress
+lines into a single stream suitable for a text/event-stream Response, with
+per-dataset timings as tasks finish and a failure summary at the end.
+"""
+
+import logging
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterable, Iterator
+
+log = logging.getLogger(__name__)
+
+MAX_DATASET_WORKERS = 4
+
+DatasetTask = tuple[str, Callable[[], Iterable[str] | None]]
+
+
+def prefix_line(dataset_code: str, line: str) -> str:
+    line = str(line)
+    if not line.endswith("\n"):
+        line += "\n"
+    # The CLI only highlights lines that start with "error:" or "problem:",
+    # so the dataset code goes after that marker
+    for marker in ("error: ", "problem: "):
+        if line.startswith(marker):
+            return f"{marker}{dataset_code}: {line[len(marker):]}"
+    return f"{dataset_code}: {line}"
+
+
+def run_dataset_tasks(
+    tasks: list[DatasetTask], max_workers: int = MAX_DATASET_WORKERS
+) -> Iterator[str]:
+    """
+    Run tasks concurrently on at most max_workers threads and yield their
+    progress lines as they arrive, each prefixed with its dataset code.
+
+    A task that raises does not stop the others: the error is logged, an
+    "error:" line is streamed and the dataset is listed in the summary.
+    """
+    messages = queue.Queue()
+
+    def work(dataset_code, task):
+        start = time.perf_counter()
+        try:
+            for line in task() or ():
+                messages.put(prefix_line(dataset_code, line))
+        except Exception as e:
+            log.exception(f"Task for dataset {dataset_code} failed")
+            messages.put((dataset_code, time.perf_counter() - start, e))
+        else:
+            messages.put((dataset_code, time.perf_counter() - start, None))
+
+    executor = ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="sspi-dataset"
+    )
+    failures = {}
+    try:
+        for dataset_code, task in tasks:
+            executor.submit(work, dataset_code, task)
+        remaining = len(tasks)
+        while remaining:
+            message = messages.get()
+            if isinstance(message, str):
+                yield message
+                continue
+            remaining -= 1
+            dataset_code, elapsed, error = message
+            if error is None:
+                yield f"{dataset_code}: finished in {elapsed:.1f}s\n"
+            else:
+                failures[dataset_code] = error
+                yield f"error: {dataset_code} failed after {elapsed:.1f}s: {error!r}\n"
+    finally:
+        # On client disconnect, drop queued tasks rather than blocking the
+        # response on them; running tasks are left to finish on their own
+        executor.shutdown(wait=False, cancel_futures=True)
+    yield f"Completed {len(tasks) - len(failures)} of {len(tasks)} datasets\n"
+    if failures:
+        yield f"Failed datasets: {', '.join(failures)}\n"
@@ -9,19 +9,27 @@ This module implements a high-performance scoring pipeline using:
 Key Components:
 - fetch_all_datasets_aggregated: Single-query data fetch
 - impute_dataset_vectorized: NumPy-based imputation
+- fill_partial_series: Array-based extrapolation/interpolation along years
 - FastCustomSSPI: Matrix-based hierarchy aggregation
 - score_indicators_vectorized: Vectorized indicator scoring
+- IndicatorScoreCache: Content-addressed cache of indicator score matrices
+- CleanDataPanelCache: Versioned, process-wide clean dataset tensor
 - score_custom_configuration_fast: Main pipeline entry point
 """
 
+import hashlib
+import json
 import logging
+import threading
+from collections import OrderedDict
 import numpy as np
 from typing import Callable
 
 from sspi_flask_app.models.database import sspi_clean_api_data, sspi_metadata
+from sspi_flask_app.models.rank import rank_scores
 from sspi_flask_app.api.resources.score_function_validator import (
     validate_score_function,
-    safe_eval,
+    compile_score_function,
     ValidatedScoreFunction,
 )
 # Single source of truth for the custom-scoring year window lives in
@@ -31,6 +39,7 @@ from sspi_flask_app.api.resources.custom_scoring import (
     DEFAULT_END_YEAR,
     rebuild_metadata_without_indicators,
 )
+from sspi_flask_app.api.resources.metadata_validator import compute_indicator_hash
 
 logger = logging.getLogger(__name__)
 
@@ -133,6 +142,66 @@ def fetch_all_datasets_aggregated(
     return result
 
 
+def fill_partial_series(data: np.ndarray) -> np.ndarray:
+    """
+    Fill gaps in every series of an array along its last (year) axis.
+
+    Leading gaps take the first observed value (backward extrapolation),
+    trailing gaps take the last observed value (forward extrapolation), and
+    interior gaps are linearly interpolated between their neighbours. Series
+    with no observations are left as np.nan.
+
+    Works on any leading shape, e.g. (n_countries, n_years) or the stacked
+    (n_datasets, n_countries, n_years) tensor. Every step operates on one
+    year across all series at once, so the Python-level work is O(n_years)
+    rather than O(series x years^2). Interpolation steps from the previously
+    filled year exactly as the per-country loop it replaces did, so results
+    are bit-for-bit identical.
+
+    Args:
+        data: Array of shape (..., n_years), may contain np.nan
+
+    Returns:
+        New array of the same shape with the gaps filled
+    """
+    filled = np.array(data, dtype=float)
+    n_years = filled.shape[-1]
+    if n_years == 0:
+        return filled
+    # Year-major layout so each step of the sweep touches contiguous memory
+    series = filled.reshape(-1, n_years).T.copy()
+    valid = ~np.isnan(series)
+    if valid.all():
+        return filled
+
+    # Carry the nearest observation forward and backward along the year
+    # axis; next_idx records the year it came from (n_years if none)
+    prev_values = series.copy()
+    next_values = series.copy()
+    next_idx = np.where(valid, np.arange(n_years)[:, None], n_years)
+    missing = ~valid
+    for year_idx in range(1, n_years):
+        np.copyto(prev_values[year_idx], prev_values[year_idx - 1], where=missing[year_idx])
+    for year_idx in range(n_years - 2, -1, -1):
+        np.copyto(next_values[year_idx], next_values[year_idx + 1], where=missing[year_idx])
+        np.copyto(next_idx[year_idx], next_idx[year_idx + 1], where=missing[year_idx])
+
+    has_prev = ~np.isnan(prev_values)
+    has_next = ~np.isnan(next_values)
+    np.copyto(series, next_values, where=~has_prev & has_next)
+    np.copyto(series, prev_values, where=has_prev & ~has_next)
+
+    # Interpolate by stepping from the previous (possibly just filled) year
+    interior = missing & has_prev & has_next
+    for year_idx in np.flatnonzero(interior.any(axis=1)):
+        prev_value = series[year_idx - 1]
+        weight = 1 / (next_idx[year_idx] - (year_idx - 1))
+        interpolated = prev_value + weight * (next_values[year_idx] - prev_value)
+        np.copyto(series[year_idx], interpolated, where=interior[year_idx])
+
+    return series.T.reshape(filled.shape)
+
+
 def impute_dataset_vectorized(
     data: np.ndarray,
     reference_mask: np.ndarray,
@@ -190,55 +259,7 @@ def impute_dataset_vectorized(
             logger.debug(f"No reference countries, filled {np.sum(no_data_countries)} countries with neutral value")
 
     # Scenario 3: Countries with partial data - forward/backward fill
-    for country_idx in range(n_countries):
-        if no_data_countries[country_idx]:
-            # Already handled in scenario 2
-            continue
-
-        country_data = imputed_data[country_idx, :]
-        missing_mask = np.isnan(country_data)
-
-        if not np.any(missing_mask):
-            # No missing data for this country
-            continue
-
-        # Find first and last valid indices
-        valid_indices = np.where(~missing_mask)[0]
-        if len(valid_indices) == 0:
-            # This shouldn't happen as we checked has_data_per_country, but handle it
-            continue
-
-        first_valid = valid_indices[0]
-        last_valid = valid_indices[-1]
-
-        # Backward extrapolation: fill from start to first valid
-        if first_valid > 0:
-            imputed_data[country_idx, :first_valid] = country_data[first_valid]
-
-        # Forward extrapolation: fill from last valid to end
-        if last_valid < n_years - 1:
-            imputed_data[country_idx, last_valid + 1:] = country_data[last_valid]
-
-        # Linear interpolation: fill gaps between valid values
-        # Find all NaN positions between first_valid and last_valid
-        for year_idx in range(first_valid, last_valid + 1):
-            if np.isnan(imputed_data[country_idx, year_idx]):
-                # Find previous and next valid values
-                prev_valid = year_idx - 1
-                while prev_valid >= first_valid and np.isnan(country_data[prev_valid]):
-                    prev_valid -= 1
-
-                next_valid = year_idx + 1
-                while next_valid <= last_valid and np.isnan(country_data[next_valid]):
-                    next_valid += 1
-
-                if prev_valid >= first_valid and next_valid <= last_valid:
-                    # Linear interpolation
-                    prev_value = country_data[prev_valid]
-                    next_value = country_data[next_valid]
-                    span = next_valid - prev_valid
-                    weight = (year_idx - prev_valid) / span
-                    imputed_data[country_idx, year_idx] = prev_value + weight * (next_value - prev_value)
+    imputed_data = fill_partial_series(imputed_data)
 
     return imputed_data, imputation_flags
 
@@ -614,7 +635,7 @@ def score_indicators_vectorized(
     Score all indicators using vectorized NumPy operations.
 
     For standard goalpost scoring, applies the formula vectorized.
-    For custom score functions, falls back to element-wise evaluation.
+    For custom score functions, evaluates a compiled NumPy kernel.
 
     Args:
         indicators: List of indicator metadata dicts
@@ -682,7 +703,7 @@ def score_indicators_vectorized(
 
             logger.debug(f"Scored {indicator_code} using vectorized goalpost")
         else:
-            # Slow path: custom score function evaluation. Materialize the 3D
+            # Composite path: compiled score function. Materialize the 3D
             # stack only here, where the full array is consumed.
             dataset_stack = np.array(dataset_stack)
             try:
@@ -752,9 +773,10 @@ def _apply_custom_score_function(
     upper_goalpost: float | None
 ) -> np.ndarray:
     """
-    Apply a custom score function element-wise.
+    Apply a custom score function to whole arrays.
 
-    Falls back to Python loop when vectorization isn't possible.
+    The validated AST is compiled into a NumPy kernel, so composite score
+    functions cost the same handful of array operations as a plain goalpost.
 
     Args:
         score_function: Score function string
@@ -775,50 +797,23 @@ def _apply_custom_score_function(
     except Exception as e:
         raise ValueError(f"Invalid score function: {e}")
 
-    # Get dimensions
-    n_datasets, n_countries, n_years = dataset_stack.shape
-
-    # Initialize output array
-    scores = np.full((n_countries, n_years), np.nan, dtype=np.float64)
-
-    # Loop through each (country, year) cell
-    for country_idx in range(n_countries):
-        for year_idx in range(n_years):
-            # Extract values for this (country, year)
-            dataset_values = {}
-            has_nan = False
-
-            for ds_idx, ds_code in enumerate(dataset_codes):
-                value = dataset_stack[ds_idx, country_idx, year_idx]
-                if np.isnan(value):
-                    has_nan = True
-                    break
-                dataset_values[ds_code] = float(value)
-
-            # Skip if any dataset value is NaN
-            if has_nan:
-                continue
-
-            # Evaluate the score function
-            try:
-                score = safe_eval(
-                    validated_function,
-                    dataset_values,
-                    lower_goalpost=lower_goalpost,
-                    upper_goalpost=upper_goalpost
-                )
+    # Score every (country, year) cell at once with the compiled kernel
+    kernel = compile_score_function(validated_function)
+    dataset_values = {
+        ds_code: dataset_stack[ds_idx]
+        for ds_idx, ds_code in enumerate(dataset_codes)
+    }
+    scores = kernel(
+        dataset_values,
+        lower_goalpost=lower_goalpost,
+        upper_goalpost=upper_goalpost
+    )
 
-                # Clamp to [0, 1]
-                score = max(0.0, min(1.0, score))
-                scores[country_idx, year_idx] = score
+    # Clamp to [0, 1]; NaN cells (evaluation failures) stay NaN
+    scores = np.clip(scores, 0.0, 1.0)
 
-            except Exception as e:
-                # Log the error but continue (leave as NaN)
-                logger.warning(
-                    f"Score function evaluation failed at country {country_idx}, "
-                    f"year {year_idx}: {e}"
-                )
-                continue
+    # Cells where any dataset value is NaN are not scored
+    scores[np.isnan(dataset_stack).any(axis=0)] = np.nan
 
     return scores
 
@@ -827,55 +822,261 @@ def _apply_custom_score_function(
 # Phase 4: Ranking and Storage
 # =============================================================================
 
-def compute_ranks_vectorized(all_scores: np.ndarray) -> np.ndarray:
+def compute_ranks_vectorized(all_scores: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
     """
-    Compute ranks for all items using NumPy argsort.
+    Compute ranks for all items in one sort along the country axis.
 
-    Higher scores get better (lower) ranks.
+    Higher scores get better (lower) ranks. Tied scores share the minimum
+    rank, as in SSPIRankingTable (see models.rank.rank_scores).
 
     Args:
         all_scores: Array of shape (n_items, n_countries, n_years)
 
     Returns:
-        Array of shape (n_items, n_countries, n_years) with integer ranks
+        Tuple of:
+        - ranks: Integer array of shape (n_items, n_countries, n_years);
+          0 where the score is NaN
+        - ties: Boolean array, True where the score is tied with another country
     """
-    n_items, n_countries, n_years = all_scores.shape
-    ranks = np.zeros_like(all_scores, dtype=int)
-
-    # For each item and year, rank countries by score
-    for item_idx in range(n_items):
-        item_scores = all_scores[item_idx]  # 2D view: (n_countries, n_years)
-        for year_idx in range(n_years):
-            # Get scores for this item and year across all countries
-            year_scores = item_scores[:, year_idx]
-
-            # Handle NaN values - they should get the worst rank
-            # argsort returns indices that would sort the array
-            # Use negative scores for descending order (higher score = rank 1)
-            # NaN values will be sorted to the end
-            valid_mask = ~np.isnan(year_scores)
-
-            if not np.any(valid_mask):
-                # All scores are NaN, assign no ranks (keep as 0)
-                continue
+    return rank_scores(all_scores, axis=1)
+
+
+# =============================================================================
+# Indicator Score Cache
+# =============================================================================
+
+# Upper bound on cached score matrices; one 67 x 24 matrix is ~13 KB
+INDICATOR_SCORE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class IndicatorScoreCache:
+    """
+    In-process LRU cache of imputed indicator score matrices.
+
+    Entries are (n_countries, n_years) arrays keyed by indicator_cache_key,
+    which covers everything an indicator's scores depend on, so entries never
+    need explicit invalidation; stale keys simply age out.
+    """
+
+    def __init__(self, max_bytes: int = INDICATOR_SCORE_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> np.ndarray | None:
+        with self._lock:
+            scores = self._entries.get(key)
+            if scores is not None:
+                self._entries.move_to_end(key)
+            return scores
+
+    def put(self, key: str, scores: np.ndarray):
+        scores = np.array(scores, dtype=np.float64)
+        scores.setflags(write=False)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.nbytes
+            self._entries[key] = scores
+            self._bytes += scores.nbytes
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= evicted.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+indicator_score_cache = IndicatorScoreCache()
+
+
+# =============================================================================
+# Clean Data Panel Cache
+# =============================================================================
 
-            # Create a copy with NaN replaced by -inf to ensure they rank last
-            scores_for_ranking = np.where(valid_mask, year_scores, -np.inf)
+# Number of (country set, year window) panels kept; jobs normally share one
+CLEAN_PANEL_CACHE_MAX_PANELS = 4
 
-            # Get indices that would sort in descending order
-            sorted_indices = np.argsort(-scores_for_ranking)
 
-            # Assign ranks (1-based)
-            # Countries with NaN scores won't get valid ranks (stay 0)
-            rank_values = np.zeros(n_countries, dtype=int)
-            rank_values[sorted_indices] = np.arange(1, n_countries + 1)
+class CleanDataPanel:
+    """
+    Dense clean-data tensor for one country order and year window.
+
+    values has shape (n_datasets, n_countries, n_years) with np.nan for
+    missing observations; dataset_index maps each DatasetCode to its slab
+    and versions records the clean-data version each slab was fetched at.
+    """
+
+    def __init__(self, country_codes: tuple[str, ...], start_year: int, end_year: int):
+        self.country_codes = country_codes
+        self.start_year = start_year
+        self.end_year = end_year
+        self.values = np.empty((0, len(country_codes), end_year - start_year + 1))
+        self.dataset_index: dict[str, int] = {}
+        self.versions: dict[str, int] = {}
+        self.generation = None
+
+    def store(self, arrays: dict[str, np.ndarray], versions: dict[str, int]):
+        """
+        Replace (or add) the slabs of the datasets in arrays. The tensor is
+        copied rather than written in place, so views handed to running jobs
+        keep the data they were sliced from.
+        """
+        for code in arrays:
+            if code not in self.dataset_index:
+                self.dataset_index[code] = len(self.dataset_index)
+        values = np.empty((len(self.dataset_index),) + self.values.shape[1:])
+        values[:len(self.values)] = self.values
+        for code, array in arrays.items():
+            values[self.dataset_index[code]] = array
+            self.versions[code] = versions.get(code, 0)
+        values.setflags(write=False)
+        self.values = values
+
+
+class CleanDataPanelCache:
+    """
+    Process-wide cache of the clean dataset tensor shared by scoring jobs.
+
+    Clean data changes only when datasets are re-cleaned, and every write to
+    sspi_clean_api_data bumps the version of the datasets it touches (or the
+    collection Generation). A panel therefore refetches only the datasets
+    whose version moved since they were cached, and a Generation bump
+    discards it; jobs whose datasets are all current slice the panel with no
+    reads of the clean data. Versions are read before fetching, so a write
+    racing a fetch can only leave a dataset stale, never falsely current.
+    """
+
+    def __init__(self, max_panels: int = CLEAN_PANEL_CACHE_MAX_PANELS):
+        self.max_panels = max_panels
+        self._panels: OrderedDict[tuple, CleanDataPanel] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def dataset_arrays(
+        self,
+        dataset_codes: list[str],
+        country_codes: list[str],
+        start_year: int,
+        end_year: int,
+        data_versions: dict
+    ) -> dict[str, np.ndarray]:
+        """
+        Return {DatasetCode: (n_countries, n_years) array} like
+        fetch_all_datasets_aggregated, as read-only views of the panel,
+        fetching only missing or stale datasets.
+
+        Args:
+            dataset_codes: Dataset codes to return
+            country_codes: Ordered country codes (array rows)
+            start_year: First year of the window
+            end_year: Last year of the window
+            data_versions: sspi_clean_api_data.data_versions() covering
+                dataset_codes, read before this call
+        """
+        key = (tuple(country_codes), start_year, end_year)
+        versions = data_versions.get("Datasets", {})
+        with self._lock:
+            panel = self._panels.get(key)
+            if panel is None or panel.generation != data_versions.get("Generation", 0):
+                panel = CleanDataPanel(key[0], start_year, end_year)
+                panel.generation = data_versions.get("Generation", 0)
+                self._panels[key] = panel
+            self._panels.move_to_end(key)
+            while len(self._panels) > self.max_panels:
+                self._panels.popitem(last=False)
+            stale = [
+                code for code in dataset_codes
+                if code not in panel.dataset_index
+                or panel.versions.get(code) != versions.get(code, 0)
+            ]
+            if stale:
+                logger.info(f"Panel cache: fetching {len(stale)} of {len(dataset_codes)} datasets")
+                panel.store(
+                    fetch_all_datasets_aggregated(stale, country_codes, start_year, end_year),
+                    versions
+                )
+            return {code: panel.values[panel.dataset_index[code]] for code in dataset_codes}
+
+    def clear(self):
+        with self._lock:
+            self._panels.clear()
+
+    def __len__(self) -> int:
+        return len(self._panels)
+
+
+clean_panel_cache = CleanDataPanelCache()
+
+
+def indicator_cache_key(
+    indicator: dict,
+    data_versions: dict,
+    country_codes: list[str],
+    reference_countries: list[str],
+    start_year: int,
+    end_year: int
+) -> str:
+    """
+    Content address of one indicator's imputed score matrix.
+
+    Combines the indicator's scoring hash (compute_indicator_hash plus its
+    goalposts), the versions of its datasets, the ordered country set, the
+    imputation reference group and the year window.
 
-            # Only assign ranks to valid (non-NaN) scores
-            rank_values = np.where(valid_mask, rank_values, 0)
+    Args:
+        indicator: Indicator metadata dict
+        data_versions: Result of sspi_clean_api_data.data_versions()
+        country_codes: Ordered country codes (matrix rows)
+        reference_countries: Countries used for reference-class imputation
+        start_year: First year of the window
+        end_year: Last year of the window
+
+    Returns:
+        Hexadecimal hash string
+    """
+    dataset_versions = data_versions.get("Datasets", {})
+    key_data = [
+        compute_indicator_hash(indicator),
+        indicator.get("LowerGoalpost"),
+        indicator.get("UpperGoalpost"),
+        data_versions.get("Generation", 0),
+        [[code, dataset_versions.get(code, 0)] for code in indicator.get("DatasetCodes") or []],
+        list(country_codes),
+        sorted(reference_countries),
+        start_year,
+        end_year,
+    ]
+    json_str = json.dumps(key_data, separators=(',', ':'), default=str)
+    return hashlib.sha256(json_str.encode('utf-8')).hexdigest()
 
-            ranks[item_idx, :, year_idx] = rank_values
 
-    return ranks
+def scoring_data_version(metadata: list[dict]) -> str:
+    """
+    Hash of the clean-data versions of every dataset a configuration uses.
+
+    Stored with cached results so a hit can be rejected once any of the
+    underlying datasets has been rewritten.
+
+    Args:
+        metadata: Custom SSPI metadata
+
+    Returns:
+        Hexadecimal hash string
+    """
+    dataset_codes = sorted({
+        code
+        for item in metadata if item.get("ItemType") == "Indicator"
+        for code in item.get("DatasetCodes") or []
+    })
+    data_versions = sspi_clean_api_data.data_versions(dataset_codes)
+    json_str = json.dumps(data_versions, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(json_str.encode('utf-8')).hexdigest()[:32]
 
 
 # =============================================================================
@@ -890,7 +1091,9 @@ def score_custom_configuration_fast(
     reference_group: str = "SSPI67",
     start_year: int = DEFAULT_START_YEAR,
     end_year: int = DEFAULT_END_YEAR,
-    progress_callback: Callable[[str, int, str], None] | None = None
+    progress_callback: Callable[[str, int, str], None] | None = None,
+    score_cache: IndicatorScoreCache | None = None,
+    panel_cache: CleanDataPanelCache | None = None
 ) -> dict[str, list[dict]]:
     """
     Fast scoring pipeline using vectorized operations and matrix multiplication.
@@ -911,6 +1114,11 @@ def score_custom_configuration_fast(
         start_year: Start year for scoring
         end_year: End year for scoring
         progress_callback: Optional callback(phase, percent, message)
+        score_cache: Optional IndicatorScoreCache. Indicators whose cache key
+            hits are taken from the cache; only the rest have their datasets
+            fetched, imputed and scored
+        panel_cache: Optional CleanDataPanelCache. Datasets are sliced from
+            the cached clean-data panel, fetching only missing or stale ones
 
     Returns:
         Dict mapping item_code -> list of ranked score documents
@@ -928,21 +1136,47 @@ def score_custom_configuration_fast(
         return {}
 
     # Extract all indicators from metadata
-    # NOTE: We always score ALL indicators in the metadata because the
-    # aggregation matrix dimensions must match. The vectorized operations
-    # are fast enough that partial scoring is not necessary.
-    # The metadata should already be filtered to remove dropped indicators
+    # NOTE: Every indicator in the metadata gets a score row because the
+    # aggregation matrix dimensions must match; rows may come from the
+    # score cache instead of being recomputed. The metadata should already be filtered to remove dropped indicators
     # (those with empty datasets) before calling this function.
     all_indicators = [
         item for item in metadata
         if item.get("ItemType") == "Indicator"
     ]
 
-    # Always score all indicators - matrix multiplication requires consistent dimensions
+    # Always score all indicators - matrix multiplication requires consistent
+    # dimensions. With a score cache, indicators whose inputs are unchanged
+    # are assembled from the cache and only the rest are computed.
     indicators_to_score = all_indicators
+    cache_keys = []
+    cached_scores = {}
+    data_versions = None
+    if score_cache is not None or panel_cache is not None:
+        all_dataset_codes = sorted({
+            code for ind in all_indicators for code in ind.get("DatasetCodes") or []
+        })
+        data_versions = sspi_clean_api_data.data_versions(all_dataset_codes)
+    if score_cache is not None:
+        cache_keys = [
+            indicator_cache_key(
+                ind, data_versions, country_codes, reference_countries,
+                start_year, end_year
+            )
+            for ind in all_indicators
+        ]
+        for i, key in enumerate(cache_keys):
+            scores = score_cache.get(key)
+            if scores is not None:
+                cached_scores[i] = scores
+    missing_positions = [
+        i for i in range(len(all_indicators)) if i not in cached_scores
+    ]
+    indicators_to_compute = [all_indicators[i] for i in missing_positions]
 
     logger.info(
-        f"Fast pipeline: Scoring {len(indicators_to_score)} indicators"
+        f"Fast pipeline: Scoring {len(indicators_to_compute)} indicators "
+        f"({len(cached_scores)} from cache)"
     )
 
     # Phase 1: Fetch datasets
@@ -951,22 +1185,32 @@ def score_custom_configuration_fast(
 
     # Collect all dataset codes needed
     dataset_codes = set()
-    for ind in indicators_to_score:
+    for ind in indicators_to_compute:
         codes = ind.get("DatasetCodes", [])
         if codes:
             dataset_codes.update(codes)
 
-    if not dataset_codes:
+    if not dataset_codes and not cached_scores:
         logger.warning("No dataset codes found in indicators")
         return {}
 
-    logger.info(f"Fetching {len(dataset_codes)} datasets")
-    dataset_arrays = fetch_all_datasets_aggregated(
-        list(dataset_codes),
-        country_codes,
-        start_year,
-        end_year
-    )
+    dataset_arrays = {}
+    if dataset_codes and panel_cache is not None:
+        dataset_arrays = panel_cache.dataset_arrays(
+            sorted(dataset_codes),
+            country_codes,
+            start_year,
+            end_year,
+            data_versions
+        )
+    elif dataset_codes:
+        logger.info(f"Fetching {len(dataset_codes)} datasets")
+        dataset_arrays = fetch_all_datasets_aggregated(
+            list(dataset_codes),
+            country_codes,
+            start_year,
+            end_year
+        )
 
     # Phase 2: Impute datasets
     if progress_callback:
@@ -991,13 +1235,25 @@ def score_custom_configuration_fast(
     if progress_callback:
         progress_callback("scoring", 40, "Scoring indicators...")
 
-    indicator_scores = score_indicators_vectorized(
-        indicators_to_score,
+    computed_scores = score_indicators_vectorized(
+        indicators_to_compute,
         dataset_arrays,
         country_codes,
         start_year,
         end_year
     )
+    if score_cache is None:
+        indicator_scores = computed_scores
+    else:
+        n_years = end_year - start_year + 1
+        indicator_scores = np.empty(
+            (len(all_indicators), len(country_codes), n_years), dtype=np.float64
+        )
+        for i, scores in cached_scores.items():
+            indicator_scores[i] = scores
+        for row, i in enumerate(missing_positions):
+            indicator_scores[i] = computed_scores[row]
+            score_cache.put(cache_keys[i], computed_scores[row])
 
     # Drop indicators that produced no usable score anywhere (NaN across every
     # country and year). This happens when a score function needs a dataset
@@ -1043,7 +1299,7 @@ def score_custom_configuration_fast(
     all_scores = np.concatenate([indicator_scores, aggregated_scores], axis=0)
     all_codes = fast_sspi.indicator_codes + fast_sspi.item_codes
 
-    all_ranks = compute_ranks_vectorized(all_scores)
+    all_ranks, all_ties = compute_ranks_vectorized(all_scores)
 
     # Phase 6: Convert to dict format
     if progress_callback:
@@ -1055,7 +1311,8 @@ def score_custom_configuration_fast(
         all_codes,
         country_codes,
         start_year,
-        metadata
+        metadata,
+        all_ties
     )
 
     # NOTE: default_scores parameter is ignored - we always score all indicators
@@ -1074,7 +1331,8 @@ def _arrays_to_score_dicts(
     all_codes: list[str],
     country_codes: list[str],
     start_year: int,
-    metadata: list[dict]
+    metadata: list[dict],
+    all_ties: np.ndarray | None = None
 ) -> dict[str, list[dict]]:
     """
     Convert score/rank arrays to the dict format expected by callers.
@@ -1086,6 +1344,7 @@ def _arrays_to_score_dicts(
         country_codes: Ordered list of country codes
         start_year: First year in data
         metadata: Original metadata for item names/types
+        all_ties: Optional tie flags, shape (n_items, n_countries, n_years)
 
     Returns:
         Dict mapping item_code -> list of score dicts
@@ -1124,6 +1383,7 @@ def _arrays_to_score_dicts(
         # arrays and calling np.isnan per cell.
         score_mat = all_scores[item_idx]
         rank_mat = all_ranks[item_idx]
+        tie_mat = all_ties[item_idx] if all_ties is not None else np.zeros(score_mat.shape, dtype=bool)
         nan_mat = np.isnan(score_mat)
 
         for country_idx, country_code in enumerate(country_codes):
@@ -1144,6 +1404,7 @@ def _arrays_to_score_dicts(
                     "year": year,
                     "score": float(score * 100),  # Convert to 0-100 scale
                     "rank": int(rank),
+                    "tie": bool(tie_mat[country_idx, year_idx]),
                     "imputed": False,  # Imputation tracking would require dataset-level flags
                     "imputation_method": None,
                 })
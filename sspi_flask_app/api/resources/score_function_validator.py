@@ -11,7 +11,9 @@ Security Model (whitelist-by-construction):
   comprehensions, statements, ...).
 - ASCII-only input (homoglyph / fullwidth / zero-width / RTL defense).
 - The AST is evaluated by a bounded AST walk — there is NO `exec`/`compile`, and no
-  Python builtins are reachable from a score function.
+  Python builtins are reachable from a score function. compile_score_function
+  lowers the same closed set of nodes into closures over NumPy arrays, so the
+  vectorized path has exactly the same reach.
 - Maximum length enforcement (250 chars) caps resource-exhaustion inputs.
 - `pow` exponents are bounded numeric literals; the top-level expression must be a
   goalpost (or aggregator of goalposts) so the output is provably in [0, 1].
@@ -29,6 +31,9 @@ import math
 import logging
 from dataclasses import dataclass, field
 from enum import Enum, auto
+from typing import Callable
+
+import numpy as np
 
 from sspi_flask_app.api.resources.utilities import goalpost
 
@@ -820,6 +825,203 @@ def safe_eval(
     return float(score)
 
 
+# =============================================================================
+# Vectorized Execution (AST lowered to NumPy closures - NO exec)
+# =============================================================================
+# compile_score_function turns a validated AST into a kernel that scores whole
+# (n_countries, n_years) arrays at once. Each node becomes a closure over its
+# children; only the node shapes above are handled, so nothing outside the
+# grammar is reachable. Python raises where NumPy quietly yields inf/nan (x/0,
+# log(0), sqrt(-1), float overflow in pow), so each kernel also marks the cells
+# where safe_eval would have raised; those cells come out as NaN, exactly as the
+# per-cell loop leaves them. Arithmetic, goalpost and aggregators match safe_eval
+# bit for bit; pow and log use NumPy's vectorized libm, which may differ from
+# math.pow / math.log in the last place.
+
+def _goalpost_kernel(value, lower, upper, errors):
+    """Elementwise utilities.goalpost, including its NaN and lower == upper rules."""
+    errors |= np.isnan(value) | np.isnan(lower) | np.isnan(upper)
+    normalized = (value - lower) / (upper - lower)
+    # max(0.0, min(1.0, x)) with Python's comparison semantics (NaN -> 1.0)
+    normalized = np.where(normalized < 1.0, normalized, 1.0)
+    normalized = np.where(normalized > 0.0, normalized, 0.0)
+    single = np.where(value == lower, 0.5, np.where(value > upper, 1.0, 0.0))
+    return np.where(upper == lower, single, normalized)
+
+
+def _pow_kernel(base, exponent, errors):
+    """Elementwise _safe_pow; the exponent is a parse-time constant scalar."""
+    errors |= (base == 0) & (exponent < 0)
+    if not float(exponent).is_integer():
+        # Python returns a complex number here, which no bounded score accepts
+        errors |= base < 0
+    result = np.power(base, exponent)
+    errors |= np.isinf(result) & np.isfinite(base)
+    return result
+
+
+def _sqrt_kernel(value, errors):
+    errors |= value < 0
+    return np.sqrt(value)
+
+
+def _log_kernel(value, errors):
+    errors |= value <= 0
+    return np.log(value)
+
+
+def _average_kernel(*args, errors):
+    """
+    Elementwise _average. Builtin sum() over floats uses Neumaier compensated
+    summation (Python 3.12+), which is reproduced here so results match exactly.
+    """
+    total = 0.0
+    compensation = 0.0
+    for arg in args:
+        running = total + arg
+        compensation = compensation + np.where(
+            np.abs(total) >= np.abs(arg),
+            (total - running) + arg,
+            (arg - running) + total,
+        )
+        total = running
+    total = np.where(
+        (compensation != 0) & np.isfinite(compensation), total + compensation, total
+    )
+    return total / len(args)
+
+
+def _max_kernel(*args, errors):
+    if len(args) == 1:
+        # Builtin max() of a single float raises TypeError (not iterable)
+        errors |= True
+    result = args[0]
+    for arg in args[1:]:
+        result = np.where(arg > result, arg, result)
+    return result
+
+
+def _min_kernel(*args, errors):
+    if len(args) == 1:
+        # Builtin min() of a single float raises TypeError (not iterable)
+        errors |= True
+    result = args[0]
+    for arg in args[1:]:
+        result = np.where(arg < result, arg, result)
+    return result
+
+
+def _abs_kernel(value, errors):
+    return np.abs(value)
+
+
+# Array counterpart of FUNCTION_DISPATCH. Every kernel takes the shared error mask.
+KERNEL_DISPATCH = {
+    "goalpost": _goalpost_kernel,
+    "average": _average_kernel,
+    "max": _max_kernel,
+    "min": _min_kernel,
+    "abs": _abs_kernel,
+    "sqrt": _sqrt_kernel,
+    "pow": _pow_kernel,
+    "log": _log_kernel,
+}
+
+
+def _compile(node) -> Callable:
+    """Lower an AST node to a closure (env, errors) -> array."""
+    if isinstance(node, Assignment):
+        return _compile(node.expr)
+    if isinstance(node, NumberLiteral):
+        value = node.value
+        return lambda env, errors: value
+    if isinstance(node, DatasetRef):
+        code = node.code
+        return lambda env, errors: env[code]
+    if isinstance(node, GoalpostVar):
+        name = node.name
+        return lambda env, errors: env[name]
+    if isinstance(node, UnaryOp):
+        operand = _compile(node.operand)
+        return lambda env, errors: -operand(env, errors)
+    if isinstance(node, BinaryOp):
+        left = _compile(node.left)
+        right = _compile(node.right)
+        if node.op == "+":
+            return lambda env, errors: left(env, errors) + right(env, errors)
+        if node.op == "-":
+            return lambda env, errors: left(env, errors) - right(env, errors)
+        if node.op == "*":
+            return lambda env, errors: left(env, errors) * right(env, errors)
+        if node.op == "/":
+            def divide(env, errors):
+                numerator = left(env, errors)
+                denominator = right(env, errors)
+                errors |= denominator == 0
+                return numerator / denominator
+            return divide
+        raise ScoreFunctionValidationError(f"Unknown operator '{node.op}'")
+    if isinstance(node, FunctionCall):
+        kernel = KERNEL_DISPATCH[node.name]
+        args = [_compile(arg) for arg in node.args]
+        return lambda env, errors: kernel(*[arg(env, errors) for arg in args], errors=errors)
+    raise ScoreFunctionValidationError(f"Cannot compile node of type {type(node).__name__}")
+
+
+def compile_score_function(
+    validated_function: ValidatedScoreFunction,
+) -> Callable[..., np.ndarray]:
+    """
+    Compile a validated score function into a vectorized NumPy kernel.
+
+    The returned callable takes a dict mapping dataset codes to equally shaped
+    arrays (plus optional goalpost values) and returns an array of raw scores of
+    that shape. Each cell equals what safe_eval returns for the same values, and
+    is NaN wherever safe_eval would raise (missing input, division by zero,
+    domain errors, overflow, non-finite result).
+
+    Args:
+        validated_function: Pre-validated score function (carrying its AST)
+
+    Returns:
+        kernel(dataset_arrays, lower_goalpost=None, upper_goalpost=None)
+
+    Raises:
+        ScoreFunctionValidationError: If the function has no parsed AST
+    """
+    if validated_function.ast is None:
+        raise ScoreFunctionValidationError("Score function has no parsed AST to evaluate")
+    expression = _compile(validated_function.ast)
+
+    def kernel(
+        dataset_arrays: dict[str, np.ndarray],
+        lower_goalpost: float | None = None,
+        upper_goalpost: float | None = None,
+    ) -> np.ndarray:
+        missing = validated_function.dataset_codes.difference(dataset_arrays)
+        if missing:
+            raise ValueError(f"Missing dataset values: {missing}")
+        env = {
+            code: np.asarray(dataset_arrays[code], dtype=np.float64)
+            for code in validated_function.dataset_codes
+        }
+        if lower_goalpost is not None:
+            env["LowerGoalpost"] = float(lower_goalpost)
+        if upper_goalpost is not None:
+            env["UpperGoalpost"] = float(upper_goalpost)
+        shape = np.broadcast_shapes(*[a.shape for a in dataset_arrays.values()])
+        errors = np.zeros(shape, dtype=bool)
+        with np.errstate(all="ignore"):
+            try:
+                scores = expression(env, errors)
+            except KeyError as e:
+                raise ValueError(f"Missing value for {e} in score function")
+            scores = np.broadcast_to(np.asarray(scores, dtype=np.float64), shape)
+            return np.where(errors | ~np.isfinite(scores), np.nan, scores)
+
+    return kernel
+
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
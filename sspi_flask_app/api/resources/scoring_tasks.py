@@ -8,9 +8,11 @@ events) from requests served by any other worker (#893).
 
 Key Components:
 - ScoringJob: Write-through view of a job persisted in Mongo
-- start_scoring_job: Launch background scoring (inserts the job doc, spawns thread)
+- start_scoring_job: Launch background scoring (inserts the job doc, spawns
+  a thread or queues the job for an `sspi worker`)
+- run_claimed_job: Runs a queued job inside an `sspi worker` pool process
 - run_scoring_pipeline: Main pipeline executed in background thread (writes to Mongo)
-- generate_sse_events: Polls the Mongo job doc and streams SSE events
+- generate_sse_events: Streams SSE events as the Mongo job doc changes
 """
 
 import json
@@ -41,6 +43,9 @@ from sspi_flask_app.api.resources.custom_scoring import (
 _rebuild_metadata_without_indicators = rebuild_metadata_without_indicators
 from sspi_flask_app.api.resources.fast_custom_scoring import (
     score_custom_configuration_fast,
+    clean_panel_cache,
+    indicator_score_cache,
+    scoring_data_version,
 )
 from sspi_flask_app.models.database import (
     sspi_custom_panel_data,
@@ -108,6 +113,12 @@ MAX_CONCURRENT_JOBS_GLOBAL = int(
 )
 
 
+# Where pipelines run: "thread" runs each job on a daemon thread in the web
+# worker that accepted it; "queue" only enqueues the job (with its inputs) for
+# an out-of-process `sspi worker` pool to claim and run.
+SCORING_WORKER_MODE = os.environ.get("SCORING_WORKER_MODE", "thread")
+
+
 class ConcurrencyLimitExceeded(Exception):
     """Raised when starting a job would exceed a concurrency cap."""
     pass
@@ -411,7 +422,9 @@ def start_scoring_job(
 
     Inserts the job document in Mongo (status PENDING) so other workers can
     observe it immediately, then spawns the daemon thread that runs the
-    pipeline and writes progress/events back to Mongo.
+    pipeline and writes progress/events back to Mongo. In queue mode
+    (``SCORING_WORKER_MODE=queue``) the metadata and actions are stored with
+    the job instead, and an ``sspi worker`` process claims and runs it.
 
     Args:
         config_id: Configuration identifier
@@ -448,7 +461,7 @@ def start_scoring_job(
     job_id = secrets.token_hex(16)
     now = datetime.now(timezone.utc)
     # Persist the job document (worker-safe state lives in Mongo)
-    sspi_scoring_jobs.create_job({
+    job_document = {
         "job_id": job_id,
         "config_id": config_id,
         "config_hash": None,  # Will be computed during validation
@@ -469,7 +482,13 @@ def start_scoring_job(
         "completed_at": None,
         "expire_at": now + timedelta(seconds=JOB_TTL_SECONDS),
         "worker_pid": os.getpid(),
-    })
+    }
+    if SCORING_WORKER_MODE == "queue":
+        job_document["payload"] = {"metadata": metadata, "actions": actions}
+        sspi_scoring_jobs.create_job(job_document)
+        logger.info(f"Queued scoring job {job_id} for config {config_id}")
+        return job_id
+    sspi_scoring_jobs.create_job(job_document)
     # Build the write-through job object handed to the pipeline thread
     job = ScoringJob(
         job_id=job_id,
@@ -492,6 +511,22 @@ def start_scoring_job(
     return job_id
 
 
+def run_claimed_job(job_id: str):
+    """
+    Run the pipeline for a queued job already claimed by an ``sspi worker``.
+
+    Executed in a worker pool process: the job's inputs are read back from
+    its stored payload, and progress is written to Mongo as in thread mode.
+    """
+    doc = sspi_scoring_jobs.get(job_id)
+    payload = sspi_scoring_jobs.get_payload(job_id)
+    if not doc or payload is None:
+        logger.error(f"Claimed scoring job {job_id} is missing or has no payload")
+        return
+    sspi_scoring_jobs.set_fields(job_id, worker_pid=os.getpid())
+    run_scoring_pipeline(_job_from_doc(doc), payload["metadata"], payload["actions"])
+
+
 def cancel_job(job_id: str) -> bool:
     """
     Cancel a job, persisting the request to Mongo so the running thread (which
@@ -575,6 +610,8 @@ def run_scoring_pipeline(
     6. visualizations - Build visualizations (save results)
     """
     start_time = time.time()
+    flight_key = None
+    flight_acquired = False
     try:
         job.set_status(JobStatus.VALIDATING)
 
@@ -653,27 +690,42 @@ def run_scoring_pipeline(
         config_hash = compute_config_hash(metadata)
         job.set_config_hash(config_hash)
 
+        data_version = None
         try:
-            # Check if we have cached flat scores in sspi_custom_item_data
-            if sspi_custom_item_data.has_cached_results(config_hash):
-                # Also verify line data exists
-                if sspi_custom_panel_data.has_line_data(config_hash):
-                    cached_results = sspi_custom_item_data.get_cached_results(config_hash)
-                    # Cache hit! Emit all stages as complete
-                    job.emit_stage_complete("identify", "Configuration Unchanged (cached)", {"count": 0})
-                    job.emit_stage_complete("scoring", "Scores Retrieved from Cache", {"cached": True})
-                    job.emit_stage_complete("aggregate", "Aggregation Complete (cached)")
-                    job.emit_stage_complete("ranking", "Ranks Computed (cached)")
-                    job.emit_stage_complete("visualizations", "Visualizations Ready")
-
-                    duration_ms = int((time.time() - start_time) * 1000)
-                    job.emit_complete(len(cached_results), duration_ms, cached=True)
-
-                    logger.info(f"Cache hit for job {job.job_id}, returning {len(cached_results)} cached results")
-                    return
+            # A manifest exists only once both flat scores and line data were
+            # stored, so one _id lookup decides the hit without reading rows.
+            # Results scored from older clean data are not reused.
+            data_version = scoring_data_version(metadata)
+            manifest = sspi_custom_item_data.get_manifest(config_hash)
+            if manifest and manifest.get("data_version") == data_version:
+                # Cache hit! Emit all stages as complete
+                job.emit_stage_complete("identify", "Configuration Unchanged (cached)", {"count": 0})
+                job.emit_stage_complete("scoring", "Scores Retrieved from Cache", {"cached": True})
+                job.emit_stage_complete("aggregate", "Aggregation Complete (cached)")
+                job.emit_stage_complete("ranking", "Ranks Computed (cached)")
+                job.emit_stage_complete("visualizations", "Visualizations Ready")
+
+                duration_ms = int((time.time() - start_time) * 1000)
+                job.emit_complete(manifest["item_count"], duration_ms, cached=True)
+
+                logger.info(f"Cache hit for job {job.job_id}, returning {manifest['item_count']} cached results")
+                return
         except Exception as e:
             logger.warning(f"Cache check failed: {e}, proceeding with scoring")
 
+        # =====================================================================
+        # Single flight: follow an identical job that is already scoring
+        # =====================================================================
+        # Until the first job stores its results the cache cannot help, so
+        # identical jobs started meanwhile adopt its result instead of scoring
+        # the same configuration again. If the job they follow fails or is
+        # cancelled, one of them takes over the flight and scores.
+        flight_key = f"{config_hash}:{data_version}"
+        while leader_id := sspi_scoring_jobs.acquire_flight(flight_key, job.job_id):
+            if _follow_flight(job, leader_id, start_time):
+                return
+        flight_acquired = True
+
         # =====================================================================
         # Stage 2: Identify Indicators (static)
         # =====================================================================
@@ -715,10 +767,15 @@ def run_scoring_pipeline(
         if _abort_if_cancelled(job):
             return
 
-        # Run the scoring pipeline (using fast vectorized implementation)
+        # Run the scoring pipeline (using fast vectorized implementation).
+        # Indicators unchanged since an earlier job are reused from the
+        # process-wide score cache, and the rest slice their datasets from the
+        # process-wide clean-data panel.
         all_scores = score_custom_configuration_fast(
             metadata,
-            progress_callback=progress_callback
+            progress_callback=progress_callback,
+            score_cache=indicator_score_cache,
+            panel_cache=clean_panel_cache
         )
 
         # Count scored indicators
@@ -781,6 +838,16 @@ def run_scoring_pipeline(
             )
             logger.info(f"Stored {line_count} line chart documents for job {job.job_id}")
 
+            # Both result sets are in place: publish the cache entry
+            if data_version is not None:
+                sspi_custom_item_data.write_manifest(
+                    config_hash=config_hash,
+                    item_count=stored_count,
+                    line_count=line_count,
+                    item_codes=[code for code, docs in all_scores.items() if docs],
+                    data_version=data_version
+                )
+
             # Update the config with the scored_hash for future has_scores checks
             # Skip for ad-hoc configs (they aren't stored in sspi_custom_user_structure)
             if not job.config_id.startswith("adhoc_"):
@@ -812,6 +879,68 @@ def run_scoring_pipeline(
     except Exception as e:
         logger.exception(f"Scoring job {job.job_id} failed: {e}")
         job.emit_error(str(e), "SCORING_ERROR")
+    finally:
+        if flight_acquired:
+            sspi_scoring_jobs.release_flight(flight_key, job.job_id)
+
+
+# Stages mirrored from a followed job (the follower emits its own data_check
+# and validate stages before it starts following)
+FLIGHT_STAGES = frozenset({"identify", "scoring", "aggregate", "ranking", "visualizations"})
+
+
+def _follow_flight(job: ScoringJob, leader_id: str, start_time: float) -> bool:
+    """
+    Mirror the progress of ``leader_id``, an active job scoring the same
+    configuration, into ``job`` until the leader finishes.
+
+    Returns True once ``job`` is terminal: complete with the leader's result
+    (which the leader stored under the shared config_hash), or cancelled.
+    Returns False if the leader failed, was cancelled or disappeared, in
+    which case ``job`` should try to take over the flight.
+    """
+    logger.info(f"Job {job.job_id} following identical job {leader_id}")
+    job.set_status(JobStatus.SCORING)
+    watch = sspi_scoring_jobs.watch_job(leader_id)
+    last_seq = 0
+    last_stage_progress = None
+    last_change = time.monotonic()
+    try:
+        while True:
+            if _abort_if_cancelled(job):
+                return True
+            state = sspi_scoring_jobs.job_state(leader_id, last_seq)
+            if not state:
+                return False
+            for event in state["events"]:
+                last_seq = event["seq"]
+                data = dict(event["data"])
+                if event["event_type"] == "stage_complete" and data.get("stage") in FLIGHT_STAGES:
+                    job.emit_stage_complete(data.pop("stage"), data.pop("message", ""), data)
+            stage_progress = (state.get("stage"), state.get("stage_current"), state.get("stage_total"))
+            if stage_progress[1] is not None and stage_progress != last_stage_progress:
+                last_stage_progress = stage_progress
+                if stage_progress[0] in FLIGHT_STAGES:
+                    job.emit_stage_progress(*stage_progress)
+            status = _status_from_value(state.get("status"))
+            if status == JobStatus.COMPLETE:
+                result = state.get("result") or {}
+                duration_ms = int((time.time() - start_time) * 1000)
+                job.emit_complete(result.get("total_scores", 0), duration_ms, cached=True)
+                logger.info(f"Job {job.job_id} adopted the result of identical job {leader_id}")
+                return True
+            if status in TERMINAL_STATUSES:
+                return False
+            if watch.wait(1.0):
+                last_change = time.monotonic()
+            elif time.monotonic() - last_change > JOB_MAX_RUN_SECONDS:
+                # The leader's worker is gone: reap it (but not this job, which
+                # has been idle as long) so a follower takes over
+                sspi_scoring_jobs.set_fields(job.job_id, message=job.message)
+                sspi_scoring_jobs.reap_stalled(JOB_MAX_RUN_SECONDS)
+                last_change = time.monotonic()
+    finally:
+        watch.close()
 
 
 # =============================================================================
@@ -838,24 +967,49 @@ def _terminal_event(status: JobStatus, doc: dict) -> tuple[str, dict] | None:
     return None
 
 
-def generate_sse_events(job_id: str, timeout: float = 300.0, poll_interval: float = 0.5):
+def generate_sse_events(
+    job_id: str,
+    timeout: float = 300.0,
+    poll_interval: float = 0.5,
+    heartbeat_interval: float = 15.0,
+    min_read_interval: float = 0.25,
+):
     """
-    Generator for SSE events from a scoring job, polling the Mongo job document.
+    Generator for SSE events from a scoring job stored in Mongo.
 
     Because job state lives in Mongo (not a per-process queue), this works
     regardless of which worker is serving the SSE request or running the
     pipeline thread (#893). The wire format is identical to the previous
     queue-based implementation so the frontend needs no change.
 
+    Between reads the generator blocks on a JobWatch (a change stream where
+    the server supports one, else a poll of the job's update stamp), so it
+    wakes as soon as the job changes and reads nothing while the job is
+    idle. Each read fetches only the events it has not yet streamed.
+
     Args:
         job_id: Job ID to stream events for
         timeout: Maximum time to stream (seconds)
-        poll_interval: Seconds between Mongo polls
+        poll_interval: Seconds between update-stamp polls when change streams
+            are unavailable
+        heartbeat_interval: Seconds of inactivity before a heartbeat comment
+        min_read_interval: Minimum seconds between reads of the job, which
+            coalesces bursts of high-frequency progress updates
 
     Yields:
         SSE-formatted event strings
     """
-    doc = sspi_scoring_jobs.get(job_id)
+    watch = sspi_scoring_jobs.watch_job(job_id, poll_interval=poll_interval)
+    try:
+        yield from _stream_job_events(
+            job_id, watch, timeout, heartbeat_interval, min_read_interval
+        )
+    finally:
+        watch.close()
+
+
+def _stream_job_events(job_id, watch, timeout, heartbeat_interval, min_read_interval):
+    doc = sspi_scoring_jobs.job_state(job_id, last_seq=0)
     if not doc:
         yield f"event: error\ndata: {{\"message\": \"Job not found\", \"code\": \"JOB_NOT_FOUND\"}}\n\n"
         return
@@ -877,30 +1031,17 @@ def generate_sse_events(job_id: str, timeout: float = 300.0, poll_interval: floa
     yield f'event: status\ndata: {json.dumps(status_data)}\n\n'
 
     start_time = time.time()
+    last_read = time.monotonic()
     last_seq = 0
     last_stage_progress = None  # (stage, current, total)
     terminal_emitted = False
 
     while True:
-        # Check timeout
-        if time.time() - start_time > timeout:
-            yield f"event: error\ndata: {{\"message\": \"Stream timeout\", \"code\": \"TIMEOUT\"}}\n\n"
-            return
-
-        doc = sspi_scoring_jobs.get(job_id)
-        if not doc:
-            # Job evicted mid-stream (D2 TTL/sweep)
-            yield f"event: error\ndata: {{\"message\": \"Job not found\", \"code\": \"JOB_NOT_FOUND\"}}\n\n"
-            return
-
-        progressed = False
-
         # Drain newly appended events in seq order
         for event in doc.get("events", []):
             if event["seq"] <= last_seq:
                 continue
             last_seq = event["seq"]
-            progressed = True
             yield _format_sse_event(event["event_type"], event["data"])
             if event["event_type"] in ("complete", "error"):
                 terminal_emitted = True
@@ -920,7 +1061,6 @@ def generate_sse_events(job_id: str, timeout: float = 300.0, poll_interval: floa
             and stage_progress != last_stage_progress
         ):
             last_stage_progress = stage_progress
-            progressed = True
             yield _format_sse_event("stage_progress", {
                 "stage": stage_progress[0],
                 "current": stage_progress[1],
@@ -936,11 +1076,26 @@ def generate_sse_events(job_id: str, timeout: float = 300.0, poll_interval: floa
                 yield _format_sse_event(*terminal)
             return
 
-        if not progressed:
-            # Heartbeat to keep the connection alive while idle
+        # Block until the job changes, with a heartbeat to keep the
+        # connection alive while idle
+        while True:
+            remaining = timeout - (time.time() - start_time)
+            if remaining <= 0:
+                yield f"event: error\ndata: {{\"message\": \"Stream timeout\", \"code\": \"TIMEOUT\"}}\n\n"
+                return
+            if watch.wait(min(heartbeat_interval, remaining)):
+                break
             yield ": heartbeat\n\n"
 
-        time.sleep(poll_interval)
+        wait = min_read_interval - (time.monotonic() - last_read)
+        if wait > 0:
+            time.sleep(wait)
+        last_read = time.monotonic()
+        doc = sspi_scoring_jobs.job_state(job_id, last_seq)
+        if not doc:
+            # Job evicted mid-stream (D2 TTL/sweep)
+            yield f"event: error\ndata: {{\"message\": \"Job not found\", \"code\": \"JOB_NOT_FOUND\"}}\n\n"
+            return
 
 
 def _format_sse_event(event_type: str, data: dict) -> str:
@@ -0,0 +1,116 @@
+"""
+Out-of-process pool for running queued custom scoring jobs.
+
+With SCORING_WORKER_MODE=queue, web workers only insert scoring jobs (with
+their metadata and actions) into sspi_scoring_jobs. run_worker claims PENDING
+jobs with an atomic find_one_and_update and runs each pipeline in a process
+pool sized to the machine's cores, so heavy NumPy scoring never competes with
+request handling for a gunicorn worker's GIL.
+
+While a job runs, the worker heartbeats it (stamps updated_at) so that
+reap_stalled leaves it alone; if the worker dies, its jobs stop being
+stamped and are reaped to ERROR like jobs of a dead web worker. Jobs running
+past JOB_MAX_RUN_SECONDS are no longer heartbeated, so hung pipelines are
+still reaped.
+"""
+
+import logging
+import multiprocessing
+import os
+import signal
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from sspi_flask_app.api.resources.scoring_tasks import (
+    JOB_MAX_RUN_SECONDS,
+    run_claimed_job,
+)
+from sspi_flask_app.models.database import sspi_scoring_jobs
+
+log = logging.getLogger(__name__)
+
+WORKER_POLL_INTERVAL = 1.0
+WORKER_HEARTBEAT_INTERVAL = 30.0
+
+
+def worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def ignore_interrupt():
+    """
+    Pool process initializer: Ctrl-C reaches the whole process group, so
+    pool processes ignore SIGINT and leave shutdown to the parent
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+
+def run_worker(
+    max_workers: int | None = None,
+    poll_interval: float = WORKER_POLL_INTERVAL,
+    heartbeat_interval: float = WORKER_HEARTBEAT_INTERVAL,
+    max_jobs: int | None = None,
+):
+    """
+    Claim and run queued scoring jobs until interrupted (SIGINT/SIGTERM), or
+    until max_jobs jobs have been claimed and have finished.
+
+    At most max_workers (default: one per core) pipelines run at once; the
+    queue is only polled while a process is free, so unclaimed jobs stay
+    PENDING for other workers to pick up. On SIGINT or SIGTERM no new jobs are
+    claimed and running jobs are allowed to finish.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    name = worker_id()
+    stopping = False
+
+    def stop(signum, frame):
+        nonlocal stopping
+        stopping = True
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+    # Pool processes import the app afresh rather than forking this process's
+    # Mongo client
+    executor = ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"),
+        initializer=ignore_interrupt
+    )
+    running = {}
+    claimed = 0
+    last_heartbeat = time.monotonic()
+    log.info(f"Scoring worker {name} started with {max_workers} processes")
+    try:
+        while True:
+            for job_id, (future, _) in list(running.items()):
+                if future.done():
+                    del running[job_id]
+                    if future.exception() is not None:
+                        log.error(f"Scoring job {job_id} failed: {future.exception()}")
+            if max_jobs is not None and claimed >= max_jobs:
+                stopping = True
+            if stopping and not running:
+                break
+            while not stopping and len(running) < max_workers:
+                document = sspi_scoring_jobs.claim_pending(name)
+                if document is None:
+                    break
+                job_id = document["job_id"]
+                running[job_id] = (executor.submit(run_claimed_job, job_id), time.monotonic())
+                claimed += 1
+                log.info(f"Claimed scoring job {job_id}")
+                if max_jobs is not None and claimed >= max_jobs:
+                    break
+            now = time.monotonic()
+            if now - last_heartbeat >= heartbeat_interval:
+                sspi_scoring_jobs.heartbeat(name, [
+                    job_id for job_id, (_, started) in running.items()
+                    if now - started < JOB_MAX_RUN_SECONDS
+                ])
+                last_heartbeat = now
+            time.sleep(poll_interval)
+    finally:
+        executor.shutdown(wait=True)
+    log.info(f"Scoring worker {name} stopped after claiming {claimed} jobs")
+    return claimed
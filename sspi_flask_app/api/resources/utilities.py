@@ -1,9 +1,13 @@
+import csv
 import inspect
+import io
 import json
 import math
+import numbers
 from copy import deepcopy
-from typing import Callable, List, Tuple
+from typing import Callable, Iterable, Iterator, List, Tuple
 
+import numpy as np
 import pandas as pd
 import pycountry
 from bson import json_util
@@ -32,7 +36,7 @@ from sspi_flask_app.models.database import (
     sspi_globe_data,
     sspi_dynamic_rank_data
 )
-from sspi_flask_app.models.errors import InvalidDatabaseError
+from sspi_flask_app.models.errors import InvalidDatabaseError, InvalidDocumentFormatError
 
 
 # Accepted numeric types for dataset values (module constant so the tuple is
@@ -154,7 +158,12 @@ def goalpost(value, lower, upper) -> float:
 
     Raises:
         ValueError: If any input is NaN (indicates upstream data quality issue)
+
+    If any argument is a numpy array, the formula is applied elementwise
+    (see goalpost_array) and an array of scores is returned.
     """
+    if any(isinstance(arg, np.ndarray) for arg in (value, lower, upper)):
+        return goalpost_array(value, lower, upper)
     # Fail immediately on NaN - indicates data quality issue
     if math.isnan(value):
         raise ValueError("goalpost() received NaN value - check upstream data")
@@ -177,10 +186,179 @@ def goalpost(value, lower, upper) -> float:
     return max(0.0, min(1.0, normalized))
 
 
+def goalpost_array(value, lower, upper) -> np.ndarray:
+    """
+    Elementwise goalpost over arrays (or a mix of arrays and scalars),
+    producing the same score as goalpost does for each element.
+    """
+    value, lower, upper = np.broadcast_arrays(
+        np.asarray(value, dtype=float),
+        np.asarray(lower, dtype=float),
+        np.asarray(upper, dtype=float),
+    )
+    if np.isnan(value).any():
+        raise ValueError("goalpost() received NaN value - check upstream data")
+    if np.isnan(lower).any() or np.isnan(upper).any():
+        raise ValueError("goalpost() received NaN goalpost bounds")
+    # Match float arithmetic: overflow, inf - inf and x / 0 produce inf or
+    # NaN here and are resolved below instead of raising
+    with np.errstate(all="ignore"):
+        normalized = (value - lower) / (upper - lower)
+    # fmin ignores NaN, as min(1.0, nan) does in goalpost
+    scores = np.maximum(0.0, np.fmin(1.0, normalized))
+    single = upper == lower
+    if single.any():
+        scores = np.where(
+            single,
+            np.where(value == lower, 0.5, np.where(value > upper, 1.0, 0.0)),
+            scores,
+        )
+    return scores
+
+
 def parse_json(data):
     return json.loads(json_util.dumps(data))
 
 
+def stream_ndjson(documents: Iterable[dict]) -> Iterator[str]:
+    """
+    Serializes documents as newline-delimited JSON, one line per document,
+    as the iterable produces them.
+    """
+    for document in documents:
+        yield json.dumps(document) + "\n"
+
+
+def stream_csv(documents: Iterable[dict], batch_size: int = 1000) -> Iterator[str]:
+    """
+    Serializes documents as CSV in batches of rows without materializing the
+    full result set.
+
+    The layout follows pd.DataFrame(documents).to_csv(): a leading unnamed
+    index column and empty cells for None/NaN. Values are written as they
+    are, not per column dtype: pandas upcasts a column of integers with any
+    None/NaN or float to float64 and writes 1 as 1.0, while stream_csv
+    writes 1. Because the header is written before the rest of the stream is
+    seen, the columns are those of the first document; keys that only appear
+    in later documents are dropped.
+    """
+    buffer = io.StringIO()
+    writer = None
+    for i, document in enumerate(documents):
+        if writer is None:
+            columns = list(document.keys())
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow([""] + columns)
+        writer.writerow([i] + [
+            "" if isinstance(value, float) and math.isnan(value) else value
+            for value in (document.get(column) for column in columns)
+        ])
+        if (i + 1) % batch_size == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+# Column typing for the columnar (Parquet / Arrow IPC) exports. Code columns
+# repeat a handful of values across the whole panel, so they are dictionary
+# encoded; years fit in int16 and scores/values are stored as native doubles.
+COLUMNAR_DICTIONARY_COLUMNS = {
+    "CountryCode", "ItemCode", "DatasetCode", "IndicatorCode", "ItemType", "Unit"
+}
+COLUMNAR_INT16_COLUMNS = {"Year"}
+COLUMNAR_FLOAT64_COLUMNS = {"Score", "Value"}
+
+
+def build_columnar_table(documents: Iterable[dict]):
+    """
+    Builds a pyarrow.Table from an iterable of documents, accumulating values
+    column by column so that no intermediate list of row dictionaries is
+    held. Column order follows first appearance; documents missing a column
+    contribute nulls.
+
+    Nested values (lists and dictionaries, e.g. Datasets or Children) are
+    stored as JSON strings, and columns with mixed scalar types fall back to
+    strings.
+
+    Raises InvalidDocumentFormatError if a typed column holds a value it
+    cannot store exactly: a Year that is not a whole number in the int16
+    range, or a Score/Value that is not a number.
+    """
+    import pyarrow as pa
+    columns = {}
+    n_rows = 0
+    for document in documents:
+        for key in document:
+            if key not in columns:
+                columns[key] = [None] * n_rows
+        for key, values in columns.items():
+            values.append(document.get(key))
+        n_rows += 1
+    arrays = {}
+    for name, values in columns.items():
+        if name in COLUMNAR_INT16_COLUMNS:
+            values = [_columnar_int16(name, v) for v in values]
+            arrays[name] = pa.array(values, type=pa.int16())
+            continue
+        if name in COLUMNAR_FLOAT64_COLUMNS:
+            for value in values:
+                _check_columnar_number(name, value)
+            arrays[name] = pa.array(values, type=pa.float64(), from_pandas=True)
+            continue
+        if any(isinstance(v, (dict, list)) for v in values):
+            values = [None if v is None else json.dumps(v, default=str) for v in values]
+        try:
+            array = pa.array(values)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            array = pa.array([None if v is None else str(v) for v in values])
+        if name in COLUMNAR_DICTIONARY_COLUMNS and pa.types.is_string(array.type):
+            array = array.dictionary_encode()
+        arrays[name] = array
+    return pa.table(arrays)
+
+
+def _check_columnar_number(name: str, value) -> None:
+    if value is None:
+        return
+    if isinstance(value, bool) or not isinstance(value, numbers.Real):
+        raise InvalidDocumentFormatError(
+            f"Column '{name}' must be numeric; found {type(value).__name__} value {value!r}"
+        )
+
+
+def _columnar_int16(name: str, value):
+    """
+    Returns value as an int for an int16 column, rejecting values that
+    pyarrow would otherwise truncate (2000.5 -> 2000) or fail on.
+    """
+    if value is None:
+        return None
+    _check_columnar_number(name, value)
+    if not float(value).is_integer() or not -2**15 <= value < 2**15:
+        raise InvalidDocumentFormatError(
+            f"Column '{name}' must hold whole numbers between {-2**15} and {2**15 - 1}; found {value!r}"
+        )
+    return int(value)
+
+
+def serialize_columnar_table(table, file_format: str) -> io.BytesIO:
+    """
+    Writes the table to an in-memory Parquet file or Arrow IPC file.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    mem = io.BytesIO()
+    if file_format == "parquet":
+        pq.write_table(table, mem, compression="zstd")
+    else:
+        with pa.ipc.new_file(mem, table.schema) as writer:
+            writer.write_table(table)
+    mem.seek(0)
+    return mem
+
+
 def lookup_database(database_name):
     """
     Utility function used for safe database lookup
@@ -266,6 +444,7 @@ def score_indicator(
     score_function: Callable,
     unit: str | Callable,
     compute_series_specification: List[Tuple] = [],
+    columnar: bool = False,
 ):
     """
     Utility function for computing indicator scores documents into indicator documents
@@ -279,7 +458,14 @@ def score_indicator(
     :param computed_datasets: List of length 2 tuples, where the first element is a
     string for the dataset code to be computed, and the second element is a function
     that takes the same arguments as the score_function and returns a float.
+    :param columnar: If True, score with score_indicator_columnar, which
+    evaluates the score function on whole arrays and returns the same lists.
     """
+    if columnar:
+        return score_indicator_columnar(
+            dataset_document_list, indicator_code, score_function, unit,
+            compute_series_specification,
+        )
     dataset_document_list = convert_data_types(dataset_document_list)
     sspi_clean_api_data.validate_dataset_list(dataset_document_list)
     dataset_document_list, noneish_list = drop_none_or_na(dataset_document_list)
@@ -291,6 +477,171 @@ def score_indicator(
     return filter_incomplete_data(scored_indicator_document_list)
 
 
+def score_indicator_columnar(
+    dataset_document_list: list[dict],
+    indicator_code: str,
+    score_function: Callable,
+    unit: str | Callable,
+    compute_series_specification: List[Tuple] = [],
+):
+    """
+    Columnar implementation of score_indicator with the same arguments and
+    the same (scored, incomplete) output.
+
+    Dataset values are pivoted into one array per DatasetCode over the
+    country-year observations, and the score function and each computed
+    series are called once on whole arrays. Functions built from arithmetic
+    and goalpost vectorize; anything else (branches, min/max, math.*, a
+    result that differs from a scalar call) is detected and evaluated per
+    observation exactly as score_indicator does, exceptions included.
+    """
+    dataset_document_list = convert_data_types(dataset_document_list)
+    sspi_clean_api_data.validate_dataset_list(dataset_document_list)
+    dataset_document_list, noneish_list = drop_none_or_na(dataset_document_list)
+    indicator_list = []
+    row_index = {}
+    column_values = {}
+    for document in dataset_document_list:
+        key = (document["CountryCode"], document["Year"])
+        row = row_index.get(key)
+        if row is None:
+            row = row_index[key] = len(indicator_list)
+            indicator_list.append({
+                "IndicatorCode": indicator_code,
+                "CountryCode": document["CountryCode"],
+                "Year": document["Year"],
+                "Datasets": [],
+            })
+        indicator_list[row]["Datasets"].append(document)
+        column_values.setdefault(document["DatasetCode"], {})[row] = document["Value"]
+    panel = ColumnarPanel(len(indicator_list))
+    for dataset_code, values in column_values.items():
+        panel.set_column(dataset_code, values)
+    for series_code, series_unit, value_function in compute_series_specification:
+        arg_name_list = list(inspect.signature(value_function).parameters.keys())
+        value_function_source = str(inspect.getsource(value_function)).strip()
+        rows = panel.complete_rows(arg_name_list)
+        values = panel.evaluate(value_function, arg_name_list, rows)
+        if values is None:
+            computed = {}
+            for row in rows.tolist():
+                try:
+                    computed[row] = value_function(
+                        *row_arguments(indicator_list[row], arg_name_list)
+                    )
+                except Exception:
+                    pass
+        else:
+            computed = dict(zip(rows.tolist(), values))
+        for row, value in computed.items():
+            indicator_list[row]["Datasets"].append({
+                "DatasetCode": series_code,
+                "CountryCode": indicator_list[row]["CountryCode"],
+                "Year": indicator_list[row]["Year"],
+                "Value": value,
+                "Unit": series_unit,
+                "ValueFunction": value_function_source,
+                "Computed": True,
+            })
+        panel.set_column(series_code, computed)
+    arg_name_list = list(inspect.signature(score_function).parameters.keys())
+    rows = panel.complete_rows(arg_name_list).tolist()
+    scores = panel.evaluate(score_function, arg_name_list, np.asarray(rows, dtype=np.intp))
+    for i, row in enumerate(rows):
+        document = indicator_list[row]
+        if scores is None or not isinstance(unit, str):
+            arg_value_list = row_arguments(document, arg_name_list)
+        score = score_function(*arg_value_list) if scores is None else scores[i]
+        if isinstance(unit, str):
+            document["Unit"] = unit
+        elif isinstance(unit, Callable):
+            document["Unit"] = unit(*arg_value_list)
+        document["Score"] = score
+    return filter_incomplete_data(indicator_list)
+
+
+class ColumnarPanel:
+    """
+    Dataset values of the country-year observations being scored, one float
+    array per DatasetCode, for score_indicator_columnar.
+
+    Alongside the values it tracks which observations have each dataset,
+    which observations have only numeric values (score_indicator skips the
+    others), and whether every value of a column is a float, so that array
+    arithmetic matches the scalar arithmetic on the original values.
+    """
+
+    def __init__(self, n_rows: int):
+        self.n_rows = n_rows
+        self.values = {}
+        self.present = {}
+        self.exact = {}
+        self.numeric = np.ones(n_rows, dtype=bool)
+
+    def set_column(self, dataset_code: str, row_values: dict[int, object]):
+        if dataset_code not in self.values:
+            self.values[dataset_code] = np.full(self.n_rows, np.nan)
+            self.present[dataset_code] = np.zeros(self.n_rows, dtype=bool)
+            self.exact[dataset_code] = True
+        for row, value in row_values.items():
+            self.present[dataset_code][row] = True
+            if type(value) is float:
+                self.values[dataset_code][row] = value
+                continue
+            self.exact[dataset_code] = False
+            if type(value) in _NUMERIC_TYPES:
+                self.values[dataset_code][row] = value
+            else:
+                self.numeric[row] = False
+
+    def complete_rows(self, arg_name_list: list[str]) -> np.ndarray:
+        """
+        Rows with only numeric values and a value for every argument
+        """
+        mask = self.numeric.copy()
+        for arg in arg_name_list:
+            if arg not in self.present:
+                return np.array([], dtype=np.intp)
+            mask &= self.present[arg]
+        return np.flatnonzero(mask)
+
+    def evaluate(self, function: Callable, arg_name_list: list[str], rows: np.ndarray):
+        """
+        Call function once on the argument arrays restricted to rows and
+        return its results as a list of floats, or None if the call does not
+        vectorize: it raises (numpy floating point errors included), does
+        not return one float per row, or disagrees with a scalar call on the
+        first row.
+        """
+        if len(rows) == 0:
+            return []
+        if not all(self.exact[arg] for arg in arg_name_list):
+            return None
+        arg_arrays = [self.values[arg][rows] for arg in arg_name_list]
+        try:
+            with np.errstate(divide="raise", invalid="raise", over="raise", under="ignore"):
+                result = function(*arg_arrays)
+            probe = function(*[array[0].item() for array in arg_arrays])
+        except Exception:
+            return None
+        if not isinstance(result, np.ndarray) or result.dtype != np.float64:
+            return None
+        if result.shape != (len(rows),) or type(probe) is not float:
+            return None
+        values = result.tolist()
+        if probe != values[0] and not (math.isnan(probe) and math.isnan(values[0])):
+            return None
+        return values
+
+
+def row_arguments(indicator_document: dict, arg_name_list: list[str]) -> list:
+    arg_value_dict = {
+        dataset["DatasetCode"]: dataset.get("Value", None)
+        for dataset in indicator_document["Datasets"]
+    }
+    return [arg_value_dict[arg] for arg in arg_name_list]
+
+
 def convert_data_types(document_list):
     """
     Utility function for converting data types in clean documents
@@ -645,6 +996,143 @@ def interpolate_linear(
     return copied_doc_list
 
 
+def extrapolate_and_interpolate(
+    doc_list: list[dict],
+    backward_year: int | None = None,
+    forward_year: int | None = None,
+    series_id=["CountryCode", "IndicatorCode"],
+    interpolate=True,
+    impute_only=False,
+):
+    """
+    Backward extrapolation, forward extrapolation and linear interpolation in
+    a single pass, producing the same documents in the same order as
+    chaining extrapolate_backward, extrapolate_forward and interpolate_linear.
+
+    Series are grouped once and their gaps are located with array arithmetic
+    over the sorted years. Only the imputed documents are created, as shallow
+    copies of their reference document (nested values are shared with it),
+    and the input documents are returned as they are rather than deep copied.
+
+    :param doc_list: list of dicts with keys including 'Year' and series identifiers
+    :param backward_year: earliest year to extrapolate to (None to skip)
+    :param forward_year: latest year to extrapolate to (None to skip)
+    :param series_id: keys identifying a unique series (default: CountryCode, IndicatorCode)
+    :param interpolate: if False, skip linear interpolation
+    :param impute_only: if True, only return imputed values, excluding original data
+    """
+    if not doc_list:
+        return []
+    series_index = {}
+    series_codes = np.empty(len(doc_list), dtype=np.intp)
+    for i, document in enumerate(doc_list):
+        series_key = tuple(document[id_key] for id_key in series_id)
+        series_codes[i] = series_index.setdefault(series_key, len(series_index))
+    years = np.array([document["Year"] for document in doc_list], dtype=np.int64)
+    # Series in order of first appearance, years ascending, ties in input order
+    order = np.lexsort((years, series_codes))
+    sorted_series = series_codes[order]
+    sorted_years = years[order]
+    same_series = sorted_series[1:] == sorted_series[:-1]
+    starts = np.flatnonzero(np.r_[True, ~same_series])
+    ends = np.r_[starts[1:], len(order)]
+    imputations = []
+    if backward_year is not None:
+        first_years = sorted_years[starts]
+        counts = np.maximum(first_years - backward_year, 0)
+        offsets = group_offsets(counts)
+        refs = np.repeat(order[starts], counts)
+        missing_years = backward_year + offsets
+        distances = np.repeat(first_years, counts) - missing_years
+        for ref, year, distance in zip(
+            refs.tolist(), missing_years.tolist(), distances.tolist()
+        ):
+            imputations.append({
+                **doc_list[ref],
+                "Year": year,
+                "Imputed": True,
+                "ImputationMethod": "Backward Extrapolation",
+                "ImputationDistance": distance,
+            })
+    if forward_year is not None:
+        last_years = sorted_years[ends - 1]
+        counts = np.maximum(forward_year - last_years, 0)
+        offsets = group_offsets(counts)
+        refs = np.repeat(order[ends - 1], counts)
+        missing_years = np.repeat(last_years, counts) + offsets + 1
+        distances = offsets + 1
+        for ref, year, distance in zip(
+            refs.tolist(), missing_years.tolist(), distances.tolist()
+        ):
+            imputations.append({
+                **doc_list[ref],
+                "Year": year,
+                "Imputed": True,
+                "ImputationMethod": "Forward Extrapolation",
+                "ImputationDistance": distance,
+            })
+    if interpolate:
+        # Interior gaps lie between consecutive distinct years of a series:
+        # the earlier document is the last of its year, the later the first
+        gap_mask = same_series & (np.diff(sorted_years) > 1)
+        prev_docs = order[:-1][gap_mask]
+        next_docs = order[1:][gap_mask]
+        has_values = np.array([
+            "Value" in doc_list[p] and "Value" in doc_list[n]
+            for p, n in zip(prev_docs.tolist(), next_docs.tolist())
+        ], dtype=bool)
+        prev_docs = prev_docs[has_values]
+        next_docs = next_docs[has_values]
+        prev_years = years[prev_docs]
+        next_years = years[next_docs]
+        counts = next_years - prev_years - 1
+        offsets = group_offsets(counts)
+        prev_years = np.repeat(prev_years, counts)
+        next_years = np.repeat(next_years, counts)
+        refs = np.repeat(prev_docs, counts)
+        missing_years = prev_years + offsets + 1
+        distances = np.minimum(missing_years - prev_years, next_years - missing_years)
+        prev_values = [doc_list[i]["Value"] for i in prev_docs.tolist()]
+        next_values = [doc_list[i]["Value"] for i in next_docs.tolist()]
+        if all(type(v) in _NUMERIC_TYPES for v in prev_values + next_values):
+            prev_values = np.repeat(np.array(prev_values, dtype=float), counts)
+            next_values = np.repeat(np.array(next_values, dtype=float), counts)
+            with np.errstate(all="ignore"):
+                slopes = (next_values - prev_values) / (next_years - prev_years)
+                values = (prev_values + slopes * (missing_years - prev_years)).tolist()
+        else:
+            # Same arithmetic on the original values, errors included
+            values = []
+            for i, count in enumerate(counts.tolist()):
+                prev_value, next_value = prev_values[i], next_values[i]
+                prev_year = int(years[prev_docs[i]])
+                slope = (next_value - prev_value) / (int(years[next_docs[i]]) - prev_year)
+                values.extend(prev_value + slope * (k + 1) for k in range(count))
+        for ref, year, value, distance in zip(
+            refs.tolist(), missing_years.tolist(), values, distances.tolist()
+        ):
+            imputations.append({
+                **doc_list[ref],
+                "Year": year,
+                "Value": value,
+                "Imputed": True,
+                "ImputationMethod": "Linear Interpolation",
+                "ImputationDistance": distance,
+            })
+    if impute_only:
+        return imputations
+    return list(doc_list) + imputations
+
+
+def group_offsets(counts: np.ndarray) -> np.ndarray:
+    """
+    0, 1, ..., count - 1 for each count, concatenated
+    """
+    total = int(counts.sum())
+    starts = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.arange(total) - starts
+
+
 def generate_series_levels(
     data: list[dict],
     entity_id="",
@@ -1,3 +1,5 @@
+from functools import cached_property
+
 from sspi_flask_app.models.database import (
     sspi_metadata,
     sspi_indicator_data,
@@ -6,6 +8,10 @@ from sspi_flask_app.models.database import (
     sspi_incomplete_indicator_data,
     sspi_clean_api_data
 )
+from sspi_flask_app.models.database.coverage_index import (
+    mask_years,
+    year_range_mask,
+)
 
 
 class DataCoverage:
@@ -31,63 +37,62 @@ class DataCoverage:
         self.indicator_codes = [
             indicator["ItemCode"] for indicator in self.indicator_details
         ]
-        self.clean_data_coverage = self.get_coverage(sspi_indicator_data)
-        self.imputed_data_coverage = self.get_coverage(sspi_imputed_data)
-        self.combined_coverage = self.union(
-            self.clean_data_coverage, self.imputed_data_coverage
+        self.clean_data_masks = sspi_indicator_data.coverage_masks(self.indicator_codes)
+        self.imputed_data_masks = sspi_imputed_data.coverage_masks(self.indicator_codes)
+        self.combined_masks = self.union_masks(
+            self.clean_data_masks, self.imputed_data_masks
         )
+        self.required_mask = year_range_mask(min_year, max_year)
+
+    @cached_property
+    def clean_data_coverage(self):
+        return self.get_coverage(self.clean_data_masks)
+
+    @cached_property
+    def imputed_data_coverage(self):
+        return self.get_coverage(self.imputed_data_masks)
+
+    @cached_property
+    def combined_coverage(self):
+        return self.get_coverage(self.combined_masks)
 
-    def get_coverage(self, database):
+    def get_coverage(self, masks: dict):
         """
-        Get the Year Coverage at the Indicator and Year Level
-        :param database: The database to query
+        Get the Year Coverage at the Indicator and Year Level as sorted year
+        lists (from min_year on)
+        :param masks: Year masks by IndicatorCode and CountryCode, as returned
+        by coverage_masks or union_masks
         """
-        pipeline = [
-            {
-                "$group": {
-                    "_id": {
-                        "IndicatorCode": "$IndicatorCode",
-                        "CountryCode": "$CountryCode",
-                    },
-                    "yearList": {
-                        "$addToSet": {
-                            "$cond": [
-                                {"$gte": ["$Year", self.min_year]},
-                                "$Year",
-                                "$$REMOVE",
-                            ]
-                        }
-                    },
-                }
-            }
-        ]
-        result = database.aggregate(pipeline)
-        nested_dict = {}
-        for entry in result:
-            ind = entry["_id"]["IndicatorCode"]
-            ctry = entry["_id"]["CountryCode"]
-            years = sorted(entry["yearList"])
-            nested_dict.setdefault(ind, {})[ctry] = years
-        return nested_dict
+        return {
+            ind: {ctry: mask_years(mask, self.min_year) for ctry, mask in countries.items()}
+            for ind, countries in masks.items()
+        }
 
-    def union(self, cov_dict1: dict, cov_dict2: dict):
+    def union_masks(self, masks1: dict, masks2: dict):
         """
-        Compute the union of two coverage dictionaries to find their combined
-        coverage
-        :param cov_dict1: The first coverage dictionary (output format of get_coverage)
-        :param cov_dict2: The second coverage dictionary (output format of get_coverage)
+        Compute the combined year masks of two mask dictionaries over the
+        indicator and country codes of this coverage
         """
         merged = {}
         for ind_code in self.indicator_codes:
-            merged.setdefault(ind_code, {})
-            countries1 = cov_dict1.get(ind_code, {})
-            countries2 = cov_dict2.get(ind_code, {})
-            for ctry_code in self.country_codes:
-                years1 = set(countries1.get(ctry_code, []))
-                years2 = set(countries2.get(ctry_code, []))
-                merged[ind_code][ctry_code] = sorted(years1.union(years2))
+            countries1 = masks1.get(ind_code, {})
+            countries2 = masks2.get(ind_code, {})
+            merged[ind_code] = {
+                ctry_code: countries1.get(ctry_code, 0) | countries2.get(ctry_code, 0)
+                for ctry_code in self.country_codes
+            }
         return merged
 
+    def check_complete_mask(self, country_masks: dict):
+        """
+        Check whether every country has every year from min_year to max_year
+        :param country_masks: Year masks by CountryCode for a given indicator
+        """
+        required = self.required_mask
+        return all(
+            country_masks[cou] & required == required for cou in self.country_codes
+        )
+
     def check_complete_country(self, year_list):
         """
         Check whether the coverage is complete for a given country
@@ -114,27 +119,25 @@ class DataCoverage:
     def complete(self):
         complete_list = []
         for indicator in self.indicator_codes:
-            if indicator not in self.combined_coverage.keys():
+            if indicator not in self.combined_masks:
                 continue
-            country_year_dict = self.combined_coverage[indicator]
-            if self.check_complete_indicator(country_year_dict):
+            if self.check_complete_mask(self.combined_masks[indicator]):
                 complete_list.append(indicator)
         return complete_list
 
     def incomplete(self):
         incomplete_list = []
         for indicator in self.indicator_codes:
-            if indicator not in self.combined_coverage.keys():
+            if indicator not in self.combined_masks:
                 continue
-            country_year_dict = self.combined_coverage[indicator]
-            if not self.check_complete_indicator(country_year_dict):
+            if not self.check_complete_mask(self.combined_masks[indicator]):
                 incomplete_list.append(indicator)
         return incomplete_list
 
     def unimplemented(self):
         unimplemented_list = []
         for indicator in self.indicator_codes:
-            if indicator not in self.combined_coverage.keys():
+            if indicator not in self.combined_masks:
                 unimplemented_list.append(indicator)
         return unimplemented_list
 
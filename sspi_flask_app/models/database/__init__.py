@@ -55,6 +55,9 @@ from sspi_flask_app.models.database.sspi_custom_item_data import (
 from sspi_flask_app.models.database.sspi_scoring_jobs import (
     SSPIScoringJobs
 )
+from sspi_flask_app.models.database.sspi_build_state import (
+    SSPIBuildState
+)
 
 logging.getLogger("pymongo").setLevel(logging.WARNING)
 
@@ -82,7 +85,7 @@ sspi_item_data = SSPIItemData(
     sspidb.sspi_item_data
 )
 sspi_clean_api_data = SSPICleanAPIData(
-    sspidb.sspi_clean_api_data
+    sspidb.sspi_clean_api_data, raw_data=sspi_raw_api_data
 )
 sspi_indicator_data = SSPIIndicatorData(
     sspidb.sspi_indicator_data
@@ -160,3 +163,8 @@ sspi_custom_item_data = SSPICustomItemData(
 sspi_scoring_jobs = SSPIScoringJobs(
     sspidb.sspi_scoring_jobs
 )
+
+# Build State (input digests of the nodes built by the build orchestrator)
+sspi_build_state = SSPIBuildState(
+    sspidb.sspi_build_state
+)
@@ -0,0 +1,182 @@
+from sspi_flask_app.models.database.mongo_wrapper import MongoWrapper
+
+# Bit 0 of a year mask is this year; Years are validated to lie after it
+YEAR_MASK_BASE = 1900
+
+
+def year_mask(years) -> int:
+    mask = 0
+    for year in years:
+        if isinstance(year, int) and year >= YEAR_MASK_BASE:
+            mask |= 1 << (year - YEAR_MASK_BASE)
+    return mask
+
+
+def year_range_mask(min_year: int, max_year: int) -> int:
+    """
+    Mask with the bits of min_year through max_year (inclusive) set
+    """
+    if max_year < min_year:
+        return 0
+    return ((1 << (max_year - min_year + 1)) - 1) << (min_year - YEAR_MASK_BASE)
+
+
+def mask_years(mask: int, min_year: int = YEAR_MASK_BASE) -> list[int]:
+    """
+    Sorted list of the years set in mask, from min_year on
+    """
+    years = []
+    offset = max(min_year - YEAR_MASK_BASE, 0)
+    mask >>= offset
+    while mask:
+        if mask & 1:
+            years.append(YEAR_MASK_BASE + offset)
+        mask >>= 1
+        offset += 1
+    return years
+
+
+def indicator_codes_in_query(query: dict) -> list[str] | None:
+    """
+    The IndicatorCodes a query is restricted to, or None if it may match
+    documents of any indicator
+    """
+    code = query.get("IndicatorCode")
+    if isinstance(code, str):
+        return [code]
+    if isinstance(code, dict) and set(code) == {"$in"} and isinstance(code["$in"], list):
+        return code["$in"]
+    return None
+
+
+class CoverageIndexedData(MongoWrapper):
+    """
+    A MongoWrapper for indicator-level documents (IndicatorCode, CountryCode,
+    Year) that maintains a coverage index in a companion collection, one
+    document per indicator:
+        {
+            "IndicatorCode": "BIODIV",
+            "Version": int,
+            "BuiltVersion": int,
+            "Countries": {"AUS": "<hex year mask>", ...}
+        }
+    Each year mask has bit (Year - YEAR_MASK_BASE) set when the collection
+    holds a document for that indicator, country and year.
+
+    Writes through insert_many/insert_one/delete_many/delete_one bump the
+    Version of the indicators they touch; coverage_masks rebuilds an
+    indicator's masks (with a $group filtered to the stale indicators) only
+    when its BuiltVersion lags its Version. A rebuild racing a write records
+    the Version read before aggregating, so it can only leave the indicator
+    stale, never falsely fresh.
+    """
+
+    def __init__(self, mongo_database):
+        super().__init__(mongo_database)
+        self._coverage_collection = mongo_database.database[f"{self.name}_coverage"]
+
+    def insert_one(self, document: dict) -> int:
+        count = super().insert_one(document)
+        self.mark_coverage_stale([document.get("IndicatorCode")])
+        return count
+
+    def insert_many(self, documents: list) -> int:
+        count = super().insert_many(documents)
+        if count:
+            self.mark_coverage_stale(
+                list(dict.fromkeys(document.get("IndicatorCode") for document in documents))
+            )
+        return count
+
+    def delete_one(self, query: dict) -> int:
+        count = super().delete_one(query)
+        if count:
+            self.mark_coverage_stale(indicator_codes_in_query(query))
+        return count
+
+    def delete_many(self, query: dict) -> int:
+        count = super().delete_many(query)
+        if count:
+            self.mark_coverage_stale(indicator_codes_in_query(query))
+        return count
+
+    def mark_coverage_stale(self, indicator_codes: list[str] | None = None):
+        """
+        Bump the Version of indicator_codes, or of every indexed indicator if
+        None, so that their masks are rebuilt on the next read
+        """
+        if indicator_codes is None:
+            self._coverage_collection.update_many({}, {"$inc": {"Version": 1}})
+            return
+        for indicator_code in indicator_codes:
+            self._coverage_collection.update_one(
+                {"IndicatorCode": indicator_code},
+                {"$inc": {"Version": 1}},
+                upsert=True,
+            )
+
+    def coverage_masks(self, indicator_codes: list[str]) -> dict[str, dict[str, int]]:
+        """
+        Return the year mask of each country with data for each of the
+        indicator_codes, rebuilding the masks of stale indicators first:
+            {IndicatorCode: {CountryCode: mask}}
+        """
+        state = {
+            document["IndicatorCode"]: document
+            for document in self._coverage_collection.find(
+                {"IndicatorCode": {"$in": indicator_codes}}, {"_id": 0}
+            )
+        }
+        stale = {}
+        for indicator_code in indicator_codes:
+            document = state.get(indicator_code, {})
+            version = document.get("Version", 0)
+            if "Countries" not in document or document.get("BuiltVersion") != version:
+                stale[indicator_code] = version
+        masks = self.rebuild_coverage(stale) if stale else {}
+        for indicator_code in indicator_codes:
+            if indicator_code not in masks:
+                masks[indicator_code] = {
+                    country_code: int(mask, 16)
+                    for country_code, mask in state[indicator_code]["Countries"].items()
+                }
+        return masks
+
+    def rebuild_coverage(self, versions: dict[str, int]) -> dict[str, dict[str, int]]:
+        """
+        Recompute and store the masks of the indicators in versions, each
+        recorded as built at the Version read before the rebuild
+        """
+        masks = {indicator_code: {} for indicator_code in versions}
+        pipeline = [
+            {"$match": {"IndicatorCode": {"$in": list(versions)}}},
+            {
+                "$group": {
+                    "_id": {
+                        "IndicatorCode": "$IndicatorCode",
+                        "CountryCode": "$CountryCode",
+                    },
+                    "yearList": {"$addToSet": "$Year"},
+                }
+            },
+        ]
+        for entry in self._mongo_database.aggregate(pipeline):
+            indicator_code = entry["_id"]["IndicatorCode"]
+            country_code = entry["_id"]["CountryCode"]
+            masks[indicator_code][country_code] = year_mask(entry["yearList"])
+        for indicator_code, version in versions.items():
+            self._coverage_collection.update_one(
+                {"IndicatorCode": indicator_code},
+                {
+                    "$set": {
+                        "BuiltVersion": version,
+                        "Countries": {
+                            country_code: format(mask, "x")
+                            for country_code, mask in masks[indicator_code].items()
+                        },
+                    },
+                    "$setOnInsert": {"Version": version},
+                },
+                upsert=True,
+            )
+        return masks
@@ -1,10 +1,34 @@
-import json
 from pymongo import UpdateOne
 from bson import ObjectId, json_util
 from sspi_flask_app.models.errors import InvalidDocumentFormatError
 import math
 
 
+def extended_json_codec(value):
+    """
+    Converts a BSON-decoded value into the same JSON-compatible structure
+    that json.loads(json_util.dumps(value)) produces, without building the
+    intermediate JSON string.
+
+    ObjectIds become {"$oid": ...}, datetimes become {"$date": ...} and
+    non-finite floats become {"$numberDouble": ...} (Relaxed Extended JSON).
+    """
+    if isinstance(value, dict):
+        return {k: extended_json_codec(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [extended_json_codec(v) for v in value]
+    if value is None or isinstance(value, (str, bool, int)):
+        return value
+    if isinstance(value, float) and math.isfinite(value):
+        return value
+    if hasattr(value, "items"):
+        return {k: extended_json_codec(v) for k, v in value.items()}
+    try:
+        return json_util.default(value)
+    except TypeError:
+        return value
+
+
 class MongoWrapper:
     def __init__(self, mongo_database):
         self._mongo_database = mongo_database
@@ -15,15 +39,36 @@ class MongoWrapper:
         doc_count = self._mongo_database.count_documents({})
         return doc_count == 0
 
-    def find_one(self, query: dict, options: dict = {"_id": 0}) -> dict:
-        cursor = self._mongo_database.find_one(query, options)
-        return json.loads(json_util.dumps(cursor))
+    def find_one(self, query: dict, options: dict = {"_id": 0}, codec=extended_json_codec) -> dict:
+        document = self._mongo_database.find_one(query, options)
+        if codec is None or document is None:
+            return document
+        return codec(document)
 
-    def find(self, query: dict, options: dict = {"_id": 0}, limit: int = None) -> list[dict]:
+    def find(self, query: dict, options: dict = {"_id": 0}, limit: int = None, codec=extended_json_codec) -> list[dict]:
+        return list(self.iter_find(query, options, limit=limit, codec=codec))
+
+    def iter_find(self, query: dict, options: dict = {"_id": 0}, limit: int = None, codec=None):
+        """
+        Yields documents straight off the cursor without materializing the
+        full result set.
+
+        By default documents are yielded exactly as decoded from BSON (no
+        serialization step); pass codec=extended_json_codec (or any callable)
+        to convert each document as it is produced.
+        :param query: MongoDB query
+        :param options: MongoDB projection
+        :param limit: Maximum number of documents to yield (None or 0 for all)
+        :param codec: Optional callable applied to each document
+        """
         cursor = self._mongo_database.find(query, options)
         if limit is not None and limit > 0:
             cursor = cursor.limit(limit)
-        return json.loads(json_util.dumps(cursor))
+        if codec is None:
+            yield from cursor
+            return
+        for document in cursor:
+            yield codec(document)
 
     def insert_one(self, document: dict) -> int:
         self.validate_document_format(document)
@@ -53,12 +98,23 @@ class MongoWrapper:
         """
         return self._mongo_database.distinct(field)
 
-    def aggregate(self, pipeline, options={"_id": 0}):
+    def aggregate(self, pipeline, options={"_id": 0}, codec=extended_json_codec):
         """
         Aggregates the data in the collection using the provided pipeline.
         """
+        return list(self.iter_aggregate(pipeline, codec=codec))
+
+    def iter_aggregate(self, pipeline, codec=None):
+        """
+        Yields the results of the aggregation pipeline as the cursor produces
+        them. See iter_find for the semantics of codec.
+        """
         cursor = self._mongo_database.aggregate(pipeline)
-        return json.loads(json_util.dumps(cursor))
+        if codec is None:
+            yield from cursor
+            return
+        for document in cursor:
+            yield codec(document)
 
     def tabulate_ids(self) -> list:
         """
@@ -79,7 +135,7 @@ class MongoWrapper:
                 "ids": {"$push": "$_id"}
             }},
         ])
-        return json.loads(json_util.dumps(tab_ids))
+        return [extended_json_codec(document) for document in tab_ids]
 
     def drop_duplicates(self):
         """
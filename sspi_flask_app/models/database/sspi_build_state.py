@@ -0,0 +1,52 @@
+from datetime import datetime, timezone
+
+from sspi_flask_app.models.database.mongo_wrapper import MongoWrapper
+from sspi_flask_app.models.errors import InvalidDocumentFormatError
+
+
+class SSPIBuildState(MongoWrapper):
+    """
+    Input digests of the nodes built by the build orchestrator, one document
+    per node:
+        {
+            "NodeID": "clean:WB_POPULN",
+            "InputDigest": str,
+            "BuiltAt": datetime,
+            "Seconds": float
+        }
+    A node whose current input digest matches its recorded InputDigest is
+    up to date and is skipped on the next build.
+    """
+
+    def validate_document_format(self, document: dict, document_number: int = 0):
+        if not isinstance(document.get("NodeID"), str):
+            raise InvalidDocumentFormatError(
+                f"'NodeID' must be a str (document {document_number})")
+        if not isinstance(document.get("InputDigest"), str):
+            raise InvalidDocumentFormatError(
+                f"'InputDigest' must be a str (document {document_number})")
+
+    def create_indexes(self):
+        self._mongo_database.create_index("NodeID", unique=True)
+
+    def input_digests(self, node_ids: list[str]) -> dict[str, str]:
+        """
+        Return the recorded InputDigest of each node that has been built
+        """
+        cursor = self._mongo_database.find(
+            {"NodeID": {"$in": node_ids}}, {"_id": 0, "NodeID": 1, "InputDigest": 1}
+        )
+        return {doc["NodeID"]: doc["InputDigest"] for doc in cursor}
+
+    def record(self, node_id: str, input_digest: str, seconds: float):
+        document = {
+            "NodeID": node_id,
+            "InputDigest": input_digest,
+            "BuiltAt": datetime.now(timezone.utc),
+            "Seconds": seconds,
+        }
+        self.validate_document_format(document)
+        self._mongo_database.replace_one({"NodeID": node_id}, document, upsert=True)
+
+    def forget(self, node_id: str) -> int:
+        return self._mongo_database.delete_one({"NodeID": node_id}).deleted_count
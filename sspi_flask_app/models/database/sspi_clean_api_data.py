@@ -5,6 +5,101 @@ from bson import json_util
 
 
 class SSPICleanAPIData(MongoWrapper):
+    def __init__(self, mongo_database, raw_data=None):
+        super().__init__(mongo_database)
+        self._version_collection = mongo_database.database[f"{self.name}_versions"]
+        # The SSPIRawAPIData whose digests record which datasets are cleaned;
+        # deleting clean data marks its datasets as needing a clean again
+        self._raw_data = raw_data
+
+    # Data Versions
+    # Every write bumps the version of the datasets it touches, so callers can
+    # key caches on the data they were computed from. Writes whose datasets
+    # cannot be read off the query bump the collection-wide Generation, which
+    # invalidates everything.
+
+    def data_versions(self, dataset_codes: list[str]) -> dict:
+        """
+        Return the collection Generation and the version of each dataset
+        :param dataset_codes: The datasets to report versions for
+        """
+        document = self._version_collection.find_one({"_id": self.name}) or {}
+        versions = document.get("Datasets", {})
+        return {
+            "Generation": document.get("Generation", 0),
+            "Datasets": {code: versions.get(code, 0) for code in dataset_codes}
+        }
+
+    def bump_data_versions(self, dataset_codes: list[str] | None):
+        """
+        Bump the version of each dataset, or the collection Generation when
+        dataset_codes is None
+        """
+        if dataset_codes is None:
+            increments = {"Generation": 1}
+        elif not dataset_codes:
+            return
+        else:
+            increments = {f"Datasets.{code}": 1 for code in set(dataset_codes)}
+        self._version_collection.update_one(
+            {"_id": self.name}, {"$inc": increments}, upsert=True
+        )
+
+    @staticmethod
+    def _query_dataset_codes(query: dict) -> list[str] | None:
+        dataset_code = query.get("DatasetCode")
+        if isinstance(dataset_code, str):
+            return [dataset_code]
+        if isinstance(dataset_code, dict) and set(dataset_code) == {"$in"}:
+            return list(dataset_code["$in"])
+        return None
+
+    def insert_one(self, document: dict) -> int:
+        count = super().insert_one(document)
+        self.bump_data_versions([document.get("DatasetCode")])
+        return count
+
+    def insert_many(self, documents: list) -> int:
+        count = super().insert_many(documents)
+        self.bump_data_versions([d.get("DatasetCode") for d in documents])
+        return count
+
+    def _deleted_dataset_codes(self, query: dict) -> list[str] | None:
+        if not query:
+            return None
+        dataset_codes = self._query_dataset_codes(query)
+        if dataset_codes is None:
+            dataset_codes = self._mongo_database.distinct("DatasetCode", query)
+        return dataset_codes
+
+    def delete_one(self, query: dict) -> int:
+        document = self._mongo_database.find_one(query, {"DatasetCode": 1})
+        count = super().delete_one(query)
+        if count:
+            self.bump_data_versions(self._query_dataset_codes(query))
+            if self._raw_data is not None and document is not None:
+                self._raw_data.mark_uncleaned([document.get("DatasetCode")])
+        return count
+
+    def delete_many(self, query: dict) -> int:
+        deleted_dataset_codes = self._deleted_dataset_codes(query)
+        count = super().delete_many(query)
+        if count:
+            self.bump_data_versions(self._query_dataset_codes(query))
+            if self._raw_data is not None:
+                self._raw_data.mark_uncleaned(deleted_dataset_codes)
+        return count
+
+    def drop_duplicates(self):
+        count = super().drop_duplicates()
+        self.bump_data_versions(None)
+        return count
+
+    def bulk_update(self, update_queries: list[dict], update_operations: list[dict]):
+        result = super().bulk_update(update_queries, update_operations)
+        self.bump_data_versions(None)
+        return result
+
     def validate_documents_format(self, documents: list) -> bool:
         dtype = type(documents)
         if dtype is not list:
@@ -30,6 +30,19 @@ Indexes:
 - (config_hash, item_code, country_code, year) - unique compound
 - config_hash - for full config lookups
 - created_at - for cache management
+
+Cache manifests (companion collection ``<name>_manifests``, keyed by _id):
+{
+    "_id": "abc123def456...",             # config_hash
+    "item_count": 48240,                  # flat score rows stored
+    "line_count": 4020,                   # line chart rows stored
+    "item_codes": ["BIODIV", ...],
+    "data_version": "9f2c...",            # hash of the clean data versions scored
+    "created_at": "2024-01-15T10:30:00Z"
+}
+A manifest is written only once a scoring run has stored both result sets
+and is removed before those rows are cleared, so its presence marks a
+complete cache entry and a hit costs a single _id lookup.
 """
 
 from sspi_flask_app.models.database.mongo_wrapper import MongoWrapper
@@ -53,6 +66,10 @@ class SSPICustomItemData(MongoWrapper):
     Used for caching, export, and as source for line data transformation.
     """
 
+    def __init__(self, mongo_database):
+        super().__init__(mongo_database)
+        self._manifest_collection = mongo_database.database[f"{self.name}_manifests"]
+
     # ==========================================================================
     # Document Validation
     # ==========================================================================
@@ -295,6 +312,8 @@ class SSPICustomItemData(MongoWrapper):
         Returns:
             Number of documents deleted
         """
+        # Drop the manifest first so a partially cleared entry is never a hit
+        self.delete_manifest(config_hash)
         deleted = self.delete_many({"config_hash": config_hash})
         logger.info(f"Cleared {deleted} cached flat scores for config_hash {config_hash[:8]}...")
         return deleted
@@ -408,6 +427,58 @@ class SSPICustomItemData(MongoWrapper):
             "imputed_count": stats["imputed_count"]
         }
 
+    # ==========================================================================
+    # Cache Manifests
+    # ==========================================================================
+
+    def write_manifest(
+        self,
+        config_hash: str,
+        item_count: int,
+        line_count: int,
+        item_codes: list[str],
+        data_version: str
+    ) -> dict:
+        """
+        Record a complete cache entry for a config hash (single-document write).
+
+        Call only after both the flat scores and the line data are stored.
+
+        Args:
+            config_hash: Configuration hash
+            item_count: Number of flat score documents stored
+            line_count: Number of line chart documents stored
+            item_codes: Item codes present in the results
+            data_version: Version of the clean data the scores were computed from
+
+        Returns:
+            The manifest document
+        """
+        manifest = {
+            "item_count": item_count,
+            "line_count": line_count,
+            "item_codes": sorted(set(item_codes)),
+            "data_version": data_version,
+            "created_at": datetime.now(timezone.utc).isoformat()
+        }
+        self._manifest_collection.replace_one({"_id": config_hash}, manifest, upsert=True)
+        return manifest
+
+    def get_manifest(self, config_hash: str) -> dict | None:
+        """
+        Get the cache manifest for a config hash.
+
+        Args:
+            config_hash: Configuration hash
+
+        Returns:
+            Manifest document (without _id), or None if no complete entry exists
+        """
+        return self._manifest_collection.find_one({"_id": config_hash}, {"_id": 0})
+
+    def delete_manifest(self, config_hash: str) -> int:
+        return self._manifest_collection.delete_one({"_id": config_hash}).deleted_count
+
     # ==========================================================================
     # Index Management
     # ==========================================================================
@@ -1,10 +1,10 @@
-from sspi_flask_app.models.database.mongo_wrapper import MongoWrapper
+from sspi_flask_app.models.database.coverage_index import CoverageIndexedData
 from sspi_flask_app.models.errors import InvalidDocumentFormatError
 import json
 from bson import json_util
 
 
-class SSPIImputedData(MongoWrapper):
+class SSPIImputedData(CoverageIndexedData):
     def validate_documents_format(self, documents: list) -> bool:
         dtype = type(documents)
         if dtype is not list:
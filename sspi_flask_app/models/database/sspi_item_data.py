@@ -1,7 +1,93 @@
+from pymongo import DeleteMany
 from sspi_flask_app.models.database.mongo_wrapper import MongoWrapper
 
 
 class SSPIItemData(MongoWrapper):
+    """
+    Scored item data, one document per (ItemCode, CountryCode, Year).
+
+    Alongside the scores, a companion collection records a fingerprint of the
+    indicator data each (CountryCode, Year) was scored from, so that
+    finalization can rescore only the country-years whose inputs changed.
+    Deleting item documents drops the fingerprints of their country-years,
+    so they are rescored rather than skipped.
+    """
+
+    def __init__(self, mongo_database):
+        super().__init__(mongo_database)
+        self._fingerprint_collection = mongo_database.database[f"{self.name}_fingerprints"]
+
+    def fingerprints(self) -> dict[tuple[str, int], str]:
+        """
+        Return the stored input fingerprint of every scored country-year
+        """
+        return {
+            (doc["CountryCode"], doc["Year"]): doc["Fingerprint"]
+            for doc in self._fingerprint_collection.find({}, {"_id": 0})
+        }
+
+    def insert_fingerprints(self, fingerprints: dict[tuple[str, int], str]) -> int:
+        """
+        Record the input fingerprints of freshly scored country-years; any
+        previous fingerprint is removed by delete_country_years beforehand
+        """
+        if not fingerprints:
+            return 0
+        result = self._fingerprint_collection.insert_many([
+            {"CountryCode": country_code, "Year": year, "Fingerprint": fingerprint}
+            for (country_code, year), fingerprint in fingerprints.items()
+        ])
+        return len(result.inserted_ids)
+
+    def clear_fingerprints(self) -> int:
+        return self._fingerprint_collection.delete_many({}).deleted_count
+
+    def _delete_fingerprints(self, country_years: list[tuple[str, int]]):
+        if country_years:
+            self._fingerprint_collection.bulk_write([
+                DeleteMany({"CountryCode": country_code, "Year": year})
+                for country_code, year in country_years
+            ], ordered=False)
+
+    def _query_country_years(self, query: dict) -> list[tuple[str, int]]:
+        return [
+            (doc["_id"]["CountryCode"], doc["_id"]["Year"])
+            for doc in self._mongo_database.aggregate([
+                {"$match": query},
+                {"$group": {"_id": {"CountryCode": "$CountryCode", "Year": "$Year"}}},
+            ])
+        ]
+
+    def delete_one(self, query: dict) -> int:
+        # A country-year missing any of its items must be rescored, so its
+        # fingerprint goes with the deleted document
+        document = self._mongo_database.find_one(query, {"CountryCode": 1, "Year": 1})
+        count = super().delete_one(query)
+        if count and document is not None:
+            self._delete_fingerprints([(document.get("CountryCode"), document.get("Year"))])
+        return count
+
+    def delete_many(self, query: dict) -> int:
+        country_years = self._query_country_years(query) if query else None
+        count = super().delete_many(query)
+        if country_years is None:
+            self.clear_fingerprints()
+        elif count:
+            self._delete_fingerprints(country_years)
+        return count
+
+    def delete_country_years(self, country_years: list[tuple[str, int]]) -> int:
+        """
+        Delete the item documents and fingerprints of the given country-years
+        """
+        if not country_years:
+            return 0
+        self._delete_fingerprints(country_years)
+        result = self._mongo_database.bulk_write([
+            DeleteMany({"CountryCode": country_code, "Year": year})
+            for country_code, year in country_years
+        ], ordered=False)
+        return result.deleted_count
 
     def validate_document_format(self, document: dict, document_number: int = 0):
         """
@@ -1,4 +1,4 @@
-from sspi_flask_app.models.database.mongo_wrapper import MongoWrapper
+from sspi_flask_app.models.database.mongo_wrapper import MongoWrapper, extended_json_codec
 from sspi_flask_app.models.utils import secure_read_file, SecurePathError
 import frontmatter
 from markdown import markdown
@@ -12,11 +12,163 @@ import pandas as pd
 import logging
 from datetime import date
 import pycountry
+import copy
+import time
+from pymongo import ReturnDocument
 
 log = logging.getLogger(__name__)
 
+# Seconds a process trusts its metadata snapshot before re-reading the
+# generation counter. Writes made through this process invalidate immediately;
+# writes made by another worker are picked up within this window.
+METADATA_GENERATION_CHECK_INTERVAL = 5.0
+
+
+class MetadataSnapshot:
+    """
+    Read-only, process-local copy of the metadata collection indexed by code.
+
+    Built from a single collection scan and tagged with the generation it was
+    read at. Documents keep their natural (insertion) order within each
+    DocumentType, so list getters return the same order as a filtered find.
+    """
+
+    def __init__(self, documents, generation):
+        self.generation = generation
+        self.documents_by_type = {}
+        self.item_details = {}
+        self.indicator_details = {}
+        self.category_details = {}
+        self.pillar_details = {}
+        self.dataset_details = {}
+        self.analysis_details = {}
+        self.country_details = {}
+        self.country_groups = {}
+        self.organization_details = {}
+        self.time_period_details = {}
+        code_indices = {
+            "IndicatorDetail": (self.indicator_details, "IndicatorCode"),
+            "CategoryDetail": (self.category_details, "CategoryCode"),
+            "PillarDetail": (self.pillar_details, "PillarCode"),
+            "DatasetDetail": (self.dataset_details, "DatasetCode"),
+            "AnalysisDetail": (self.analysis_details, "AnalysisCode"),
+            "CountryDetail": (self.country_details, "CountryCode"),
+            "OrganizationDetail": (self.organization_details, "OrganizationCode"),
+            "TimePeriodDetail": (self.time_period_details, "Label"),
+        }
+        for document in documents:
+            document_type = document.get("DocumentType")
+            self.documents_by_type.setdefault(document_type, []).append(document)
+            metadata = document.get("Metadata")
+            if not isinstance(metadata, dict):
+                continue
+            # First match wins, mirroring find_one on the natural order
+            if metadata.get("ItemCode") is not None:
+                self.item_details.setdefault(metadata["ItemCode"], document)
+            if document_type in code_indices:
+                index, code_field = code_indices[document_type]
+                if metadata.get(code_field) is not None:
+                    index.setdefault(metadata[code_field], document)
+            elif document_type == "CountryGroup":
+                group_name = metadata.get("CountryGroupName")
+                if isinstance(group_name, str):
+                    self.country_groups.setdefault(group_name.lower(), document)
+
+    def documents(self, document_type: str) -> list[dict]:
+        return self.documents_by_type.get(document_type, [])
+
+    def first(self, document_type: str) -> dict | None:
+        documents = self.documents_by_type.get(document_type)
+        return documents[0] if documents else None
+
 
 class SSPIMetadata(MongoWrapper):
+    def __init__(self, mongo_database):
+        super().__init__(mongo_database)
+        self._generation_collection = mongo_database.database[f"{self.name}_generation"]
+        self._snapshot = None
+        self._generation_checked_at = 0.0
+
+    # Snapshot Cache
+    def generation(self) -> int:
+        """
+        Return the current metadata generation shared by all workers
+        """
+        document = self._generation_collection.find_one({"_id": self.name})
+        if not document:
+            return 0
+        return document.get("Generation", 0)
+
+    def bump_generation(self) -> int:
+        """
+        Advance the metadata generation so every worker rebuilds its snapshot,
+        and drop this process's snapshot immediately
+        """
+        document = self._generation_collection.find_one_and_update(
+            {"_id": self.name},
+            {"$inc": {"Generation": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER
+        )
+        self._snapshot = None
+        return document["Generation"]
+
+    def snapshot(self) -> MetadataSnapshot:
+        """
+        Return the process-local metadata snapshot, rebuilding it when the
+        shared generation has moved on. The generation is re-read at most once
+        every METADATA_GENERATION_CHECK_INTERVAL seconds, so steady-state
+        lookups issue no queries at all. The globe GeoJSON is only read by
+        finalize and is left out of the snapshot.
+        """
+        snapshot = self._snapshot
+        now = time.monotonic()
+        if snapshot is not None and now - self._generation_checked_at < METADATA_GENERATION_CHECK_INTERVAL:
+            return snapshot
+        generation = self.generation()
+        if snapshot is None or snapshot.generation != generation:
+            # Read the generation before the documents: a write racing the
+            # scan leaves a stale tag, which only costs one extra rebuild
+            snapshot = MetadataSnapshot(
+                self.iter_find(
+                    {"DocumentType": {"$ne": "GlobeGeoJSON"}},
+                    codec=extended_json_codec
+                ),
+                generation
+            )
+            self._snapshot = snapshot
+        self._generation_checked_at = now
+        return snapshot
+
+    def insert_one(self, document: dict) -> int:
+        count = super().insert_one(document)
+        self.bump_generation()
+        return count
+
+    def insert_many(self, documents: list) -> int:
+        count = super().insert_many(documents)
+        self.bump_generation()
+        return count
+
+    def delete_one(self, query: dict) -> int:
+        count = super().delete_one(query)
+        self.bump_generation()
+        return count
+
+    def delete_many(self, query: dict) -> int:
+        count = super().delete_many(query)
+        self.bump_generation()
+        return count
+
+    def drop_duplicates(self):
+        count = super().drop_duplicates()
+        self.bump_generation()
+        return count
+
+    def bulk_update(self, update_queries: list[dict], update_operations: list[dict]):
+        result = super().bulk_update(update_queries, update_operations)
+        self.bump_generation()
+        return result
 
     def validate_document_format(self, document: dict, document_number: int = 0):
         """
@@ -539,26 +691,26 @@ class SSPIMetadata(MongoWrapper):
         """
         Return a list of all pillar codes
         """
-        return self.find_one({"DocumentType": "PillarCodes"})["Metadata"]
+        return copy.deepcopy(self.snapshot().first("PillarCodes")["Metadata"])
 
     def category_codes(self) -> list[str]:
         """
         Return a list of all category codes
         """
-        return self.find_one({"DocumentType": "CategoryCodes"})["Metadata"]
+        return copy.deepcopy(self.snapshot().first("CategoryCodes")["Metadata"])
 
     def indicator_codes(self) -> list[str]:
         """
         Return a list of all indicator codes
         """
-        return self.find_one({"DocumentType": "IndicatorCodes"})["Metadata"]
+        return copy.deepcopy(self.snapshot().first("IndicatorCodes")["Metadata"])
 
     def indicator_options(self) -> list[str]:
         """
         Return a list of documents to build indicator options HTML for the dropdown
         """
         option_list = []
-        for detail in self.find({"DocumentType": "IndicatorDetail"}):
+        for detail in self.snapshot().documents("IndicatorDetail"):
             meta = detail["Metadata"]
             option_list.append({
                 "Text": f"{meta['Indicator']} ({meta['IndicatorCode']})",
@@ -578,7 +730,7 @@ class SSPIMetadata(MongoWrapper):
         Return a list of documents to build category options HTML for the dropdown
         """
         option_list = []
-        for detail in self.find({"DocumentType": "CategoryDetail"}):
+        for detail in self.snapshot().documents("CategoryDetail"):
             meta = detail["Metadata"]
             option_list.append({
                 "Text": f"{meta["Category"]} ({meta["CategoryCode"]})",
@@ -591,7 +743,7 @@ class SSPIMetadata(MongoWrapper):
         Return a list of documents to build pillar options HTML for the dropdown
         """
         option_list = []
-        for detail in self.find({"DocumentType": "PillarDetail"}):
+        for detail in self.snapshot().documents("PillarDetail"):
             meta = detail["Metadata"]
             option_list.append({
                 "Text": f"{meta['Pillar']} ({meta['PillarCode']})",
@@ -603,31 +755,22 @@ class SSPIMetadata(MongoWrapper):
         """
         Return the detail for a particular indicator for IndicatorCode
         """
-        query = {
-            "DocumentType": "IndicatorDetail",
-            "Metadata.IndicatorCode": IndicatorCode
-        }
-        return self.find_one(query)["Metadata"]
+        detail = self.snapshot().indicator_details.get(IndicatorCode)
+        return copy.deepcopy(detail["Metadata"])
 
     def get_category_detail(self, CategoryCode: str) -> dict:
         """
         Return the detail for a particular category for CategoryCode
         """
-        query = {
-            "DocumentType": "CategoryDetail",
-            "Metadata.CategoryCode": CategoryCode
-        }
-        return self.find_one(query)["Metadata"]
+        detail = self.snapshot().category_details.get(CategoryCode)
+        return copy.deepcopy(detail["Metadata"])
 
     def get_pillar_detail(self, PillarCode: str) -> dict:
         """
         Return the detail for a particular pillar for PillarCode
         """
-        query = {
-            "DocumentType": "PillarDetail",
-            "Metadata.PillarCode": PillarCode
-        }
-        return self.find_one(query)["Metadata"]
+        detail = self.snapshot().pillar_details.get(PillarCode)
+        return copy.deepcopy(detail["Metadata"])
 
     def get_goalposts(self, IndicatorCode: str) -> tuple[int | float, int | float]:
         """
@@ -645,44 +788,36 @@ class SSPIMetadata(MongoWrapper):
         Return a list of documents containg dataset details
         """
         flat_list = []
-        for detail in self.find({"DocumentType": "DatasetDetail"}):
+        for detail in self.snapshot().documents("DatasetDetail"):
             flat_list.append(detail["Metadata"])
-        return flat_list
+        return copy.deepcopy(flat_list)
 
     def dataset_codes(self) -> list[str]:
         """
         Return a list of documents containg dataset details
         """
-        result = self.find_one({"DocumentType": "DatasetCodes"})
+        result = self.snapshot().first("DatasetCodes")
         if not result:
             return []
-        return result.get("Metadata", [])
+        return copy.deepcopy(result.get("Metadata", []))
 
     def get_dataset_detail(self, DatasetCode: str) -> dict:
         """
         Return a document containing indicator details for a specific IndicatorCode
         """
-        query = {
-            "DocumentType": "DatasetDetail",
-            "Metadata.DatasetCode": DatasetCode
-        }
-        result = self.find_one(query)
+        result = self.snapshot().dataset_details.get(DatasetCode)
         if not result:
             return {}
-        return result.get("Metadata", {})
+        return copy.deepcopy(result.get("Metadata", {}))
 
     def get_analysis_detail(self, analysis_code: str) -> dict:
         """
         Return a document containing indicator details for a specific IndicatorCode
         """
-        query = {
-            "DocumentType": "AnalysisDetail",
-            "Metadata.AnalysisCode": analysis_code.upper()
-        }
-        result = self.find_one(query)
+        result = self.snapshot().analysis_details.get(analysis_code.upper())
         if not result:
             return {}
-        return result.get("Metadata", {})
+        return copy.deepcopy(result.get("Metadata", {}))
 
     def get_series_type(self, series_code: str) -> str|None:
         """
@@ -700,12 +835,10 @@ class SSPIMetadata(MongoWrapper):
 
         :param ItemCode: The item code for which to get the details (SSPI, PillarCode, CategoryCode, IndicatorCode, DatasetCode)
         """
-        result = self.find_one({
-            "Metadata.ItemCode": ItemCode.upper(),
-        })
+        result = self.snapshot().item_details.get(ItemCode.upper())
         if not result:
             return {"Error": "ItemCode not found"}
-        return result["Metadata"]
+        return copy.deepcopy(result["Metadata"])
     
 
     def get_child_details(self, ItemCode: str) -> list[dict]:
@@ -714,24 +847,27 @@ class SSPIMetadata(MongoWrapper):
 
         :param ItemCode: The item code for which to get the children (SSPI, PillarCode, CategoryCode, IndicatorCode, DatasetCode)
         """
+        snapshot = self.snapshot()
         if ItemCode == "SSPI":
-            return self.find({"DocumentType": "PillarDetail"})
+            return copy.deepcopy(snapshot.documents("PillarDetail"))
         # One detail lookup classifies the item and supplies its children,
         # replacing the previous chain of pillar/category/indicator code-list
         # queries followed by a second detail re-query.
         detail = self.get_item_detail(ItemCode)
         item_type = detail.get("ItemType")
         if item_type == "Pillar":
-            category_codes = detail["Children"]
-            return self.find({"DocumentType": "CategoryDetail", "Metadata.ItemCode": {"$in": category_codes}})
+            document_type, code_field, child_codes = "CategoryDetail", "ItemCode", detail["Children"]
         elif item_type == "Category":
-            indicator_codes = detail["Children"]
-            return self.find({"DocumentType": "IndicatorDetail", "Metadata.ItemCode": {"$in": indicator_codes}})
+            document_type, code_field, child_codes = "IndicatorDetail", "ItemCode", detail["Children"]
         elif item_type == "Indicator":
-            child_codes = detail.get("DatasetCodes", [])
-            return self.find({"DocumentType": "DatasetDetail", "Metadata.DatasetCode": {"$in": child_codes}})
+            document_type, code_field, child_codes = "DatasetDetail", "DatasetCode", detail.get("DatasetCodes", [])
         else:
             return []
+        child_codes = set(child_codes)
+        return copy.deepcopy([
+            d for d in snapshot.documents(document_type)
+            if d["Metadata"].get(code_field) in child_codes
+        ])
 
 
     def country_group(self, country_group_name: str) -> list[str]:
@@ -740,35 +876,31 @@ class SSPIMetadata(MongoWrapper):
         """
         if not country_group_name:
             return []
-        return self.find_one({
-            "DocumentType": "CountryGroup",
-            "Metadata.CountryGroupName": {
-                "$regex": f"^{country_group_name}$",
-                "$options": "i"}
-        })["Metadata"]["Countries"]
+        group = self.snapshot().country_groups.get(country_group_name.lower())
+        return copy.deepcopy(group["Metadata"]["Countries"])
 
     def country_groups(self) -> list[str]:
         """
         Return a list of all country groups in the database
         """
-        return self.find_one({"DocumentType": "CountryGroups"})["Metadata"]
+        return copy.deepcopy(self.snapshot().first("CountryGroups")["Metadata"])
 
     def country_groups_tree(self) -> list[str]:
         """
         Return a list of all country groups in the database
         """
         groups_tree = []
-        for g in self.find({"DocumentType": "CountryGroup"}):
+        for g in self.snapshot().documents("CountryGroup"):
             groups_tree.append({
                 g["Metadata"]["CountryGroupName"]: g["Metadata"]["Countries"]
             })
-        return groups_tree
+        return copy.deepcopy(groups_tree)
 
     def country_group_map(self) -> dict[str, list[str]]:
         """
         Returns a map from country_code to groups for all countries
         """
-        return self.find_one({"DocumentType": "CountryGroupMap"})["Metadata"]
+        return copy.deepcopy(self.snapshot().first("CountryGroupMap")["Metadata"])
 
     def build_country_group_map(self, cgroups):
         """
@@ -803,7 +935,8 @@ class SSPIMetadata(MongoWrapper):
         # The precomputed CountryGroupMap is built by iterating the same
         # CountryGroup documents in the same order this method used to scan, so
         # the per-country group list is identical without the full collection scan.
-        return self.country_group_map().get(country_code, [])
+        country_group_map = self.snapshot().first("CountryGroupMap")["Metadata"]
+        return copy.deepcopy(country_group_map.get(country_code, []))
 
     def indicator_details(self, filter=[]) -> list[dict]:
         """
@@ -814,41 +947,41 @@ class SSPIMetadata(MongoWrapper):
         indicator details will be returned.
         """
         flat_list = []
-        for detail in self.find({"DocumentType": "IndicatorDetail"}):
+        for detail in self.snapshot().documents("IndicatorDetail"):
             if filter and detail["Metadata"]["IndicatorCode"] not in filter:
                 continue
             flat_list.append(detail["Metadata"])
-        return flat_list
+        return copy.deepcopy(flat_list)
 
     def category_details(self, filter=[]) -> list[dict]:
         """
         Return a list of metadata dictionaries containing category details
         """
         flat_list = []
-        for detail in self.find({"DocumentType": "CategoryDetail"}):
+        for detail in self.snapshot().documents("CategoryDetail"):
             if filter and detail["Metadata"]["CategoryCode"] not in filter:
                 continue
             flat_list.append(detail["Metadata"])
-        return flat_list
+        return copy.deepcopy(flat_list)
 
     def pillar_details(self, filter=[]) -> list[dict]:
         """
         Return a list of metadata dictionaries containing pillar details
         """
         flat_list = []
-        for detail in self.find({"DocumentType": "PillarDetail"}):
+        for detail in self.snapshot().documents("PillarDetail"):
             if filter and detail["Metadata"]["PillarCode"] not in filter:
                 continue
             flat_list.append(detail["Metadata"])
-        return flat_list
+        return copy.deepcopy(flat_list)
 
     def pillar_category_summary_tree(self) -> list[dict]:
         """
         Returns a tree structure of pillars and categories
         """
-        return self.find_one(
-            {"DocumentType": "PillarCategorySummaryTree"}
-        )["Metadata"] 
+        return copy.deepcopy(
+            self.snapshot().first("PillarCategorySummaryTree")["Metadata"]
+        ) 
 
     def get_analysis_html(self, analysis_code: str) -> str:
         """
@@ -1006,23 +1139,20 @@ class SSPIMetadata(MongoWrapper):
         """
         Returns a list of dataset codes that depend on the given source information
         """
-        source_query = {}
-        for k,v in source_info.items():
-            source_query["Metadata.Source." + k] = v
-        source_query["DocumentType"] = "SourceDetail"
-        source_detail = self.find_one(source_query)
-        if not source_detail:
-            return []
-        return source_detail["Metadata"]["DatasetCodes"]
+        for source_detail in self.snapshot().documents("SourceDetail"):
+            source = source_detail["Metadata"].get("Source", {})
+            if all(k in source and source[k] == v for k, v in source_info.items()):
+                return copy.deepcopy(source_detail["Metadata"]["DatasetCodes"])
+        return []
 
     def sspi_detail(self) -> dict:
         """
         Returns the detail for the SSPI item
         """
-        sspi_detail = self.find_one({"DocumentType": "SSPIDetail"})
+        sspi_detail = self.snapshot().first("SSPIDetail")
         if not sspi_detail:
             raise ValueError("SSPI detail not found in metadata.")
-        return sspi_detail["Metadata"]
+        return copy.deepcopy(sspi_detail["Metadata"])
 
     def item_details(self, indicator_filter: list[str]=[]) -> list[dict]:
         """
@@ -1088,37 +1218,33 @@ class SSPIMetadata(MongoWrapper):
                 "Metadata.Range.yMax": max_val
             }}
         )
+        self.bump_generation()
 
     def country_group_details(self, country_group_code: str) -> list[dict]:
         """
         Returns a list of country details corresponding to the group code
         :param country_group_code: The group code for the query.
         """
-        country_group_details = self.find({
-            "DocumentType": "CountryDetail",
-            "Metadata.CountryGroups": {"$in": [country_group_code]}
-        })
-        return country_group_details
+        country_group_details = [
+            d for d in self.snapshot().documents("CountryDetail")
+            if country_group_code in d["Metadata"].get("CountryGroups", [])
+        ]
+        return copy.deepcopy(country_group_details)
 
     def get_country_detail(self, country_code:str) -> dict:
-        country_detail = self.find_one({
-            "DocumentType": "CountryDetail",
-            "Metadata.CountryCode": country_code
-        })
+        country_detail = self.snapshot().country_details.get(country_code)
         if not country_detail or not country_detail.get("Metadata"):
             return {}
-        return country_detail["Metadata"]
+        return copy.deepcopy(country_detail["Metadata"])
 
     def country_details(self) -> list[dict]:
-        country_details = self.find({
-            "DocumentType": "CountryDetail",
-        })
+        country_details = self.snapshot().documents("CountryDetail")
         if not country_details:
             return []
-        return [c["Metadata"] for c in country_details]
+        return copy.deepcopy([c["Metadata"] for c in country_details])
 
     def organization_details(self) -> list[dict]:
-        organization_details = self.find({ "DocumentType": "OrganizationDetail" })
+        organization_details = self.snapshot().documents("OrganizationDetail")
         if not organization_details:
             return []
         clean_details = []
@@ -1126,16 +1252,13 @@ class SSPIMetadata(MongoWrapper):
             meta_dict = d.get("Metadata")
             if isinstance(meta_dict, dict):
                 clean_details.append(meta_dict)
-        return clean_details
+        return copy.deepcopy(clean_details)
 
     def get_organization_detail(self, organization_code: str) -> dict:
-        org_detail = self.find_one({ 
-            "DocumentType": "OrganizationDetail",
-            "Metadata.OrganizationCode": organization_code 
-        })
+        org_detail = self.snapshot().organization_details.get(organization_code)
         if not org_detail or not org_detail.get("Metadata"):
             return {}
-        return org_detail["Metadata"]
+        return copy.deepcopy(org_detail["Metadata"])
 
     def get_indicator_dependencies(self, item_code: str) -> list:
         """
@@ -1167,16 +1290,16 @@ class SSPIMetadata(MongoWrapper):
             return item_dependencies
     
     def time_period_details(self) -> list[dict]:
-        details = self.find({"DocumentType": "TimePeriodDetail"})
+        details = self.snapshot().documents("TimePeriodDetail")
         if not details:
             return []
-        return [d.get("Metadata", {}) for d in details]
+        return copy.deepcopy([d.get("Metadata", {}) for d in details])
 
     def get_time_period_detail(self, time_period_label: str) -> dict:
-        detail = self.find_one({"DocumentType": "TimePeriodDetail", "Metadata.Label": time_period_label})
+        detail = self.snapshot().time_period_details.get(time_period_label)
         if not detail:
             return {}
-        return detail
+        return copy.deepcopy(detail)
 
     def get_active_schema_dataset_dependencies(self, active_indicator_codes: list[str]) -> dict:
         """
@@ -1195,15 +1318,8 @@ class SSPIMetadata(MongoWrapper):
             "allDatasets": ["UNSDG_TERRST", ...]  # Ordered list
         }
         """
-        # Fetch every active indicator's detail in a single query and index it by
-        # IndicatorCode, instead of issuing one find_one per indicator.
-        detail_map = {}
-        for doc in self.find({
-            "DocumentType": "IndicatorDetail",
-            "Metadata.IndicatorCode": {"$in": active_indicator_codes}
-        }):
-            meta = doc.get("Metadata", {})
-            detail_map[meta.get("IndicatorCode")] = meta
+        # The snapshot already indexes every indicator detail by IndicatorCode
+        detail_map = self.snapshot().indicator_details
 
         indicator_to_datasets = {}
         dataset_to_indicator = {}
@@ -1214,9 +1330,9 @@ class SSPIMetadata(MongoWrapper):
 
         for indicator_code in active_indicator_codes:
             detail = detail_map.get(indicator_code)
-            if not detail:
+            if not detail or not detail.get("Metadata"):
                 continue
-            dataset_codes = detail.get("DatasetCodes", [])
+            dataset_codes = list(detail["Metadata"].get("DatasetCodes", []))
             if not dataset_codes:
                 # Some indicators may not have explicit DatasetCodes
                 # Use get_dataset_dependencies as fallback
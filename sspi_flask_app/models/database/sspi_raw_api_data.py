@@ -10,7 +10,32 @@ import logging
 log = logging.getLogger(__name__)
 
 
+def raw_digest(raw) -> str:
+    """
+    Content digest of a Raw payload. Strings are hashed as UTF-8; other
+    payloads are hashed as canonical (key-sorted) JSON.
+    """
+    if isinstance(raw, str):
+        payload = raw.encode("utf-8")
+    else:
+        payload = json.dumps(raw, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
 class SSPIRawAPIData(MongoWrapper):
+    """
+    Raw API responses, one or more documents per RawDocumentSet (Source).
+
+    Every document carries a RawDigest of its payload. On re-collection the
+    digest of the new set is compared with the old one so unchanged sources
+    keep their documents, and the per-dataset digests recorded in
+    {name}_digests tell the cleaners which datasets need re-cleaning.
+    """
+
+    def __init__(self, mongo_database):
+        super().__init__(mongo_database)
+        self._digest_collection = mongo_database.database[f"{self.name}_digests"]
+
     def validate_document_format(self, document: dict, document_number: int = 0):
         """
         Raises an InvalidDocumentFormatError if the document is not in valid
@@ -118,6 +143,57 @@ class SSPIRawAPIData(MongoWrapper):
             raise InvalidDocumentFormatError(
                 f"'Raw' must be a string, dict, int, float, or list {doc_id}")
 
+    def build_raw_documents(self, document: list | str | dict, source_info: dict[str, str], collected_at: str, **kwargs) -> list[dict]:
+        """
+        Builds the RawDocuments for a single API response without writing them
+        - Strings longer than maximum_document_size_bytes are split into
+        fragments sharing a FragmentGroupID
+        - collected_at is the CollectionInfo Date, formatted once by the caller
+        """
+        username = kwargs.get("username", None)
+        assert username is not None, "username must be provided as a key word argument to raw_insert_one"
+        collection_info = {"Date": collected_at, "Username": username}
+        byte_max = self.maximum_document_size_bytes
+        if not (isinstance(document, str) and len(document) > byte_max):
+            obs = {"CollectionInfo": collection_info, "Source": source_info, "Raw": document}
+            obs.update(kwargs)
+            obs["RawDigest"] = raw_digest(document)
+            return [obs]
+        print(f"Document too large, fragmenting: {len(document)} bytes")
+        num_fragments = (len(document) + byte_max - 1) // byte_max
+        source_info_id = f"{source_info['OrganizationCode']}_{source_info['QueryCode']}"
+        fragment_group_id = hashlib.blake2b(document.encode('utf-8')).hexdigest()
+        fragments = []
+        for i in range(num_fragments):
+            # The "Raw" field is placed before the kwargs keys to match the
+            # field order of unfragmented documents
+            obs = {
+                "CollectionInfo": collection_info,
+                "Source": source_info,
+                "Raw": document[byte_max * i:byte_max * i + byte_max],
+            }
+            obs.update(kwargs)
+            obs.update({
+                "FragmentGroupID": f"{source_info_id}_{fragment_group_id}",
+                "FragmentNumber": i,
+                "FragmentTotal": num_fragments,
+                "RawDigest": raw_digest(obs["Raw"]),
+            })
+            fragments.append(obs)
+        return fragments
+
+    def insert_raw_chunks(self, documents: list[dict], chunk_size: int = 1000):
+        """
+        Validates all documents in one pass, then writes them with unordered
+        insert_many calls of at most chunk_size documents. Yields the number
+        of documents written by each chunk so collectors can report progress.
+        """
+        self.validate_documents_format(documents)
+        for start in range(0, len(documents), chunk_size):
+            chunk = documents[start:start + chunk_size]
+            result = self._mongo_database.insert_many(chunk, ordered=False)
+            yield len(result.inserted_ids)
+
     def raw_insert_one(self, document: list | str | dict, source_info: dict[str, str], **kwargs) -> int:
         """
         Utility Function the response from an API call in the database
@@ -126,39 +202,25 @@ class SSPIRawAPIData(MongoWrapper):
         - Implements automatic fragmentation to handle strings which are too large
         :param source_id: Dictionary uniquely identifying raw document sets
         """
-        username = kwargs.get("username", None)
-        assert username is not None, "username must be provided as a key word argument to raw_insert_one"
-        obs = {
-            "CollectionInfo": {
-                "Date": datetime.now().strftime("%F %R"),
-                "Username": username,
-            },
-            "Source": source_info
-        }
-        byte_max = self.maximum_document_size_bytes
-        if isinstance(document, str) and len(document) > byte_max:
-            print(f"Document too large, fragmenting: {len(document)} bytes")
-            num_fragments = (len(document) + byte_max - 1) // byte_max
-            source_info_id = f"{source_info['OrganizationCode']}_{source_info['QueryCode']}"
-            fragment_group_id = hashlib.blake2b(document.encode('utf-8')).hexdigest()
-            # kwargs are loop-invariant: apply once. The "Raw" placeholder fixes its
-            # field position before the kwargs keys to match the original ordering.
-            obs["Raw"] = None
-            obs.update(kwargs)
-            for i in range(num_fragments):
-                obs["Raw"] = document[byte_max * i:byte_max * i + byte_max]
-                obs.update({
-                    "FragmentGroupID": f"{source_info_id}_{fragment_group_id}",
-                    "FragmentNumber": i,
-                    "FragmentTotal": num_fragments,
-                })
-                self.insert_one(obs)
-                del obs["_id"]
-            return num_fragments
-        obs["Raw"] = document
-        obs.update(kwargs)
-        self.insert_one(obs)
-        return 1
+        collected_at = datetime.now().strftime("%F %R")
+        documents = self.build_raw_documents(document, source_info, collected_at, **kwargs)
+        return sum(self.insert_raw_chunks(documents))
+
+    def raw_insert_many_chunks(self, document_list: list, source_info: dict[str, str], chunk_size: int = 1000, **kwargs):
+        """
+        Bulk ingestion path behind raw_insert_many
+        - Builds every RawDocument (including fragments) in memory with a
+        single collection timestamp
+        - Yields the count written by each chunk, for use in collector
+        progress streams
+        """
+        collected_at = datetime.now().strftime("%F %R")
+        documents = []
+        for observation in document_list:
+            documents.extend(
+                self.build_raw_documents(observation, source_info, collected_at, **kwargs)
+            )
+        yield from self.insert_raw_chunks(documents, chunk_size=chunk_size)
 
     def raw_insert_many(self, document_list: list,  source_info: dict[str, str], **kwargs) -> int:
         """
@@ -166,9 +228,11 @@ class SSPIRawAPIData(MongoWrapper):
         - Observation to be past as a list of well form observation
         dictionaries
         - raw_document_set_id specifies the RawDocumentSet to which the RawDocument belongs
+        - Returns the number of observations in document_list (fragments are
+        not counted separately)
         """
-        for observation in document_list:
-            self.raw_insert_one(observation, source_info, **kwargs)
+        for _ in self.raw_insert_many_chunks(document_list, source_info, **kwargs):
+            pass
         return len(document_list)
 
     def fetch_raw_data(self, source_info: dict[str, str], **kwargs) -> list:
@@ -206,7 +270,7 @@ class SSPIRawAPIData(MongoWrapper):
                 ))
             assert all([isinstance(x["Raw"], str) for x in v]), "All fragments must have a Raw field of type str"
             raw = "".join([x["Raw"] for x in v])
-            drops = ["FragmentNumber", "FragmentTotal", "Raw"]
+            drops = ["FragmentNumber", "FragmentTotal", "Raw", "RawDigest"]
             rebuilt = {f: data for f, data in v[0].items() if f not in drops}
             rebuilt["Raw"] = raw
             defragged_raw.append(rebuilt)
@@ -245,3 +309,106 @@ class SSPIRawAPIData(MongoWrapper):
             return {}
         return doc["CollectionInfo"]
 
+
+    # Content Digests
+    # A RawDocumentSet's digest is the hash of its documents' sorted
+    # RawDigests, so it does not depend on insertion order (pages may be
+    # fetched in parallel). Documents collected before RawDigest existed make
+    # the set digest None, which always counts as changed.
+
+    def document_ids(self, source_info: dict[str, str]) -> list:
+        """
+        Return the _ids of the documents currently stored for a source
+        """
+        source_query = self.build_source_query(source_info)
+        return [doc["_id"] for doc in self._mongo_database.find(source_query, {"_id": 1})]
+
+    def set_digest(self, query: dict) -> str | None:
+        """
+        Return the content digest of the documents matching query, or None if
+        there are none or any of them lacks a RawDigest
+        """
+        digests = [
+            doc.get("RawDigest")
+            for doc in self._mongo_database.find(query, {"RawDigest": 1})
+        ]
+        if not digests or None in digests:
+            return None
+        return hashlib.blake2b("\n".join(sorted(digests)).encode("utf-8"), digest_size=16).hexdigest()
+
+    def source_digest(self, source_info: dict[str, str]) -> str | None:
+        """
+        Return an identity digest for the documents currently stored for a
+        source: its content digest when every document has a RawDigest,
+        otherwise a digest of the document _ids (which change whenever the
+        set is re-collected). None when nothing is stored.
+        """
+        source_query = self.build_source_query(source_info)
+        documents = list(self._mongo_database.find(source_query, {"RawDigest": 1}))
+        if not documents:
+            return None
+        if all(doc.get("RawDigest") for doc in documents):
+            return self.set_digest(source_query)
+        ids = "\n".join(sorted(str(doc["_id"]) for doc in documents))
+        return "ids:" + hashlib.blake2b(ids.encode("utf-8"), digest_size=16).hexdigest()
+
+    def replace_or_keep(self, source_info: dict[str, str], previous_ids: list, downstream_datasets: list[str]) -> tuple[bool, str | None]:
+        """
+        Resolve a re-collection once the collector has inserted the new
+        documents alongside the previous ones (previous_ids).
+
+        If the new set has the same digest as the previous set the new
+        documents are discarded, otherwise the previous documents are. The
+        digest is recorded against downstream_datasets either way.
+        :return: (changed, digest of the documents kept)
+        """
+        source_query = self.build_source_query(source_info)
+        new_query = {**source_query, "_id": {"$nin": previous_ids}}
+        previous_query = {**source_query, "_id": {"$in": previous_ids}}
+        digest = self.set_digest(new_query)
+        changed = not previous_ids or digest is None or digest != self.set_digest(previous_query)
+        self._mongo_database.delete_many(previous_query if changed else new_query)
+        self.record_digest(downstream_datasets, digest)
+        return changed, digest
+
+    def record_digest(self, dataset_codes: list[str], digest: str | None):
+        for dataset_code in dataset_codes:
+            self._digest_collection.update_one(
+                {"_id": dataset_code}, {"$set": {"RawDigest": digest}}, upsert=True
+            )
+
+    def needs_cleaning(self, dataset_code: str) -> bool:
+        """
+        True unless the dataset was last cleaned from raw data with the
+        digest currently recorded for it
+        """
+        document = self._digest_collection.find_one({"_id": dataset_code})
+        if not document or document.get("RawDigest") is None:
+            return True
+        return document.get("CleanedDigest") != document["RawDigest"]
+
+    def mark_cleaned(self, dataset_code: str):
+        document = self._digest_collection.find_one({"_id": dataset_code}) or {}
+        self._digest_collection.update_one(
+            {"_id": dataset_code},
+            {"$set": {"CleanedDigest": document.get("RawDigest")}},
+            upsert=True,
+        )
+
+    def mark_uncleaned(self, dataset_codes: list[str] | None):
+        """
+        Forget that datasets were cleaned, e.g. because their clean data was
+        deleted, so the next clean runs even if the raw data is unchanged.
+        None marks every dataset
+        """
+        query = {} if dataset_codes is None else {"_id": {"$in": list(dataset_codes)}}
+        self._digest_collection.update_many(query, {"$unset": {"CleanedDigest": ""}})
+
+    def discard_new_documents(self, source_info: dict[str, str], previous_ids: list) -> int:
+        """
+        Roll back a failed re-collection, keeping only the previous documents
+        """
+        source_query = self.build_source_query(source_info)
+        return self._mongo_database.delete_many(
+            {**source_query, "_id": {"$nin": previous_ids}}
+        ).deleted_count
@@ -40,9 +40,20 @@ Document format:
     "updated_at": <datetime UTC>,         # bumped on every write (stall reaping)
     "completed_at": <datetime UTC> | null,
     "expire_at": <datetime UTC>,          # TTL source of truth (created_at + TTL)
-    "worker_pid": 12345                   # debugging: which worker ran the thread
+    "worker_pid": 12345,                  # debugging: which worker ran the thread
+    "payload": {                          # queue mode only: pipeline inputs for
+        "metadata": [...],                # the ``sspi worker`` process
+        "actions": [...]
+    },
+    "claimed_by": "host:pid"              # queue mode only: worker running the job
 }
 
+In-flight computations are registered in the companion ``{name}_flights``
+collection, one document per flight key (config hash + data version):
+{"_id": "<config_hash>:<data_version>", "job_id": "a1b2c3...", "created_at": ...}
+The unique _id makes the job that inserts it the single job computing that
+configuration; identical jobs started meanwhile follow its progress instead.
+
 Indexes:
 - job_id        - unique
 - user_id       - per-user job listing + cap counts
@@ -52,9 +63,11 @@ Indexes:
 """
 
 import logging
+import time
 from datetime import datetime, timezone, timedelta
 
 from pymongo import ReturnDocument
+from pymongo.errors import DuplicateKeyError
 
 from sspi_flask_app.models.database.mongo_wrapper import MongoWrapper
 from sspi_flask_app.models.errors import InvalidDocumentFormatError
@@ -72,6 +85,75 @@ TERMINAL_STATUS_VALUES = {"complete", "error", "cancelled"}
 VALID_STATUS_VALUES = ACTIVE_STATUS_VALUES | TERMINAL_STATUS_VALUES
 
 
+# Fields returned by job_state alongside the new events
+JOB_STATE_FIELDS = (
+    "job_id", "user_id", "status", "progress", "message", "stage",
+    "stage_current", "stage_total", "result", "error", "seq", "updated_at",
+)
+
+# How long a change stream getMore waits server-side for a change
+CHANGE_STREAM_AWAIT_MS = 1000
+
+
+class JobWatch:
+    """
+    Blocks until a scoring job document changes, for SSE readers.
+
+    With a change stream the wait is pushed by the server and an idle watch
+    issues no reads of the job. Without one (standalone mongod), it polls
+    only the job's ``updated_at`` and ``seq`` every ``poll_interval``
+    seconds, so the full document is read only when something changed.
+    Every job write stamps ``updated_at``, and an evicted job reads as a
+    change.
+    """
+
+    def __init__(self, collection, job_id: str, stream, poll_interval: float):
+        self._collection = collection
+        self._job_id = job_id
+        self._stream = stream
+        self._poll_interval = poll_interval
+        self._stamp = self._read_stamp() if stream is None else None
+
+    def _read_stamp(self):
+        return self._collection.find_one(
+            {"job_id": self._job_id}, {"_id": 0, "updated_at": 1, "seq": 1}
+        )
+
+    def wait(self, timeout: float) -> bool:
+        """Wait up to ``timeout`` seconds; True if the job changed."""
+        deadline = time.monotonic() + timeout
+        if self._stream is not None:
+            try:
+                while time.monotonic() < deadline:
+                    # Return on the first change: with nothing buffered,
+                    # try_next blocks for a getMore of up to
+                    # CHANGE_STREAM_AWAIT_MS. Readers merge the rest of a
+                    # burst by re-reading the job at most every
+                    # min_read_interval
+                    if self._stream.try_next() is not None:
+                        return True
+                return False
+            except Exception as e:
+                logger.warning(f"Change stream for job {self._job_id} failed, polling instead: {e}")
+                self.close()
+                self._stamp = self._read_stamp()
+                return True
+        while True:
+            stamp = self._read_stamp()
+            if stamp != self._stamp:
+                self._stamp = stamp
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(self._poll_interval, remaining))
+
+    def close(self):
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+
 class SSPIScoringJobs(MongoWrapper):
     """
     MongoDB wrapper for worker-safe custom scoring job state.
@@ -81,6 +163,12 @@ class SSPIScoringJobs(MongoWrapper):
     reconstruct job state from the document.
     """
 
+    def __init__(self, mongo_database):
+        super().__init__(mongo_database)
+        self._flights_collection = mongo_database.database[f"{self.name}_flights"]
+        # None until the first watch_job tries to open a change stream
+        self._change_streams_supported = None
+
     # ==========================================================================
     # Document Validation
     # ==========================================================================
@@ -150,12 +238,123 @@ class SSPIScoringJobs(MongoWrapper):
         return document["job_id"]
 
     def get(self, job_id: str) -> dict | None:
-        """Fetch a job document (native types, no _id). None if missing."""
-        return self._mongo_database.find_one({"job_id": job_id}, {"_id": 0})
+        """Fetch a job document (native types, no _id or payload). None if missing."""
+        return self._mongo_database.find_one(
+            {"job_id": job_id}, {"_id": 0, "payload": 0}
+        )
 
     def list_for_user(self, user_id: str) -> list[dict]:
-        """Return all job documents owned by a user (native types, no _id)."""
-        return list(self._mongo_database.find({"user_id": user_id}, {"_id": 0}))
+        """Return all job documents owned by a user (native types, no _id or payload)."""
+        return list(self._mongo_database.find(
+            {"user_id": user_id}, {"_id": 0, "payload": 0}
+        ))
+
+    def get_payload(self, job_id: str) -> dict | None:
+        """Return the pipeline inputs stored with a queued job. None if missing."""
+        doc = self._mongo_database.find_one({"job_id": job_id}, {"_id": 0, "payload": 1})
+        if not doc:
+            return None
+        return doc.get("payload")
+
+    # ==========================================================================
+    # Worker Queue (queue mode)
+    # ==========================================================================
+
+    def claim_pending(self, worker_id: str) -> dict | None:
+        """
+        Atomically claim the oldest queued job for ``worker_id``.
+
+        The claim moves the job from PENDING to ``validating`` in the same
+        ``find_one_and_update``, so two workers can never both claim it and a
+        concurrent cancel sees an active job (and requests cancellation)
+        rather than flipping a job that is about to run. Served by the
+        ``status_created_at`` index. Returns the claimed document (no _id or
+        payload), or None if the queue is empty.
+        """
+        now = datetime.now(timezone.utc)
+        document = self._mongo_database.find_one_and_update(
+            {"status": "pending", "payload": {"$exists": True}},
+            {"$set": {
+                "status": "validating",
+                "claimed_by": worker_id,
+                "updated_at": now,
+            }},
+            projection={"payload": 0},
+            sort=[("created_at", 1)],
+            return_document=ReturnDocument.AFTER,
+        )
+        if document:
+            document.pop("_id", None)
+        return document
+
+    def heartbeat(self, worker_id: str, job_ids: list[str]) -> int:
+        """
+        Stamp ``updated_at`` on the active jobs a worker is running.
+
+        The claim is held as long as its worker heartbeats: if the worker
+        dies, its jobs go stale and ``reap_stalled`` flips them to ERROR, so
+        they stop counting against the concurrency cap. Returns the number
+        of jobs stamped.
+        """
+        if not job_ids:
+            return 0
+        result = self._mongo_database.update_many(
+            {
+                "job_id": {"$in": job_ids},
+                "claimed_by": worker_id,
+                "status": {"$in": list(ACTIVE_STATUS_VALUES)},
+            },
+            {"$set": {"updated_at": datetime.now(timezone.utc)}},
+        )
+        return result.modified_count
+
+    # ==========================================================================
+    # Single-Flight Coordination
+    # ==========================================================================
+
+    def acquire_flight(self, flight_key: str, job_id: str) -> str | None:
+        """
+        Register ``job_id`` as the job computing ``flight_key``.
+
+        Returns None if the flight was acquired (the caller computes and must
+        ``release_flight`` when done), or the job_id of the active job already
+        holding it. A flight left behind by a job that is no longer active
+        (its worker died before releasing) is taken over.
+        """
+        for _ in range(3):
+            try:
+                self._flights_collection.insert_one({
+                    "_id": flight_key,
+                    "job_id": job_id,
+                    "created_at": datetime.now(timezone.utc),
+                })
+                return None
+            except DuplicateKeyError:
+                pass
+            flight = self._flights_collection.find_one({"_id": flight_key})
+            if flight is None:
+                continue
+            holder = self._mongo_database.find_one(
+                {
+                    "job_id": flight["job_id"],
+                    "status": {"$in": list(ACTIVE_STATUS_VALUES)},
+                },
+                {"_id": 0, "job_id": 1},
+            )
+            if holder:
+                return holder["job_id"]
+            self._flights_collection.delete_one(
+                {"_id": flight_key, "job_id": flight["job_id"]}
+            )
+        # Lost every race for the flight: compute without deduplication
+        logger.warning(f"Could not acquire flight {flight_key} for job {job_id}")
+        return None
+
+    def release_flight(self, flight_key: str, job_id: str) -> int:
+        """Release ``flight_key`` if ``job_id`` holds it. Returns the number released."""
+        return self._flights_collection.delete_one(
+            {"_id": flight_key, "job_id": job_id}
+        ).deleted_count
 
     def set_fields(self, job_id: str, **fields) -> int:
         """
@@ -220,12 +419,59 @@ class SSPIScoringJobs(MongoWrapper):
 
     def events_since(self, job_id: str, last_seq: int) -> list[dict]:
         """Return events with ``seq`` greater than ``last_seq`` (ordered)."""
-        doc = self._mongo_database.find_one(
-            {"job_id": job_id}, {"_id": 0, "events": 1}
-        )
+        doc = self.job_state(job_id, last_seq)
         if not doc:
             return []
-        return [e for e in doc.get("events", []) if e["seq"] > last_seq]
+        return doc["events"]
+
+    def job_state(self, job_id: str, last_seq: int) -> dict | None:
+        """
+        Fetch a job document with only the events after ``last_seq``.
+
+        The ``events`` log is filtered server-side (``$filter`` on ``seq``) so
+        a reader following a job transfers each event once instead of the
+        whole log on every read. None if the job is missing.
+        """
+        pipeline = [
+            {"$match": {"job_id": job_id}},
+            {"$project": {
+                "_id": 0,
+                **{field: 1 for field in JOB_STATE_FIELDS},
+                "events": {"$filter": {
+                    "input": {"$ifNull": ["$events", []]},
+                    "as": "event",
+                    "cond": {"$gt": ["$$event.seq", last_seq]},
+                }},
+            }},
+        ]
+        docs = list(self._mongo_database.aggregate(pipeline))
+        return docs[0] if docs else None
+
+    def watch_job(self, job_id: str, poll_interval: float = 0.5) -> "JobWatch":
+        """
+        Return a JobWatch blocking until the job document changes.
+
+        Uses a change stream when the server supports them (replica sets);
+        after the first failure to open one, this wrapper falls back to
+        polling ``updated_at`` for every later watch.
+        """
+        stream = None
+        if self._change_streams_supported is not False:
+            try:
+                job = self._mongo_database.find_one({"job_id": job_id}, {"_id": 1})
+                if job:
+                    stream = self._mongo_database.watch(
+                        [{"$match": {"documentKey._id": job["_id"]}}],
+                        max_await_time_ms=CHANGE_STREAM_AWAIT_MS,
+                    )
+                    self._change_streams_supported = True
+            except Exception as e:
+                logger.info(
+                    f"Change streams unavailable on {self.name}, "
+                    f"polling for job updates instead: {e}"
+                )
+                self._change_streams_supported = False
+        return JobWatch(self._mongo_database, job_id, stream, poll_interval)
 
     def count_active(self, user_id: str | None = None) -> int:
         """
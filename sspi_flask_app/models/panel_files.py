@@ -0,0 +1,116 @@
+import json
+import os
+import secrets
+import threading
+
+import numpy as np
+from flask import current_app as app
+
+# First year covered by the panel files written at finalization; they run
+# to the current year, like the dynamic line data
+PANEL_MIN_YEAR = 2000
+
+# Missing ranks are stored as this value in int16 rank arrays
+MISSING_RANK = -1
+
+
+def panel_directory() -> str:
+    """
+    Directory holding the panel files, alongside the local/ and snapshots/
+    directories next to the instance path
+    """
+    return os.path.join(os.path.dirname(app.instance_path), "panels")
+
+
+def write_panel(directory: str, name: str, arrays: dict[str, np.ndarray], index: dict) -> str:
+    """
+    Write a panel: one .npy file per array plus a JSON sidecar, name.json,
+    holding index (the code lists labelling each axis) and the array layout.
+
+    Array files carry a fresh version token in their names and the sidecar
+    is replaced last, atomically, so readers see either the old panel or
+    the new one, never a mix. Files of the previous version are removed;
+    workers that still map them keep reading them until they reload.
+    Returns the version token.
+    """
+    os.makedirs(directory, exist_ok=True)
+    version = secrets.token_hex(8)
+    layout = {}
+    for key, array in arrays.items():
+        filename = f"{name}.{version}.{key}.npy"
+        np.save(os.path.join(directory, filename), np.ascontiguousarray(array))
+        layout[key] = {
+            "File": filename,
+            "DType": str(array.dtype),
+            "Shape": list(array.shape),
+        }
+    sidecar_path = os.path.join(directory, f"{name}.json")
+    temporary_path = f"{sidecar_path}.{version}.tmp"
+    with open(temporary_path, "w") as sidecar:
+        json.dump({"Version": version, "Arrays": layout, **index}, sidecar)
+    os.replace(temporary_path, sidecar_path)
+    for filename in os.listdir(directory):
+        if filename.startswith(f"{name}.") and filename.endswith(".npy") \
+                and f".{version}." not in filename:
+            os.remove(os.path.join(directory, filename))
+    return version
+
+
+class PanelFile:
+    """
+    A panel written by write_panel, with its arrays memory-mapped read-only
+    so that every worker shares one copy through the page cache.
+
+    Index entries that are lists of codes (e.g. ItemCodes, CountryCodes)
+    get a code -> position lookup through position.
+    """
+
+    def __init__(self, directory: str, name: str):
+        with open(os.path.join(directory, f"{name}.json")) as sidecar:
+            self.index = json.load(sidecar)
+        self.version = self.index["Version"]
+        self.arrays = {
+            key: np.load(os.path.join(directory, layout["File"]), mmap_mode="r")
+            for key, layout in self.index["Arrays"].items()
+        }
+        self._positions = {}
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        return self.arrays[key]
+
+    def position(self, axis: str, code: str) -> int | None:
+        if axis not in self._positions:
+            self._positions[axis] = {
+                axis_code: i for i, axis_code in enumerate(self.index[axis])
+            }
+        return self._positions[axis].get(code)
+
+
+_panel_files: dict[tuple[str, str], tuple[tuple[int, int], PanelFile]] = {}
+_panel_files_lock = threading.Lock()
+
+
+def load_panel(directory: str, name: str) -> PanelFile | None:
+    """
+    Return the memory-mapped panel name, or None if it has not been written.
+    Panels are opened once per process and reopened when finalization
+    replaces the sidecar.
+    """
+    key = (directory, name)
+    try:
+        stat = os.stat(os.path.join(directory, f"{name}.json"))
+    except FileNotFoundError:
+        return None
+    # The sidecar is replaced, not rewritten, so a new panel has a new inode
+    modified = (stat.st_mtime_ns, stat.st_ino)
+    with _panel_files_lock:
+        cached = _panel_files.get(key)
+        if cached is not None and cached[0] == modified:
+            return cached[1]
+        try:
+            panel = PanelFile(directory, name)
+        except (FileNotFoundError, ValueError, KeyError):
+            # Replaced between reading the sidecar and mapping its arrays
+            return None
+        _panel_files[key] = (modified, panel)
+        return panel
@@ -1,3 +1,9 @@
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterable
+
+import numpy as np
+
+
 class EquivalenceClass:
     def __init__(self, equivalence_value: float, tol=1E-8):
         self.value = equivalence_value
@@ -28,18 +34,15 @@ class SSPIRankingTable:
         self.compute_ranks()
         self.label_ties()
 
-    def assign_classes(self, key):
-        for obs in self.data:
-            value = float(obs[key])
-            matched_class = None
-            for cls in self.classes:
-                if cls.test(value):
-                    matched_class = cls
-                    break
-            if not matched_class:
-                matched_class = EquivalenceClass(value)
-                self.classes.append(matched_class)
-            matched_class.add(obs)
+    def assign_classes(self, key, tol=1E-8):
+        # Each observation joins the first class whose first member is within
+        # tol (EquivalenceClass.test); anchor_classes finds it by bisecting
+        # the sorted class values rather than testing every existing class
+        values = [float(obs[key]) for obs in self.data]
+        for class_id, obs in zip(anchor_classes(values, tol), self.data):
+            if class_id == len(self.classes):
+                self.classes.append(EquivalenceClass(float(obs[key]), tol=tol))
+            self.classes[class_id].add(obs)
 
     def compute_ranks(self):
         self.classes.sort(key=lambda cls: -cls.value, reverse=self.inverted)
@@ -54,3 +57,170 @@ class SSPIRankingTable:
     def label_ties(self):
         for cls in self.classes:
             cls.label_tie()
+
+
+def anchor_classes(values: list[float], tol=1E-8) -> list[int]:
+    """
+    Assign values to equivalence classes exactly as SSPIRankingTable does:
+    in input order, each value joins the first-created class whose first
+    member (its anchor) is within tol, or opens a new class.
+
+    New anchors are at least tol from every existing one, so only the few
+    anchors near a value can match; they are found by bisecting the sorted
+    anchors and checked with the same test as EquivalenceClass.
+
+    :param values: Scores in input order (no NaN)
+    :param tol: Scores closer than this to an anchor join its class
+    :return: The class id of each value; ids count up in creation order
+    """
+    sorted_anchors = []
+    class_ids = []
+    for value in values:
+        candidates = sorted_anchors[
+            bisect_left(sorted_anchors, (value - 2 * tol,)):
+            bisect_right(sorted_anchors, (value + 2 * tol, len(values)))
+        ]
+        matches = [
+            class_id for anchor, class_id in candidates
+            if abs(value - anchor) < tol
+        ]
+        if matches:
+            class_ids.append(min(matches))
+        else:
+            class_id = len(sorted_anchors)
+            insort(sorted_anchors, (value, class_id))
+            class_ids.append(class_id)
+    return class_ids
+
+
+def anchor_ranks(values: np.ndarray, tol=1E-8) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rank and Tie of a 1-D score array with SSPIRankingTable's class scan;
+    the exact fallback of rank_scores and rank_partitions. NaN scores get
+    rank 0 and are never tied.
+    """
+    values = np.asarray(values, dtype=float)
+    ranks = np.zeros(len(values), dtype=int)
+    ties = np.zeros(len(values), dtype=bool)
+    valid = np.flatnonzero(~np.isnan(values))
+    class_ids = np.array(anchor_classes(values[valid].tolist(), tol), dtype=int)
+    if not len(class_ids):
+        return ranks, ties
+    sizes = np.bincount(class_ids)
+    anchors = values[valid][np.unique(class_ids, return_index=True)[1]]
+    # Classes rank by anchor, highest first, creation order breaking ties
+    class_order = np.argsort(-anchors, kind="stable")
+    class_ranks = np.empty(len(sizes), dtype=int)
+    class_ranks[class_order] = np.cumsum(sizes[class_order]) - sizes[class_order] + 1
+    ranks[valid] = class_ranks[class_ids]
+    ties[valid] = sizes[class_ids] > 1
+    return ranks, ties
+
+
+def rank_scores(scores: np.ndarray, axis: int = 1, tol=1E-8) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rank every slice of a score array along one axis in a single sort.
+
+    Higher scores rank better. Tied scores (within tol, as in EquivalenceClass)
+    share the minimum rank of their group and the next distinct score skips
+    ahead, matching SSPIRankingTable. Scores are grouped by sorting and
+    chaining neighbours closer than tol; where every chained group spans less
+    than tol this is exactly SSPIRankingTable's grouping. The rare slices
+    with a wider chain (a run of values each within tol of the next) are
+    re-ranked with anchor_ranks, so Rank and Tie always match.
+
+    :param scores: Array of scores, e.g. (n_items, n_countries, n_years)
+    :param axis: The axis to rank along (the country axis)
+    :param tol: Scores closer than this are tied
+    :return: (ranks, ties) with the shape of scores. NaN scores get rank 0
+    and are never tied.
+    """
+    values = np.moveaxis(np.asarray(scores, dtype=float), axis, -1)
+    valid = ~np.isnan(values)
+    order = np.argsort(np.where(valid, -values, np.inf), axis=-1, kind="stable")
+    sorted_values = np.take_along_axis(values, order, axis=-1)
+    sorted_valid = np.take_along_axis(valid, order, axis=-1)
+    # A new group starts wherever a score is not within tol of the one above
+    starts_group = np.ones(values.shape, dtype=bool)
+    starts_group[..., 1:] = ~(np.abs(sorted_values[..., 1:] - sorted_values[..., :-1]) < tol)
+    positions = np.broadcast_to(np.arange(values.shape[-1]), values.shape)
+    group_start = np.maximum.accumulate(np.where(starts_group, positions, 0), axis=-1)
+    ends_group = np.ones(values.shape, dtype=bool)
+    ends_group[..., :-1] = starts_group[..., 1:]
+    ranks = np.empty(values.shape, dtype=int)
+    ties = np.empty(values.shape, dtype=bool)
+    np.put_along_axis(ranks, order, np.where(sorted_valid, group_start + 1, 0), axis=-1)
+    np.put_along_axis(ties, order, sorted_valid & ~(starts_group & ends_group), axis=-1)
+    # Chains reaching tol or more below their top score are scanned exactly
+    group_top = np.take_along_axis(sorted_values, group_start, axis=-1)
+    wide = np.any(sorted_valid & ~(group_top - sorted_values < tol), axis=-1)
+    for index in map(tuple, np.argwhere(wide)):
+        ranks[index], ties[index] = anchor_ranks(values[index], tol)
+    return np.moveaxis(ranks, -1, axis), np.moveaxis(ties, -1, axis)
+
+
+def rank_partitions(scores: np.ndarray, partitions: np.ndarray, tol=1E-8) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Rank many ragged partitions (e.g. one per (item, year)) in one call.
+
+    The batch counterpart of SSPIRankingTable: observations are ranked only
+    against others with the same partition id, with the same Rank and Tie
+    semantics. One lexsort orders every partition at once and a single sweep
+    over adjacent values finds the tie groups; partitions with a chained
+    group spanning tol or more are re-ranked with anchor_ranks, as in
+    rank_scores.
+
+    :param scores: 1-D array of scores
+    :param partitions: 1-D array of partition ids, one per score
+    :param tol: Scores closer than this are tied
+    :return: (ranks, ties) aligned with scores. NaN scores get rank 0 and
+    are never tied.
+    """
+    values = np.asarray(scores, dtype=float)
+    partitions = np.asarray(partitions)
+    valid = ~np.isnan(values)
+    order = np.lexsort((np.where(valid, -values, np.inf), partitions))
+    sorted_values = values[order]
+    sorted_partitions = partitions[order]
+    n = len(values)
+    positions = np.arange(n)
+    new_partition = np.ones(n, dtype=bool)
+    new_partition[1:] = sorted_partitions[1:] != sorted_partitions[:-1]
+    starts_group = new_partition.copy()
+    starts_group[1:] |= ~(np.abs(sorted_values[1:] - sorted_values[:-1]) < tol)
+    partition_start = np.maximum.accumulate(np.where(new_partition, positions, 0))
+    group_start = np.maximum.accumulate(np.where(starts_group, positions, 0))
+    ends_group = np.ones(n, dtype=bool)
+    ends_group[:-1] = starts_group[1:]
+    ranks = np.empty(n, dtype=int)
+    ties = np.empty(n, dtype=bool)
+    ranks[order] = np.where(valid[order], group_start - partition_start + 1, 0)
+    ties[order] = valid[order] & ~(starts_group & ends_group)
+    wide = valid[order] & ~(sorted_values[group_start] - sorted_values < tol)
+    for partition in np.unique(sorted_partitions[wide]):
+        members = np.flatnonzero(partitions == partition)
+        ranks[members], ties[members] = anchor_ranks(values[members], tol)
+    return ranks, ties
+
+
+def rank_groups(groups: Iterable[list[dict]], key="Score", tol=1E-8):
+    """
+    Set Rank and Tie on every observation, ranking each group separately.
+
+    Equivalent to running SSPIRankingTable on each group (e.g. the countries
+    for one item and year), but ranks all groups in a single batch.
+
+    :param groups: Lists of observations; modified in place
+    :param key: The score field
+    :param tol: Scores closer than this are tied
+    """
+    observations = []
+    partitions = []
+    for partition, group in enumerate(groups):
+        observations.extend(group)
+        partitions.extend([partition] * len(group))
+    scores = np.array([float(obs[key]) for obs in observations], dtype=float)
+    ranks, ties = rank_partitions(scores, np.array(partitions, dtype=int), tol=tol)
+    for obs, rank, tie in zip(observations, ranks.tolist(), ties.tolist()):
+        obs["Rank"] = rank
+        obs["Tie"] = tie
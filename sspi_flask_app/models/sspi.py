@@ -9,61 +9,184 @@ import logging
 log = logging.getLogger(__name__)
 
 class FastSSPI:
-    def __init__(self, item_details: list[dict],):
-        self.item_details_sorted = sorted(item_details, key=lambda d: tuple(d["TreeIndex"]))
+    def __init__(self, item_details: list[dict]):
+        """
+        Score many countries and years at once from an indicator panel
+
+        Aggregates exactly as SSPI does (categories average their
+        IndicatorCodes, pillars their CategoryCodes, the root all pillars),
+        but folds the whole hierarchy into one weight matrix so every
+        country-year is scored with a single matrix multiplication.
+
+        :param item_details: Expects a list of dictionaries in Metadata format (see sspi_metadata)
+        """
+        self.item_details = item_details
+        self.load_structure()
         self.score_matrix = self.build_score_matrix()
 
-    def build_score_matrix(self):
-        n_indicators = sum(1 for item in self.item_details_sorted if item["ItemType"] == "Indicator")
-        print(n_indicators)
-        n_categories = sum(1 for item in self.item_details_sorted if item["ItemType"] == "Category")
-        print(n_categories)
-        n_pillars = sum(1 for item in self.item_details_sorted if item["ItemType"] == "Pillar")
-        print(n_pillars)
-        score_matrix = np.zeros((n_indicators, n_categories + n_pillars + 1), dtype=float)
-        sspi_multiple = 1
-        pillar_multiple, pillar_index, pillar_current = 1, -1, ""
-        category_multiple, category_index, category_current = 1, -1, ""
-        indicator_index = 0
-        item_list = ["" for i in range(n_categories + n_pillars)]
-        item_list.append("SSPI")
-        item_codes = {d["ItemCode"] for d in self.item_details_sorted}
-        for item in self.item_details_sorted:
-            item_type = item['ItemType']
-            multiple = sum(1 for c in item['Children'] if c in item_codes)
-            item["TreeIndex"]
-            if item_type == "SSPI": ## Fill the last column with the overall SSPI weight
-                sspi_multiple = multiple 
+    def load_structure(self):
+        self.pillar_details = []
+        self.category_details = []
+        self.indicator_details = []
+        self.root_detail = None
+        for item in self.item_details:
+            item_type = item.get("ItemType", None)
+            item_code = item.get("ItemCode", None)
+            if not item_type or not item_code:
+                msg = f"Missing ItemType and/or ItemCode in item details: {item}"
+                raise InvalidDocumentFormatError(msg)
+            if item_type == "SSPI":
+                self.root_detail = item
             elif item_type == "Pillar":
-                pillar_multiple = multiple
-                pillar_index += 1
-                pillar_current = item["PillarCode"]
+                self.pillar_details.append(item)
             elif item_type == "Category":
-                category_multiple = multiple
-                category_index += 1
-                category_current = item["CategoryCode"]
-            elif item_type == "Indicator":  ## Only set on encountering an indicator (now we can fill a row)
-                sspi_weight = 1 / (category_multiple * pillar_multiple * sspi_multiple)
-                pillar_weight = 1 / (category_multiple * pillar_multiple )
-                category_weight = 1 / (category_multiple )
-                assert category_index != -1
-                assert pillar_index != -1
-                score_matrix[indicator_index, category_index] = category_weight
-                if not item_list[category_index]:
-                    item_list[category_index] = category_current
-                assert category_current == item_list[category_index], f"{category_current} != {item_list[category_index]}"
-                score_matrix[indicator_index, n_categories + pillar_index] = pillar_weight
-                if not item_list[n_categories + pillar_index]:
-                    item_list[n_categories + pillar_index] = pillar_current
-                assert pillar_current == item_list[n_categories + pillar_index]
-                score_matrix[indicator_index, n_categories + n_pillars] = sspi_weight
-                indicator_index += 1
-        self.item_list = item_list
-        assert all(item_list)
-        return score_matrix
+                self.category_details.append(item)
+            elif item_type == "Indicator":
+                self.indicator_details.append(item)
+            else:
+                msg = f"Unknown ItemType {item_type} in item details."
+                raise InvalidDocumentFormatError(msg)
+        self.indicator_codes = [i["ItemCode"] for i in self.indicator_details]
+        self.category_codes = [c["ItemCode"] for c in self.category_details]
+        self.pillar_codes = [p["ItemCode"] for p in self.pillar_details]
+        self.indicator_index = {code: i for i, code in enumerate(self.indicator_codes)}
+        # Columns of the score matrix: categories, then pillars, then SSPI
+        self.item_list = self.category_codes + self.pillar_codes + ["SSPI"]
 
-    def get_sorted_item_details(self):
-        return self.item_details_sorted
+    def build_score_matrix(self) -> np.ndarray:
+        """
+        Weight of each indicator (rows) in each aggregate item (columns)
+        """
+        n_indicators = len(self.indicator_codes)
+        n_categories = len(self.category_codes)
+        category_weights = np.zeros((n_indicators, n_categories), dtype=float)
+        for j, cat in enumerate(self.category_details):
+            indicator_codes = cat.get("IndicatorCodes", [])
+            if not indicator_codes:
+                raise InvalidDocumentFormatError(
+                    f"Category {cat['ItemCode']} has no indicators defined."
+                )
+            for ic in indicator_codes:
+                if ic not in self.indicator_index:
+                    raise KeyError(f"ItemCode {ic} not found in item details.")
+                category_weights[self.indicator_index[ic], j] += 1 / len(indicator_codes)
+        category_index = {code: j for j, code in enumerate(self.category_codes)}
+        pillar_weights = np.zeros((n_categories, len(self.pillar_codes)), dtype=float)
+        for k, pil in enumerate(self.pillar_details):
+            category_codes = pil.get("CategoryCodes", [])
+            if not category_codes:
+                raise InvalidDocumentFormatError(
+                    f"Pillar {pil['ItemCode']} has no categories defined."
+                )
+            for cc in category_codes:
+                if cc not in category_index:
+                    raise KeyError(f"ItemCode {cc} not found in item details.")
+                pillar_weights[category_index[cc], k] += 1 / len(category_codes)
+        # The root averages every pillar, as in SSPI.score
+        root_weights = np.full((len(self.pillar_codes), 1), 1 / len(self.pillar_codes))
+        indicator_to_pillar = category_weights @ pillar_weights
+        return np.hstack([
+            category_weights,
+            indicator_to_pillar,
+            indicator_to_pillar @ root_weights
+        ])
+
+    def aggregate(self, indicator_scores: np.ndarray) -> np.ndarray:
+        """
+        Aggregate an (n_indicators, n_countries, n_years) score panel to an
+        (n_items, n_countries, n_years) panel ordered as item_list
+        """
+        n_indicators, n_countries, n_years = indicator_scores.shape
+        flat_scores = indicator_scores.reshape(n_indicators, n_countries * n_years)
+        aggregated = self.score_matrix.T @ flat_scores
+        return aggregated.reshape(len(self.item_list), n_countries, n_years)
+
+    def load_panel(self, indicator_scores: list[dict]) -> tuple[np.ndarray, list[str], list[int], np.ndarray]:
+        """
+        Load indicator score documents into an (n_indicators, n_countries,
+        n_years) panel, validating them as SSPI does for each country-year
+
+        :return: The panel, its country codes, its years and a (n_countries,
+        n_years) mask of the country-years present in the data
+        """
+        assert all(d.get("Year") is not None for d in indicator_scores), \
+            "All indicator scores must have Year specified"
+        country_codes = sorted({d.get("CountryCode") for d in indicator_scores})
+        years = sorted({d["Year"] for d in indicator_scores})
+        country_index = {code: i for i, code in enumerate(country_codes)}
+        year_index = {year: i for i, year in enumerate(years)}
+        shape = (len(self.indicator_codes), len(country_codes), len(years))
+        rows, cols, slices, scores = [], [], [], []
+        for ind in indicator_scores:
+            i = self.indicator_index.get(ind["IndicatorCode"], None)
+            if i is None:
+                raise DataMetadataMismatchError(
+                    f"IndicatorCode {ind['IndicatorCode']} not found in item details."
+                )
+            score = ind.get("Score", None)
+            assert score is not None, \
+                f"Score for indicator {ind['IndicatorCode']} is missing in indicator_scores."
+            rows.append(i)
+            cols.append(country_index[ind.get("CountryCode")])
+            slices.append(year_index[ind["Year"]])
+            scores.append(score)
+        panel = np.full(shape, np.nan)
+        panel[rows, cols, slices] = scores
+        flat_index = np.ravel_multi_index((rows, cols, slices), shape) if rows else np.array([], dtype=int)
+        counts = np.bincount(flat_index, minlength=panel.size).reshape(shape)
+        # Every country-year with data must carry each indicator exactly once
+        present = counts.any(axis=0)
+        complete = (counts == 1).all(axis=0)
+        for c, y in zip(*np.nonzero(present & ~complete)):
+            self._raise_mismatch(indicator_scores, country_codes[c], years[y])
+        return panel, country_codes, years, present
+
+    def _raise_mismatch(self, indicator_scores: list[dict], country_code: str, year: int):
+        cell_scores = [
+            d for d in indicator_scores
+            if d.get("CountryCode") == country_code and d.get("Year") == year
+        ]
+        indicator_codes_data = [str(d.get("IndicatorCode")) for d in cell_scores]
+        symmetric_diff = set(self.indicator_codes) ^ set(indicator_codes_data)
+        raise DataMetadataMismatchError(
+            "Number of indicator codes does not match number of indicator scores:"
+            f" {len(self.indicator_codes)} vs {len(cell_scores)}\n"
+            f"CountryCode: {country_code}\n"
+            f"Year: {year}\n"
+            f"Symmetric difference: {symmetric_diff}\n"
+            f"Repeats in Metadata Codes: {detect_repeated_item(self.indicator_codes)}\n"
+            f"Repeats in Data Codes: {detect_repeated_item(indicator_codes_data)}\n"
+            f"Metadata codes: {sorted(self.indicator_codes)}\n"
+            f"Data codes: {sorted(indicator_codes_data)}"
+        )
+
+    def to_score_documents(self, indicator_scores: list[dict]) -> list[dict]:
+        """
+        Score every country-year in indicator_scores and return the same
+        documents SSPI.to_score_documents produces for each of them
+        """
+        panel, country_codes, years, present = self.load_panel(indicator_scores)
+        aggregated = self.aggregate(panel)
+        row_of = {code: i for i, code in enumerate(self.indicator_codes)}
+        row_of.update({code: len(self.indicator_codes) + j for j, code in enumerate(self.item_list)})
+        detail_items = [(d["ItemCode"], d["ItemType"]) for d in self.item_details]
+        detail_rows = [row_of[code] for code, _ in detail_items]
+        cells = np.nonzero(present)
+        # (n_cells, n_detail_items) as nested lists, so the document loop
+        # below touches no NumPy scalars
+        cell_scores = np.concatenate([panel, aggregated])[detail_rows][:, cells[0], cells[1]].T.tolist()
+        docs = []
+        for c, y, scores in zip(cells[0].tolist(), cells[1].tolist(), cell_scores):
+            country_code, year = country_codes[c], years[y]
+            for (item_code, item_type), score in zip(detail_items, scores):
+                docs.append({
+                    "CountryCode": country_code,
+                    "ItemCode": item_code,
+                    "ItemType": item_type,
+                    "Score": score,
+                    "Year": year
+                })
+        return docs
 
 
 class SSPI:
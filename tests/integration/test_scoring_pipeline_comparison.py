@@ -41,15 +41,14 @@ how this test pins them — F2 inherits this contract):
    makes the parent NaN, and NaN parents are dropped). Because (1) guarantees
    every child is present, this divergence never fires here. Do not rely on it.
 
-3. Ranking tie-breaks. The fast engine ranks with ``np.argsort`` (NOT stable);
-   the slow engine ranks with Python's stable ``sorted``. For *tied* scores the
-   two engines may hand the tied countries different rank *numbers*. This test
-   therefore pins ranking via the **rank -> score mapping**: for each
-   (item, year) the score sitting at rank ``r`` must be identical across
-   engines (tolerance ``1e-6``). Tied countries share a score, so this is
-   invariant to which tied country won which adjacent rank. A dedicated tie
-   case additionally asserts the tied countries occupy a contiguous rank pair
-   in both engines and that every non-tied country's rank matches exactly.
+3. Ranking ties. Both engines rank through ``models.rank.rank_scores``: scores
+   within ``1e-8`` (0-1 scale) share the minimum rank and carry ``tie=True``,
+   so ranks are competition-style (1, 2, 2, 4) rather than a permutation. This
+   test pins ranking via the **rank -> score mapping**: for each (item, year)
+   the score sitting at rank ``r`` must be identical across engines
+   (tolerance ``1e-6``). A dedicated tie case additionally asserts the tied
+   countries share a rank in both engines and that every non-tied country's
+   rank matches exactly.
 
 4. The ``imputed`` / ``imputation_method`` fields are NOT part of the parity
    contract (the fast dict serializer hard-codes ``imputed=False``). Only
@@ -422,19 +421,25 @@ class TestRankParity:
                         f"slow={score} fast={frank[rank]}"
                     )
 
-    def test_ranks_are_a_permutation_of_1_to_n(self, complete_results):
+    def test_ranks_are_competition_ranks(self, complete_results):
         # Every country is present after imputation, so every (item, year)
-        # assigns the ranks 1..n_countries exactly once.
-        n = len(COUNTRIES)
+        # ranks all countries: rank = 1 + number of strictly better scores.
         for engine in ("slow", "fast"):
             for code, docs in complete_results[engine].items():
                 by_year = collections.defaultdict(list)
                 for d in docs:
-                    by_year[d["year"]].append(d["rank"])
-                for year, ranks in by_year.items():
-                    assert sorted(ranks) == list(range(1, n + 1)), (
-                        f"{engine} {code} {year} ranks not 1..{n}: {sorted(ranks)}"
-                    )
+                    by_year[d["year"]].append(d)
+                for year, year_docs in by_year.items():
+                    assert len(year_docs) == len(COUNTRIES)
+                    for d in year_docs:
+                        better = sum(
+                            1 for o in year_docs
+                            if o["score"] - d["score"] > SCORE_TOL
+                        )
+                        assert d["rank"] == better + 1, (
+                            f"{engine} {code} {year} {d['country_code']}: "
+                            f"rank {d['rank']} with {better} better scores"
+                        )
 
 
 class TestTieRankingContract:
@@ -451,19 +456,21 @@ class TestTieRankingContract:
                     f"{engine} USA/CAN not tied @ {year}: {usa} vs {can}"
                 )
 
-    def test_tied_pair_occupies_contiguous_ranks(self, complete_results):
-        # In both engines the two tied countries must take an adjacent rank
-        # pair {k, k+1}, and the non-tied countries must get identical ranks.
+    def test_tied_pair_shares_rank(self, complete_results):
+        # In both engines the two tied countries share one rank and are
+        # flagged as tied; MEX is distinct from them at the SSPI level.
         for code in ["SSPI", "PILLR1", "PILLR2", "CATG01"]:
             for engine in ("slow", "fast"):
                 idx = _index_by_cell(complete_results[engine][code])
                 for year in YEARS:
-                    usa_rank = idx[("USA", year)]["rank"]
-                    can_rank = idx[("CAN", year)]["rank"]
-                    assert abs(usa_rank - can_rank) == 1, (
-                        f"{engine} {code} {year}: USA/CAN ranks not adjacent "
-                        f"({usa_rank}, {can_rank})"
+                    usa, can = idx[("USA", year)], idx[("CAN", year)]
+                    assert usa["rank"] == can["rank"], (
+                        f"{engine} {code} {year}: USA/CAN ranks differ "
+                        f"({usa['rank']}, {can['rank']})"
                     )
+                    assert usa["tie"] and can["tie"]
+                    if code == "SSPI":
+                        assert not idx[("MEX", year)]["tie"]
 
     def test_non_tied_country_ranks_match_exactly(self, complete_results):
         # MEX and BRA are distinct from the tied pair and from each other at the
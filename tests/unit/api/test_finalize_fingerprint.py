@@ -0,0 +1,22 @@
+from sspi_flask_app.api.core.finalize import country_year_fingerprint
+
+
+def indicator_data():
+    return [
+        {"CountryCode": "USA", "IndicatorCode": "BIODIV", "Year": 2018, "Score": 0.5},
+        {"CountryCode": "USA", "IndicatorCode": "REDLST", "Year": 2018, "Score": 0.25},
+    ]
+
+
+def test_fingerprint_ignores_document_order():
+    data = indicator_data()
+    assert country_year_fingerprint(data, "key") == country_year_fingerprint(data[::-1], "key")
+
+
+def test_fingerprint_changes_with_scores_and_scoring_key():
+    baseline = country_year_fingerprint(indicator_data(), "key")
+    changed = indicator_data()
+    changed[1]["Score"] = 0.26
+    assert country_year_fingerprint(changed, "key") != baseline
+    assert country_year_fingerprint(indicator_data(), "other") != baseline
+    assert country_year_fingerprint(indicator_data()[:1], "key") != baseline
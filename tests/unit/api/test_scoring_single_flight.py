@@ -0,0 +1,101 @@
+"""
+Unit tests for single-flight deduplication of identical scoring jobs.
+
+These tests require a live MongoDB and write only to a dedicated, disposable
+collection (``test_scoring_jobs_flight``). The scoring_tasks singleton is
+monkeypatched to point at that collection.
+
+Run with:
+    pytest tests/unit/api/test_scoring_single_flight.py
+"""
+import pytest
+import time
+from datetime import datetime, timezone, timedelta
+from threading import Thread
+
+import sspi_flask_app.api.resources.scoring_tasks as st
+from sspi_flask_app.models.database import sspidb
+from sspi_flask_app.models.database.sspi_scoring_jobs import SSPIScoringJobs
+
+
+@pytest.fixture(scope="function")
+def patched_store(monkeypatch):
+    """Point scoring_tasks at a disposable scoring-jobs collection."""
+    collection = sspidb.test_scoring_jobs_flight
+    collection.delete_many({})
+    model = SSPIScoringJobs(collection)
+    model.create_indexes()
+    monkeypatch.setattr(st, "sspi_scoring_jobs", model)
+    yield model
+    collection.delete_many({})
+    sspidb.drop_collection(collection)
+    sspidb.drop_collection(sspidb.test_scoring_jobs_flight_flights)
+
+
+def _insert(model, job_id, status="scoring"):
+    now = datetime.now(timezone.utc)
+    model.create_job({
+        "job_id": job_id,
+        "config_id": f"cfg_{job_id}",
+        "config_hash": "hash",
+        "user_id": "alice",
+        "status": status,
+        "progress": 0,
+        "message": "",
+        "stage": None,
+        "stage_current": None,
+        "stage_total": None,
+        "result": None,
+        "error": None,
+        "cancel_requested": False,
+        "seq": 0,
+        "events": [],
+        "created_at": now,
+        "updated_at": now,
+        "completed_at": None,
+        "expire_at": now + timedelta(seconds=3600),
+        "worker_pid": 0,
+    })
+
+
+def _follow(job_id, leader_id):
+    outcome = {}
+
+    def run():
+        outcome["adopted"] = st._follow_flight(st.get_job(job_id), leader_id, time.time())
+
+    thread = Thread(target=run)
+    thread.start()
+    return thread, outcome
+
+
+def test_should_mirror_and_adopt_leader_result(patched_store):
+    _insert(patched_store, "leader")
+    _insert(patched_store, "follower", status="validating")
+    leader = st.get_job("leader")
+    leader.emit_stage_complete("validate", "Metadata Validated")
+    leader.emit_stage_complete("identify", "Scoring 2 Indicators", {"modified": 2})
+    thread, outcome = _follow("follower", "leader")
+    leader.emit_stage_progress("scoring", 1, 2)
+    time.sleep(0.2)
+    leader.emit_complete(120, 50)
+    thread.join(timeout=10)
+    assert outcome["adopted"] is True
+    doc = patched_store.get("follower")
+    assert doc["status"] == "complete"
+    assert doc["result"]["total_scores"] == 120
+    assert doc["result"]["cached"] is True
+    stages = [e["data"]["stage"] for e in doc["events"] if e["event_type"] == "stage_complete"]
+    # The follower emitted its own validate stage before following
+    assert stages == ["identify"]
+    assert doc["stage_total"] == 2
+
+
+def test_should_take_over_when_leader_fails(patched_store):
+    _insert(patched_store, "leader")
+    _insert(patched_store, "follower", status="validating")
+    thread, outcome = _follow("follower", "leader")
+    st.get_job("leader").emit_error("boom")
+    thread.join(timeout=10)
+    assert outcome["adopted"] is False
+    assert patched_store.get("follower")["status"] == "scoring"
@@ -0,0 +1,97 @@
+import math
+from copy import deepcopy
+
+import numpy as np
+import pytest
+
+from sspi_flask_app.api.resources.utilities import goalpost, score_indicator
+
+
+def dataset_documents(seed=7):
+    rng = np.random.default_rng(seed)
+    documents = []
+    for country in ("AUS", "URU", "USA", "FRA", "JPN"):
+        for year in range(2000, 2012):
+            for dataset_code in ("SETA", "SETB", "SETC"):
+                # Leave some observations incomplete
+                if rng.random() < 0.15:
+                    continue
+                documents.append({
+                    "DatasetCode": dataset_code,
+                    "CountryCode": country,
+                    "Year": year,
+                    "Value": float(rng.uniform(-20, 120)),
+                    "Unit": "Index",
+                })
+    return documents
+
+
+def score_both(documents, *args, **kwargs):
+    expected = score_indicator(deepcopy(documents), "TSTIND", *args, **kwargs)
+    actual = score_indicator(deepcopy(documents), "TSTIND", *args, columnar=True, **kwargs)
+    return expected, actual
+
+
+def test_goalpost_array_matches_scalar():
+    values = np.array([-5.0, 0.0, 3.0, 10.0, 15.0, math.inf, -math.inf, 1e308])
+    lowers = np.array([0.0, 0.0, 3.0, 10.0, 0.0, 0.0, 0.0, -1e308])
+    uppers = np.array([10.0, 0.0, 3.0, 0.0, 10.0, math.inf, 10.0, 1e308])
+    scores = goalpost(values, lowers, uppers)
+    assert scores.tolist() == [
+        goalpost(v, l, u) for v, l, u in zip(values.tolist(), lowers.tolist(), uppers.tolist())
+    ]
+    assert goalpost(np.array([5.0, 20.0]), 0, 10).tolist() == [0.5, 1.0]
+    with pytest.raises(ValueError):
+        goalpost(np.array([1.0, math.nan]), 0, 10)
+    with pytest.raises(ValueError):
+        goalpost(np.array([1.0]), math.nan, 10)
+
+
+def test_columnar_matches_default_for_goalpost_combinations():
+    documents = dataset_documents()
+
+    def score_function(SETA, SETB, SETC):
+        return 0.5 * goalpost(SETA, 0, 100) + 0.25 * goalpost(SETB, 100, 0) + 0.25 * goalpost(SETC - SETA, -50, 50)
+
+    expected, actual = score_both(
+        documents, score_function, "Index",
+        compute_series_specification=[("SETD", "Index", lambda SETA, SETB: SETA + SETB)],
+    )
+    assert actual == expected
+    assert len(actual[0]) > 0 and len(actual[1]) > 0
+    assert all(type(document["Score"]) is float for document in actual[0])
+    assert actual[0][0]["Datasets"][-1]["DatasetCode"] == "SETD"
+
+
+def test_columnar_falls_back_per_row():
+    documents = dataset_documents()
+
+    def score_function(SETA, SETB):
+        # min/max and branches do not vectorize
+        return max(0.0, min(1.0, SETA / 100)) if SETB > 0 else 0.0
+
+    def unit(SETA, SETB):
+        return "Positive" if SETB > 0 else "Nonpositive"
+
+    expected, actual = score_both(documents, score_function, unit)
+    assert actual == expected
+    # Non-float results are kept as they are
+    expected, actual = score_both(documents, lambda SETA: (goalpost(SETA, 0, 100),), "Index")
+    assert actual == expected
+    assert isinstance(actual[0][0]["Score"], tuple)
+
+
+def test_columnar_raises_like_default():
+    documents = [
+        {"DatasetCode": "SETA", "CountryCode": c, "Year": 2020, "Value": v, "Unit": "Index"}
+        for c, v in (("AUS", 1.0), ("URU", 0.0))
+    ]
+    with pytest.raises(ZeroDivisionError):
+        score_indicator(deepcopy(documents), "TSTIND", lambda SETA: 1 / SETA, "Index", columnar=True)
+    # Failed computed series rows are skipped, as in score_indicator
+    expected, actual = score_both(
+        documents, lambda SETB: SETB, "Index",
+        compute_series_specification=[("SETB", "Index", lambda SETA: 1 / SETA)],
+    )
+    assert actual == expected
+    assert [document["CountryCode"] for document in actual[0]] == ["AUS"]
@@ -0,0 +1,69 @@
+import pytest
+
+from sspi_flask_app.models.database import sspidb
+from sspi_flask_app.models.database.coverage_index import (
+    mask_years,
+    year_mask,
+    year_range_mask,
+)
+from sspi_flask_app.models.database.sspi_indicator_data import SSPIIndicatorData
+
+
+@pytest.fixture(scope="function")
+def indicator_data():
+    sspi_test_db = sspidb.sspi_test_db
+    sspi_test_db.delete_many({})
+    sspidb.sspi_test_db_coverage.delete_many({})
+    yield SSPIIndicatorData(sspi_test_db)
+    sspi_test_db.delete_many({})
+    sspidb.sspi_test_db_coverage.delete_many({})
+
+
+def observations(indicator_code, country_code, years):
+    return [
+        {
+            "IndicatorCode": indicator_code,
+            "CountryCode": country_code,
+            "Year": year,
+            "Score": 0.5,
+            "Unit": "Index",
+        }
+        for year in years
+    ]
+
+
+def test_year_masks():
+    mask = year_mask([2000, 2001, 2003])
+    assert mask_years(mask) == [2000, 2001, 2003]
+    assert mask_years(mask, 2001) == [2001, 2003]
+    required = year_range_mask(2000, 2003)
+    assert mask_years(required) == [2000, 2001, 2002, 2003]
+    assert mask & required != required
+    assert (mask | year_mask([2002])) & required == required
+    assert year_range_mask(2003, 2000) == 0
+
+
+def test_coverage_masks_follow_writes(indicator_data, monkeypatch):
+    indicator_data.insert_many(
+        observations("BIODIV", "AUS", range(2000, 2004))
+        + observations("BIODIV", "URU", [2000, 2002])
+    )
+    masks = indicator_data.coverage_masks(["BIODIV", "REDLST"])
+    assert mask_years(masks["BIODIV"]["AUS"]) == [2000, 2001, 2002, 2003]
+    assert mask_years(masks["BIODIV"]["URU"]) == [2000, 2002]
+    assert masks["REDLST"] == {}
+    # Fresh indicators are served from the index without aggregating
+    with monkeypatch.context() as m:
+        m.setattr(indicator_data._mongo_database, "aggregate", None)
+        assert indicator_data.coverage_masks(["BIODIV", "REDLST"]) == masks
+    # Inserts and deletes mark only the indicators they touch as stale
+    indicator_data.insert_many(observations("REDLST", "URU", [2001]))
+    indicator_data.delete_many({"IndicatorCode": "BIODIV", "CountryCode": "AUS", "Year": 2003})
+    masks = indicator_data.coverage_masks(["BIODIV", "REDLST"])
+    assert mask_years(masks["BIODIV"]["AUS"]) == [2000, 2001, 2002]
+    assert mask_years(masks["REDLST"]["URU"]) == [2001]
+    # Queries not restricted to indicators mark every indicator as stale
+    indicator_data.delete_many({"CountryCode": "URU"})
+    masks = indicator_data.coverage_masks(["BIODIV", "REDLST"])
+    assert "URU" not in masks["BIODIV"]
+    assert masks["REDLST"] == {}
@@ -37,6 +37,7 @@ def item_cache():
     yield wrapper
     collection.delete_many({})
     sspidb.drop_collection(collection)
+    sspidb.drop_collection(f"{collection.name}_manifests")
 
 
 @pytest.fixture(scope="function")
@@ -137,3 +138,22 @@ def test_should_reject_flat_item_shaped_docs_in_line_cache(panel_cache):
     with pytest.raises(InvalidDocumentFormatError):
         panel_cache.store_line_data(CONFIG_HASH, flat_shaped)
     assert panel_cache.count_documents({"config_hash": CONFIG_HASH}) == 0
+
+
+def test_should_publish_manifest_and_drop_it_on_clear(item_cache):
+    assert item_cache.get_manifest(CONFIG_HASH) is None
+    item_cache.store_scoring_results(CONFIG_HASH, _flat_scores())
+    item_cache.write_manifest(CONFIG_HASH, 2, 1, ["BIODIV", "BIODIV"], "v1")
+    manifest = item_cache.get_manifest(CONFIG_HASH)
+    assert manifest["item_count"] == 2
+    assert manifest["line_count"] == 1
+    assert manifest["item_codes"] == ["BIODIV"]
+    assert manifest["data_version"] == "v1"
+    assert "_id" not in manifest
+
+    # Re-storing removes the manifest until the new run publishes its own
+    item_cache.store_scoring_results(CONFIG_HASH, _flat_scores())
+    assert item_cache.get_manifest(CONFIG_HASH) is None
+    item_cache.write_manifest(CONFIG_HASH, 2, 1, ["BIODIV"], "v2")
+    item_cache.clear_by_hash(CONFIG_HASH)
+    assert item_cache.get_manifest(CONFIG_HASH) is None
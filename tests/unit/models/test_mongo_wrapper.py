@@ -1,6 +1,11 @@
 from datetime import datetime
+import json
 import pytest
-from sspi_flask_app.models.database.mongo_wrapper import MongoWrapper
+from bson import ObjectId, json_util
+from sspi_flask_app.models.database.mongo_wrapper import (
+    MongoWrapper,
+    extended_json_codec
+)
 from sspi_flask_app.models.database import sspidb
 from sspi_flask_app.models.errors import InvalidDocumentFormatError
 
@@ -176,3 +181,43 @@ def test_drop_duplicates(test_documents, mongo_wrapper):
     assert len(mongo_wrapper.find({"IndicatorCode": "BIODIV"})) == 1
     assert len(mongo_wrapper.find({"IndicatorCode": "REDLST"})) == 1
     assert len(mongo_wrapper.find({"IndicatorCode": "NITROG"})) == 1
+
+
+def test_extended_json_codec_matches_json_util_round_trip():
+    document = {
+        "_id": ObjectId(),
+        "CountryCode": "USA",
+        "Year": 2015,
+        "Value": 25.2,
+        "Missing": float("nan"),
+        "Unbounded": float("inf"),
+        "Flag": True,
+        "Empty": None,
+        "CollectedAt": datetime(2020, 1, 6),
+        "Datasets": [{"DatasetCode": "WB_POPULN", "Value": 1, "Ids": [ObjectId()]}],
+    }
+    assert extended_json_codec(document) == json.loads(json_util.dumps(document))
+
+
+def test_iter_find(test_documents, mongo_wrapper):
+    mongo_wrapper.insert_many(
+        [v for k, v in test_documents.items() if type(k) is str])
+    cursor = mongo_wrapper.iter_find({"IndicatorCode": "NITROG"})
+    assert not isinstance(cursor, list)
+    documents = list(cursor)
+    assert len(documents) == 2
+    assert all(type(document["CollectedAt"]) is datetime for document in documents)
+    assert len(list(mongo_wrapper.iter_find({}, limit=1))) == 1
+    encoded = list(mongo_wrapper.iter_find({}, {}, codec=extended_json_codec))
+    assert all("$oid" in document["_id"] for document in encoded)
+    assert encoded == mongo_wrapper.find({}, {})
+
+
+def test_iter_aggregate(test_documents, mongo_wrapper):
+    mongo_wrapper.insert_many(
+        [v for k, v in test_documents.items() if type(k) is str])
+    pipeline = [
+        {"$group": {"_id": "$IndicatorCode", "count": {"$sum": 1}}},
+        {"$sort": {"_id": 1}}
+    ]
+    assert list(mongo_wrapper.iter_aggregate(pipeline)) == mongo_wrapper.aggregate(pipeline)
@@ -0,0 +1,43 @@
+import numpy as np
+
+from sspi_flask_app.api.core.finalize import fill_panel
+from sspi_flask_app.models.panel_files import MISSING_RANK, load_panel, write_panel
+
+
+def test_fill_panel_places_numeric_observations():
+    documents = [
+        {"ItemCode": "SSPI", "CountryCode": "URU", "Year": 2001, "Score": 0.5},
+        {"ItemCode": "BIODIV", "CountryCode": "AUS", "Year": 2000, "Score": 1},
+        {"ItemCode": "BIODIV", "CountryCode": "AUS", "Year": 2001, "Score": None},
+        {"ItemCode": "BIODIV", "CountryCode": "AUS", "Year": 2030, "Score": 0.1},
+        {"ItemCode": "REDLST", "CountryCode": "AUS", "Year": 2000, "Score": 0.1},
+    ]
+    panel = fill_panel(documents, "ItemCode", "Score", ["BIODIV", "SSPI"], ["AUS", "URU"], [2000, 2001])
+    assert panel.shape == (2, 2, 2)
+    assert panel[0, 0, 0] == 1.0 and np.isnan(panel[0, 0, 1])
+    assert panel[1, 1, 1] == 0.5
+    assert np.isnan(panel).sum() == 6
+
+
+def test_panels_are_memory_mapped_and_replaced_atomically(tmp_path):
+    scores = np.arange(12, dtype=float).reshape(2, 3, 2)
+    ranks = np.full(scores.shape, MISSING_RANK, dtype=np.int16)
+    index = {"ItemCodes": ["BIODIV", "SSPI"], "CountryCodes": ["AUS", "FRA", "URU"], "Years": [2000, 2001]}
+    assert load_panel(str(tmp_path), "items") is None
+    write_panel(str(tmp_path), "items", {"scores": scores, "ranks": ranks}, index)
+    panel = load_panel(str(tmp_path), "items")
+    assert isinstance(panel["scores"], np.memmap)
+    assert not panel["scores"].flags.writeable
+    assert panel["scores"][panel.position("ItemCodes", "SSPI")].tolist() == scores[1].tolist()
+    assert panel["ranks"].dtype == np.int16
+    assert panel.position("CountryCodes", "USA") is None
+    # Loaded once per process until the panel is rewritten
+    assert load_panel(str(tmp_path), "items") is panel
+    first = panel["scores"]
+    write_panel(str(tmp_path), "items", {"scores": scores + 1, "ranks": ranks}, index)
+    reloaded = load_panel(str(tmp_path), "items")
+    assert reloaded.version != panel.version
+    assert reloaded["scores"][0, 0, 0] == 1.0
+    # Maps opened before the rewrite keep reading the previous version
+    assert first[0, 0, 0] == 0.0
+    assert len(list(tmp_path.glob("items.*.npy"))) == 2
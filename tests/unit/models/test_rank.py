@@ -1,4 +1,7 @@
-from sspi_flask_app.models.rank import SSPIRankingTable
+from sspi_flask_app.models.rank import (
+    SSPIRankingTable, rank_scores, rank_partitions, rank_groups
+)
+import numpy as np
 import pytest
 
 
@@ -107,3 +110,112 @@ def test_rankings_modify_in_place(test_country_score_data):
     assert len(rankings.classes) == 4
     for data in test_country_score_data:
         assert "Rank" in data.keys()
+
+
+def test_rank_scores_standard_ties(test_country_score_data):
+    scores = np.array([obs["Score"] for obs in test_country_score_data[0:6]])
+    ranks, ties = rank_scores(scores, axis=0)
+    SSPIRankingTable(test_country_score_data[0:6])
+    assert ranks.tolist() == [obs["Rank"] for obs in test_country_score_data[0:6]]
+    assert ties.tolist() == [obs["Tie"] for obs in test_country_score_data[0:6]]
+
+
+def test_rank_scores_tolerance_and_nan():
+    ranks, ties = rank_scores(np.array([0.5, np.nan, 0.5 + 1E-9, 0.9, np.nan]), axis=0)
+    assert ranks.tolist() == [2, 0, 2, 1, 0]
+    assert ties.tolist() == [True, False, True, False, False]
+
+
+def test_rank_scores_matches_ranking_table_per_slice():
+    rng = np.random.default_rng(0)
+    scores = rng.integers(0, 6, size=(3, 12, 4)) / 5
+    ranks, ties = rank_scores(scores, axis=1)
+    for item in range(scores.shape[0]):
+        for year in range(scores.shape[2]):
+            data = [{"Score": s} for s in scores[item, :, year]]
+            SSPIRankingTable(data)
+            assert ranks[item, :, year].tolist() == [obs["Rank"] for obs in data]
+            assert ties[item, :, year].tolist() == [obs["Tie"] for obs in data]
+
+
+def test_ranking_classes_keep_input_order(test_country_score_data):
+    rankings = SSPIRankingTable(test_country_score_data[0:6])
+    tied = rankings.classes[2].data
+    assert [obs["CountryCode"] for obs in tied] == [
+        obs["CountryCode"] for obs in test_country_score_data[0:6]
+        if obs["Score"] == 0.50
+    ]
+
+
+def test_rank_groups_matches_ranking_table_per_group():
+    rng = np.random.default_rng(1)
+    groups = [
+        [{"Score": s} for s in rng.integers(0, 4, size=n) / 3]
+        for n in (1, 5, 12, 0, 7)
+    ]
+    expected = [[dict(obs) for obs in group] for group in groups]
+    for group in expected:
+        SSPIRankingTable(group)
+    rank_groups(groups)
+    assert groups == expected
+
+
+def test_rank_partitions_nan_and_empty():
+    ranks, ties = rank_partitions(
+        np.array([0.2, np.nan, 0.2, 0.7, 0.2]), np.array([0, 0, 1, 0, 1])
+    )
+    assert ranks.tolist() == [2, 0, 1, 1, 1]
+    assert ties.tolist() == [False, False, True, False, True]
+    ranks, ties = rank_partitions(np.array([]), np.array([], dtype=int))
+    assert ranks.shape == ties.shape == (0,)
+
+
+def baseline_class_scan(scores, tol=1E-8):
+    """Rank/Tie from the original scan: join the first class within tol of its first member"""
+    classes = []
+    for i, score in enumerate(scores):
+        for cls in classes:
+            if abs(score - cls[0]) < tol:
+                cls[1].append(i)
+                break
+        else:
+            classes.append((score, [i]))
+    ranks, ties, r = [0] * len(scores), [False] * len(scores), 1
+    for value, members in sorted(classes, key=lambda cls: -cls[0]):
+        for i in members:
+            ranks[i], ties[i] = r, len(members) > 1
+        r += len(members)
+    return ranks, ties
+
+
+def test_near_tolerance_chain_matches_class_scan():
+    scores = [0, 0.6E-8, 1.2E-8, 0.5]
+    data = [{"Score": s} for s in scores]
+    SSPIRankingTable(data)
+    assert [(obs["Rank"], obs["Tie"]) for obs in data] == [
+        (3, True), (3, True), (2, False), (1, False)
+    ]
+    ranks, ties = rank_scores(np.array(scores), axis=0)
+    assert (ranks.tolist(), ties.tolist()) == baseline_class_scan(scores)
+    ranks, ties = rank_partitions(np.array(scores + scores[::-1]), np.repeat([0, 1], 4))
+    assert (ranks[:4].tolist(), ties[:4].tolist()) == baseline_class_scan(scores)
+    assert (ranks[4:].tolist(), ties[4:].tolist()) == baseline_class_scan(scores[::-1])
+    groups = [[{"Score": s} for s in scores]]
+    rank_groups(groups)
+    assert [(obs["Rank"], obs["Tie"]) for obs in groups[0]] \
+        == list(zip(*baseline_class_scan(scores)))
+
+
+def test_random_near_tolerance_chains_match_class_scan():
+    rng = np.random.default_rng(2)
+    scores = rng.integers(0, 8, size=(20, 9)) * 0.4E-8 + rng.integers(0, 2, size=(20, 9)) / 2
+    ranks, ties = rank_scores(scores, axis=1)
+    partition_ranks, partition_ties = rank_partitions(scores.ravel(), np.repeat(np.arange(20), 9))
+    for row in range(scores.shape[0]):
+        expected = baseline_class_scan(scores[row].tolist())
+        data = [{"Score": s} for s in scores[row]]
+        SSPIRankingTable(data)
+        assert ([obs["Rank"] for obs in data], [obs["Tie"] for obs in data]) == expected
+        assert (ranks[row].tolist(), ties[row].tolist()) == expected
+        assert (partition_ranks[row * 9:(row + 1) * 9].tolist(),
+                partition_ties[row * 9:(row + 1) * 9].tolist()) == expected
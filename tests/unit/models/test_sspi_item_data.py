@@ -412,3 +412,38 @@ def test_active_schema_real_world_behavior(sspi_item_data_wrapper):
     assert len(biodiv_indicator["Children"]) == 0
     
     # REDLST should not be included since it doesn't exist in data
+
+
+def test_fingerprints_round_trip_and_country_year_delete(sspi_item_data_wrapper):
+    wrapper = sspi_item_data_wrapper
+    wrapper.clear_fingerprints()
+    wrapper.insert_many([
+        {"CountryCode": c, "Year": y, "ItemCode": i, "Score": 0.5}
+        for c in ("USA", "CAN") for y in (2018, 2019) for i in ("SSPI", "SUS")
+    ])
+    wrapper.insert_fingerprints({("USA", 2018): "a", ("CAN", 2018): "b"})
+    assert wrapper.fingerprints() == {("USA", 2018): "a", ("CAN", 2018): "b"}
+    assert wrapper.delete_country_years([("USA", 2018), ("CAN", 2019)]) == 4
+    assert wrapper.count_documents({}) == 4
+    assert wrapper.count_documents({"CountryCode": "USA", "Year": 2018}) == 0
+    assert wrapper.fingerprints() == {("CAN", 2018): "b"}
+    wrapper.clear_fingerprints()
+    assert wrapper.fingerprints() == {}
+
+
+def test_deleting_items_drops_their_fingerprints(sspi_item_data_wrapper):
+    wrapper = sspi_item_data_wrapper
+    wrapper.clear_fingerprints()
+    wrapper.insert_many([
+        {"CountryCode": c, "Year": y, "ItemCode": i, "Score": 0.5}
+        for c in ("USA", "CAN") for y in (2018, 2019) for i in ("SSPI", "SUS")
+    ])
+    wrapper.insert_fingerprints({
+        ("USA", 2018): "a", ("USA", 2019): "b", ("CAN", 2018): "c", ("CAN", 2019): "d"
+    })
+    assert wrapper.delete_one({"CountryCode": "USA", "Year": 2018, "ItemCode": "SUS"}) == 1
+    assert wrapper.delete_many({"CountryCode": "CAN", "Year": 2019}) == 2
+    assert wrapper.delete_many({"CountryCode": "MEX"}) == 0
+    assert wrapper.fingerprints() == {("USA", 2019): "b", ("CAN", 2018): "c"}
+    wrapper.delete_many({})
+    assert wrapper.fingerprints() == {}
@@ -0,0 +1,109 @@
+import pytest
+from sspi_flask_app.models.database import sspidb
+from sspi_flask_app.models.database.sspi_metadata import SSPIMetadata
+
+
+@pytest.fixture(scope="function")
+def sspi_metadata():
+    sspi_test_db = sspidb.sspi_test_db
+    sspi_test_db.delete_many({})
+    sspi_metadata = SSPIMetadata(sspi_test_db)
+    sspi_metadata.insert_many([
+        {"DocumentType": "IndicatorCodes", "Metadata": ["BIODIV"]},
+        {"DocumentType": "DatasetCodes", "Metadata": ["UNSDG_TERRST"]},
+        {
+            "DocumentType": "CountryGroup",
+            "Metadata": {"CountryGroupName": "SSPI49", "Countries": ["USA", "CAN"]}
+        },
+        {
+            "DocumentType": "IndicatorDetail",
+            "Metadata": {
+                "ItemCode": "BIODIV",
+                "IndicatorCode": "BIODIV",
+                "ItemType": "Indicator",
+                "DatasetCodes": ["UNSDG_TERRST"],
+                "LowerGoalpost": 0,
+                "UpperGoalpost": 100,
+            }
+        },
+        {
+            "DocumentType": "DatasetDetail",
+            "Metadata": {
+                "DatasetCode": "UNSDG_TERRST",
+                "Source": {"OrganizationCode": "UNSDG", "QueryCode": "15.1.2"},
+            }
+        },
+        {
+            "DocumentType": "SourceDetail",
+            "Metadata": {
+                "Source": {"OrganizationCode": "UNSDG", "QueryCode": "15.1.2"},
+                "DatasetCodes": ["UNSDG_TERRST"],
+            }
+        },
+    ])
+    yield sspi_metadata
+    sspi_test_db.delete_many({})
+
+
+def test_lookups_read_from_snapshot(sspi_metadata):
+    assert sspi_metadata.get_item_detail("biodiv")["IndicatorCode"] == "BIODIV"
+    assert sspi_metadata.get_goalposts("BIODIV") == (0, 100)
+    assert sspi_metadata.get_dataset_detail("UNSDG_TERRST")["DatasetCode"] == "UNSDG_TERRST"
+    assert sspi_metadata.get_dataset_detail("MISSING") == {}
+    assert sspi_metadata.get_item_detail("MISSING") == {"Error": "ItemCode not found"}
+    assert sspi_metadata.country_group("sspi49") == ["USA", "CAN"]
+    source_info = sspi_metadata.get_source_info("UNSDG_TERRST")
+    assert sspi_metadata.get_downstream_datasets(source_info) == ["UNSDG_TERRST"]
+    assert sspi_metadata.get_downstream_datasets({"OrganizationCode": "WB"}) == []
+
+
+def test_steady_state_issues_no_queries(sspi_metadata, monkeypatch):
+    sspi_metadata.snapshot()
+    queries = []
+
+    def record(collection, method):
+        original = getattr(collection, method)
+        def wrapper(*args, **kwargs):
+            queries.append(method)
+            return original(*args, **kwargs)
+        monkeypatch.setattr(collection, method, wrapper)
+
+    record(sspi_metadata._mongo_database, "find")
+    record(sspi_metadata._mongo_database, "find_one")
+    record(sspi_metadata._generation_collection, "find_one")
+    for _ in range(3):
+        sspi_metadata.get_item_detail("BIODIV")
+        sspi_metadata.get_dataset_detail("UNSDG_TERRST")
+        sspi_metadata.indicator_codes()
+    assert queries == []
+
+
+def test_returned_values_are_copies(sspi_metadata):
+    sspi_metadata.get_item_detail("BIODIV")["DatasetCodes"].append("MUTATED")
+    sspi_metadata.indicator_codes().clear()
+    assert sspi_metadata.get_item_detail("BIODIV")["DatasetCodes"] == ["UNSDG_TERRST"]
+    assert sspi_metadata.indicator_codes() == ["BIODIV"]
+
+
+def test_writes_bump_generation(sspi_metadata):
+    generation = sspi_metadata.generation()
+    assert sspi_metadata.dataset_codes() == ["UNSDG_TERRST"]
+    sspi_metadata.delete_many({"DocumentType": "DatasetCodes"})
+    assert sspi_metadata.generation() == generation + 1
+    assert sspi_metadata.dataset_codes() == []
+    sspi_metadata.record_dataset_range([{"Value": 5}], "UNSDG_TERRST")
+    assert sspi_metadata.get_dataset_detail("UNSDG_TERRST")["Range"] == {"yMin": 0, "yMax": 5}
+
+
+def test_other_worker_write_seen_after_generation_check(sspi_metadata):
+    other_worker = SSPIMetadata(sspidb.sspi_test_db)
+    assert sspi_metadata.country_group("SSPI49") == ["USA", "CAN"]
+    other_worker.delete_many({"DocumentType": "CountryGroup"})
+    other_worker.insert_one({
+        "DocumentType": "CountryGroup",
+        "Metadata": {"CountryGroupName": "SSPI49", "Countries": ["MEX"]}
+    })
+    # Within the check interval the snapshot is trusted as-is
+    assert sspi_metadata.country_group("SSPI49") == ["USA", "CAN"]
+    sspi_metadata._generation_checked_at = float("-inf")
+    assert sspi_metadata.country_group("SSPI49") == ["MEX"]
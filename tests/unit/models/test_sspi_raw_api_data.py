@@ -1,6 +1,8 @@
 import pytest
 from sspi_flask_app.models.database import sspidb
+from sspi_flask_app.models.database.sspi_clean_api_data import SSPICleanAPIData
 from sspi_flask_app.models.database.sspi_raw_api_data import SSPIRawAPIData
+from sspi_flask_app.models.errors import InvalidDocumentFormatError
 
 
 @pytest.fixture(scope="function")
@@ -98,3 +100,115 @@ def test_fragment_reassembly(sspi_raw_api_data, source_info):
     assert doc["username"] == "test_user"
     assert doc["other"] == "test_value"
     assert len
+
+
+def test_raw_insert_many_matches_raw_insert_one(sspi_raw_api_data, source_info):
+    documents = [{"a": i, "b": str(i)} for i in range(5)]
+    for document in documents:
+        sspi_raw_api_data.raw_insert_one(document, source_info, username="test_user", other=1)
+    one_by_one = sspi_raw_api_data.find({}, {"_id": 0, "CollectionInfo": 0})
+    sspi_raw_api_data.delete_many({})
+    count = sspi_raw_api_data.raw_insert_many(documents, source_info, username="test_user", other=1)
+    assert count == len(documents)
+    bulk = sspi_raw_api_data.find({}, {"_id": 0, "CollectionInfo": 0})
+    assert bulk == one_by_one
+    assert [list(doc.keys()) for doc in bulk] == [list(doc.keys()) for doc in one_by_one]
+
+
+def test_raw_insert_many_chunks(sspi_raw_api_data, source_info):
+    documents = [{"a": i} for i in range(7)]
+    chunks = sspi_raw_api_data.raw_insert_many_chunks(
+        documents, source_info, chunk_size=3, username="test_user"
+    )
+    assert list(chunks) == [3, 3, 1]
+    assert len(sspi_raw_api_data.fetch_raw_data(source_info)) == 7
+    assert "chunk_size" not in sspi_raw_api_data.find({})[0]
+
+
+def test_raw_insert_many_fragments_and_validates_first(sspi_raw_api_data, source_info):
+    size = sspi_raw_api_data.maximum_document_size_bytes
+    raw_too_big = "a" * (size * 2 + 1)
+    count = sspi_raw_api_data.raw_insert_many(
+        [raw_too_big, {"a": 1}], source_info, username="test_user"
+    )
+    assert count == 2
+    assert sspi_raw_api_data.count_documents({}) == 4
+    raw_data = sspi_raw_api_data.fetch_raw_data(source_info)
+    assert sorted(len(doc["Raw"]) if isinstance(doc["Raw"], str) else 0 for doc in raw_data) == [0, len(raw_too_big)]
+    sspi_raw_api_data.delete_many({})
+    with pytest.raises(InvalidDocumentFormatError):
+        sspi_raw_api_data.raw_insert_many(
+            [{"a": 1}, {"a": 2}, set()], source_info, username="test_user"
+        )
+    assert sspi_raw_api_data.count_documents({}) == 0
+
+
+def test_recollection_keeps_unchanged_documents(sspi_raw_api_data, source_info):
+    documents = [{"a": i} for i in range(3)]
+    sspi_raw_api_data.raw_insert_many(documents, source_info, username="test_user")
+    previous_ids = sspi_raw_api_data.document_ids(source_info)
+    sspi_raw_api_data.raw_insert_many(documents[::-1], source_info, username="test_user")
+    changed, digest = sspi_raw_api_data.replace_or_keep(source_info, previous_ids, ["TESTDB"])
+    assert not changed
+    assert digest is not None
+    assert sspi_raw_api_data._digest_collection.find_one({"_id": "TESTDB"})["RawDigest"] == digest
+    sspi_raw_api_data._digest_collection.delete_many({})
+    assert sorted(sspi_raw_api_data.document_ids(source_info)) == sorted(previous_ids)
+
+
+def test_recollection_replaces_changed_documents(sspi_raw_api_data, source_info):
+    sspi_raw_api_data.raw_insert_many([{"a": 1}], source_info, username="test_user")
+    previous_ids = sspi_raw_api_data.document_ids(source_info)
+    sspi_raw_api_data.raw_insert_many([{"a": 2}], source_info, username="test_user")
+    changed, _ = sspi_raw_api_data.replace_or_keep(source_info, previous_ids, [])
+    assert changed
+    raw_data = sspi_raw_api_data.fetch_raw_data(source_info)
+    assert [doc["Raw"] for doc in raw_data] == [{"a": 2}]
+
+
+def test_failed_recollection_rolls_back(sspi_raw_api_data, source_info):
+    sspi_raw_api_data.raw_insert_many([{"a": 1}], source_info, username="test_user")
+    previous_ids = sspi_raw_api_data.document_ids(source_info)
+    sspi_raw_api_data.raw_insert_many([{"a": 2}], source_info, username="test_user")
+    assert sspi_raw_api_data.discard_new_documents(source_info, previous_ids) == 1
+    assert sspi_raw_api_data.document_ids(source_info) == previous_ids
+
+
+def test_needs_cleaning_follows_recorded_digest(sspi_raw_api_data):
+    sspi_raw_api_data._digest_collection.delete_many({})
+    assert sspi_raw_api_data.needs_cleaning("TEST_DATASET")
+    sspi_raw_api_data.record_digest(["TEST_DATASET"], "digest-1")
+    assert sspi_raw_api_data.needs_cleaning("TEST_DATASET")
+    sspi_raw_api_data.mark_cleaned("TEST_DATASET")
+    assert not sspi_raw_api_data.needs_cleaning("TEST_DATASET")
+    sspi_raw_api_data.record_digest(["TEST_DATASET"], "digest-1")
+    assert not sspi_raw_api_data.needs_cleaning("TEST_DATASET")
+    sspi_raw_api_data.record_digest(["TEST_DATASET"], "digest-2")
+    assert sspi_raw_api_data.needs_cleaning("TEST_DATASET")
+    sspi_raw_api_data._digest_collection.delete_many({})
+
+
+def test_deleting_clean_data_marks_datasets_for_cleaning(sspi_raw_api_data):
+    clean_collection = sspidb.sspi_test_clean_db
+    clean_collection.delete_many({})
+    clean_data = SSPICleanAPIData(clean_collection, raw_data=sspi_raw_api_data)
+    sspi_raw_api_data._digest_collection.delete_many({})
+    sspi_raw_api_data.record_digest(["TEST_A", "TEST_B", "TEST_C"], "digest-1")
+    for dataset_code in ("TEST_A", "TEST_B", "TEST_C"):
+        sspi_raw_api_data.mark_cleaned(dataset_code)
+    clean_collection.insert_many([
+        {"DatasetCode": code, "CountryCode": country, "Year": 2018, "Value": 1.0}
+        for code in ("TEST_A", "TEST_B", "TEST_C") for country in ("USA", "CAN")
+    ])
+    clean_data.delete_one({"DatasetCode": "TEST_A", "CountryCode": "USA"})
+    assert sspi_raw_api_data.needs_cleaning("TEST_A")
+    assert not sspi_raw_api_data.needs_cleaning("TEST_B")
+    # Datasets are read off the matching documents when the query has none
+    clean_data.delete_many({"CountryCode": "CAN", "DatasetCode": {"$ne": "TEST_A"}, "Year": 2018})
+    assert sspi_raw_api_data.needs_cleaning("TEST_B")
+    assert sspi_raw_api_data.needs_cleaning("TEST_C")
+    sspi_raw_api_data.mark_cleaned("TEST_B")
+    clean_data.delete_many({})
+    assert sspi_raw_api_data.needs_cleaning("TEST_B")
+    sspi_raw_api_data._digest_collection.delete_many({})
+    sspidb.drop_collection(clean_collection)
@@ -1,4 +1,4 @@
-from sspi_flask_app.models.sspi import SSPI
+from sspi_flask_app.models.sspi import SSPI, FastSSPI
 from sspi_flask_app.models.errors import InvalidDocumentFormatError, DataMetadataMismatchError
 import pytest
 
@@ -812,3 +812,49 @@ def test_eco_redlst_bug_regression():
 #                ["Categories"][0]["Indicators"]) == 2
 #     assert len(score_tree["SSPI"]["Pillars"][0]
 #                ["Categories"][1]["Indicators"]) == 1
+
+
+def fast_sspi_panel_data(test_country_score_data):
+    panel_data = []
+    for c, country_code in enumerate(["AUS", "BRA", "CAN"]):
+        for year in (2018, 2019):
+            for i, obs in enumerate(test_country_score_data):
+                panel_data.append({
+                    "IndicatorCode": obs["IndicatorCode"],
+                    "CountryCode": country_code,
+                    "Year": year,
+                    "Score": (obs["Score"] * (c + 1) + 0.1 * (year - 2018)) % 1
+                })
+    return panel_data
+
+
+def test_fast_sspi_matches_sspi_documents(test_item_details, test_country_score_data):
+    panel_data = fast_sspi_panel_data(test_country_score_data)
+    fast_docs = FastSSPI(test_item_details).to_score_documents(panel_data)
+    expected = []
+    for country_code in ["AUS", "BRA", "CAN"]:
+        for year in (2018, 2019):
+            cell = [d for d in panel_data if d["CountryCode"] == country_code and d["Year"] == year]
+            expected.extend(SSPI(test_item_details, cell).to_score_documents(country_code))
+    key = lambda d: (d["CountryCode"], d["Year"], d["ItemCode"])
+    assert len(fast_docs) == len(expected)
+    for fast, slow in zip(sorted(fast_docs, key=key), sorted(expected, key=key)):
+        assert {k: v for k, v in fast.items() if k != "Score"} == \
+            {k: v for k, v in slow.items() if k != "Score"}
+        assert fast["Score"] == pytest.approx(slow["Score"], abs=1e-12)
+
+
+def test_fast_sspi_fails_on_unknown_indicator(test_item_details, test_country_score_data):
+    panel_data = fast_sspi_panel_data(test_country_score_data)
+    panel_data.append({"IndicatorCode": "FATINJ", "CountryCode": "AUS", "Year": 2018, "Score": 0.7})
+    with pytest.raises(DataMetadataMismatchError):
+        FastSSPI(test_item_details).to_score_documents(panel_data)
+
+
+def test_fast_sspi_fails_on_missing_or_repeated_indicator(test_item_details, test_country_score_data):
+    panel_data = fast_sspi_panel_data(test_country_score_data)
+    missing = [d for d in panel_data if not (d["CountryCode"] == "BRA" and d["Year"] == 2019 and d["IndicatorCode"] == "UNEMPL")]
+    with pytest.raises(DataMetadataMismatchError, match="CountryCode: BRA"):
+        FastSSPI(test_item_details).to_score_documents(missing)
+    with pytest.raises(DataMetadataMismatchError):
+        FastSSPI(test_item_details).to_score_documents(panel_data + panel_data[:1])
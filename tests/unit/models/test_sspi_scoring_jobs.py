@@ -8,13 +8,15 @@ which is cleared and dropped around each test.
 Run with:
     pytest tests/unit/models/test_sspi_scoring_jobs.py
 """
+import time
+
 import pytest
 from datetime import datetime, timezone, timedelta
 
 from pymongo.errors import DuplicateKeyError
 
 from sspi_flask_app.models.database import sspidb
-from sspi_flask_app.models.database.sspi_scoring_jobs import SSPIScoringJobs
+from sspi_flask_app.models.database.sspi_scoring_jobs import JobWatch, SSPIScoringJobs
 from sspi_flask_app.models.errors import InvalidDocumentFormatError
 
 
@@ -28,6 +30,7 @@ def jobs_model():
     yield model
     collection.delete_many({})
     sspidb.drop_collection(collection)
+    sspidb.drop_collection(sspidb.test_scoring_jobs_flights)
 
 
 def _make_job_doc(job_id, user_id="alice", status="pending", progress=0):
@@ -105,6 +108,64 @@ def test_should_return_only_events_after_last_seq_when_polling(jobs_model):
     assert [e["seq"] for e in new_events] == [2, 3]
 
 
+def test_should_return_scalar_state_and_new_events_when_reading_job_state(jobs_model):
+    jobs_model.create_job(_make_job_doc("job1"))
+    jobs_model.append_event("job1", "stage_complete", {"stage": "validate"})
+    jobs_model.append_event(
+        "job1", "stage_complete", {"stage": "identify"},
+        set_fields={"status": "scoring"},
+    )
+    state = jobs_model.job_state("job1", last_seq=1)
+    assert state["status"] == "scoring"
+    assert state["seq"] == 2
+    assert [e["data"]["stage"] for e in state["events"]] == ["identify"]
+    assert jobs_model.job_state("job1", last_seq=2)["events"] == []
+    assert jobs_model.job_state("nope", last_seq=0) is None
+
+
+def test_should_wake_watch_only_when_job_changes(jobs_model):
+    jobs_model.create_job(_make_job_doc("job1"))
+    watch = jobs_model.watch_job("job1", poll_interval=0.01)
+    try:
+        assert watch.wait(0.05) is False
+        jobs_model.set_fields("job1", stage_current=3)
+        assert watch.wait(0.05) is True
+        assert watch.wait(0.05) is False
+        # An evicted job reads as a change so readers can report it
+        jobs_model.delete_many({"job_id": "job1"})
+        assert watch.wait(0.05) is True
+    finally:
+        watch.close()
+
+
+class _AwaitingChangeStream:
+    """Change stream stand-in: buffered changes return at once, then each
+    try_next blocks for a getMore of await_seconds and returns None"""
+
+    def __init__(self, changes, await_seconds):
+        self.changes = list(changes)
+        self.await_seconds = await_seconds
+
+    def try_next(self):
+        if self.changes:
+            return self.changes.pop(0)
+        time.sleep(self.await_seconds)
+        return None
+
+    def close(self):
+        pass
+
+
+def test_should_wake_on_first_change_without_awaiting_more(jobs_model):
+    stream = _AwaitingChangeStream([{"seq": 1}, {"seq": 2}], await_seconds=0.5)
+    watch = JobWatch(jobs_model, "job1", stream, poll_interval=0.01)
+    start = time.monotonic()
+    assert watch.wait(5.0) is True
+    assert time.monotonic() - start < 0.25
+    assert watch.wait(5.0) is True
+    assert watch.wait(0.1) is False
+
+
 def test_should_return_none_when_appending_to_missing_job(jobs_model):
     assert jobs_model.append_event("nope", "complete", {}) is None
 
@@ -124,6 +185,77 @@ def test_should_apply_set_fields_atomically_with_event(jobs_model):
     assert doc["events"][-1]["event_type"] == "complete"
 
 
+# =============================================================================
+# Worker queue
+# =============================================================================
+
+def test_should_claim_oldest_queued_job_once(jobs_model):
+    now = datetime.now(timezone.utc)
+    for offset, job_id in ((1, "newer"), (2, "older")):
+        doc = _make_job_doc(job_id)
+        doc["created_at"] = now - timedelta(seconds=offset)
+        doc["payload"] = {"metadata": [{"ItemCode": job_id}], "actions": []}
+        jobs_model.create_job(doc)
+    # Jobs started in thread mode carry no payload and are never claimed
+    jobs_model.create_job(_make_job_doc("threaded"))
+    claimed = jobs_model.claim_pending("host:1")
+    assert claimed["job_id"] == "older"
+    assert claimed["status"] == "validating"
+    assert claimed["claimed_by"] == "host:1"
+    assert "payload" not in claimed and "payload" not in jobs_model.get("older")
+    assert jobs_model.get_payload("older")["metadata"] == [{"ItemCode": "older"}]
+    assert jobs_model.claim_pending("host:2")["job_id"] == "newer"
+    assert jobs_model.claim_pending("host:2") is None
+    assert jobs_model.get("threaded")["status"] == "pending"
+
+
+def test_should_heartbeat_only_own_active_jobs(jobs_model):
+    old = datetime.now(timezone.utc) - timedelta(seconds=10000)
+    for offset, job_id in ((3, "mine"), (2, "theirs"), (1, "done")):
+        doc = _make_job_doc(job_id)
+        doc["created_at"] = old - timedelta(seconds=offset)
+        doc["payload"] = {"metadata": [], "actions": []}
+        jobs_model.create_job(doc)
+    jobs_model.claim_pending("host:1")
+    jobs_model.claim_pending("host:2")
+    jobs_model.claim_pending("host:1")
+    jobs_model.set_fields("done", status="complete")
+    jobs_model._mongo_database.update_many({}, {"$set": {"updated_at": old}})
+    assert jobs_model.heartbeat("host:1", ["mine", "theirs", "done"]) == 1
+    assert jobs_model.heartbeat("host:1", []) == 0
+    # Jobs whose worker stopped heartbeating are reaped
+    assert jobs_model.reap_stalled(max_run_seconds=900) == 1
+    assert jobs_model.get("mine")["status"] == "validating"
+    assert jobs_model.get("theirs")["status"] == "error"
+
+
+# =============================================================================
+# Single flight
+# =============================================================================
+
+def test_should_hold_flight_for_one_active_job(jobs_model):
+    jobs_model.create_job(_make_job_doc("leader", status="scoring"))
+    jobs_model.create_job(_make_job_doc("follower", status="validating"))
+    assert jobs_model.acquire_flight("hash:v1", "leader") is None
+    assert jobs_model.acquire_flight("hash:v1", "follower") == "leader"
+    assert jobs_model.acquire_flight("hash:v2", "follower") is None
+    # Only the holder can release a flight
+    assert jobs_model.release_flight("hash:v1", "follower") == 0
+    assert jobs_model.release_flight("hash:v1", "leader") == 1
+    assert jobs_model.acquire_flight("hash:v1", "follower") is None
+
+
+def test_should_take_over_flight_of_inactive_job(jobs_model):
+    jobs_model.create_job(_make_job_doc("leader", status="scoring"))
+    jobs_model.create_job(_make_job_doc("follower", status="validating"))
+    assert jobs_model.acquire_flight("hash:v1", "leader") is None
+    # The leader's worker died: the job was reaped without releasing
+    jobs_model.set_fields("leader", status="error")
+    assert jobs_model.acquire_flight("hash:v1", "follower") is None
+    assert jobs_model.release_flight("hash:v1", "leader") == 0
+    assert jobs_model.release_flight("hash:v1", "follower") == 1
+
+
 # =============================================================================
 # Scalar updates
 # =============================================================================
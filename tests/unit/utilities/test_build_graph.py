@@ -0,0 +1,140 @@
+import threading
+
+import pytest
+
+from sspi_flask_app.api.resources.build_graph import (
+    BuildNode,
+    run_build,
+    topological_order,
+)
+from sspi_flask_app.models.database import sspidb
+from sspi_flask_app.models.database.sspi_build_state import SSPIBuildState
+
+
+@pytest.fixture(scope="function")
+def build_state():
+    sspi_test_db = sspidb.sspi_test_db
+    sspi_test_db.delete_many({})
+    yield SSPIBuildState(sspi_test_db)
+    sspi_test_db.delete_many({})
+
+
+class Pipeline:
+    """
+    A toy raw -> clean -> indicator -> finalize chain over two sources.
+    Each node's input digest is the value its upstream produced, so the
+    graph behaves like the real one without touching the pipeline data.
+    """
+
+    def __init__(self):
+        self.source = {"A": "a1", "B": "b1"}
+        self.outputs = {}
+        self.runs = []
+
+    def task(self, node_id, value):
+        def run():
+            self.runs.append(node_id)
+            self.outputs[node_id] = value()
+            yield f"built {node_id}"
+        return run
+
+    def nodes(self, **kwargs):
+        nodes = []
+        for s in ("A", "B"):
+            nodes.append(BuildNode(
+                f"raw:{s}", [], self.task(f"raw:{s}", lambda s=s: self.source[s]),
+                lambda s=s: self.outputs.get(f"raw:{s}"), external=True,
+                always_run=s in kwargs.get("refresh", ()),
+            ))
+            nodes.append(BuildNode(
+                f"clean:{s}", [f"raw:{s}"],
+                self.task(f"clean:{s}", lambda s=s: self.outputs[f"raw:{s}"]),
+                lambda s=s: self.outputs.get(f"raw:{s}"),
+            ))
+        nodes.append(BuildNode(
+            "indicator:X", ["clean:A", "clean:B"],
+            self.task("indicator:X", lambda: self.outputs["clean:A"] + self.outputs["clean:B"]),
+            lambda: f"{self.outputs.get('clean:A')}|{self.outputs.get('clean:B')}",
+        ))
+        nodes.append(BuildNode(
+            "finalize:score", ["indicator:X"],
+            self.task("finalize:score", lambda: self.outputs["indicator:X"]),
+            lambda: self.outputs.get("indicator:X"),
+        ))
+        return nodes
+
+
+def test_topological_order_and_invalid_graphs():
+    run = lambda: None
+    digest = lambda: None
+    nodes = [
+        BuildNode("c", ["b"], run, digest),
+        BuildNode("a", [], run, digest),
+        BuildNode("b", ["a"], run, digest),
+    ]
+    assert topological_order(nodes) == ["a", "b", "c"]
+    with pytest.raises(ValueError):
+        topological_order([BuildNode("a", ["missing"], run, digest)])
+    with pytest.raises(ValueError):
+        topological_order([BuildNode("a", ["b"], run, digest), BuildNode("b", ["a"], run, digest)])
+
+
+def test_rebuilds_only_stale_nodes(build_state):
+    pipeline = Pipeline()
+    lines = list(run_build(pipeline.nodes(), build_state))
+    assert len(pipeline.runs) == 6
+    assert lines[-1] == "Build complete: 6 built, 0 fresh, 0 failed, 0 blocked\n"
+    assert "clean:A: built clean:A\n" in lines
+    # Nothing changed: every node is fresh
+    pipeline.runs.clear()
+    lines = list(run_build(pipeline.nodes(), build_state))
+    assert pipeline.runs == []
+    assert lines[-1] == "Build complete: 0 built, 6 fresh, 0 failed, 0 blocked\n"
+    # A refreshed source with identical content stops at the raw node
+    lines = list(run_build(pipeline.nodes(refresh=["A"]), build_state))
+    assert pipeline.runs == ["raw:A"]
+    # A refreshed source with new content cascades down its own chain only
+    pipeline.runs.clear()
+    pipeline.source["A"] = "a2"
+    list(run_build(pipeline.nodes(refresh=["A"]), build_state))
+    assert pipeline.runs == ["raw:A", "clean:A", "indicator:X", "finalize:score"]
+
+
+def test_external_nodes_ignore_force(build_state):
+    pipeline = Pipeline()
+    list(run_build(pipeline.nodes(), build_state))
+    pipeline.runs.clear()
+    list(run_build(pipeline.nodes(), build_state, force=True))
+    assert sorted(pipeline.runs) == ["clean:A", "clean:B", "finalize:score", "indicator:X"]
+
+
+def test_failure_blocks_dependents_only(build_state):
+    pipeline = Pipeline()
+    nodes = pipeline.nodes()
+
+    def broken():
+        raise RuntimeError("cleaner failed")
+        yield
+
+    nodes[1].run = broken
+    lines = list(run_build(nodes, build_state))
+    assert "error: clean:A: RuntimeError('cleaner failed')\n" in lines
+    assert sorted(pipeline.runs) == ["clean:B", "raw:A", "raw:B"]
+    assert lines[-1] == "Build complete: 3 built, 0 fresh, 1 failed, 2 blocked\n"
+    table = "".join(lines)
+    assert "indicator:X" in table and "blocked" in table
+
+
+def test_independent_nodes_run_in_parallel(build_state):
+    barrier = threading.Barrier(2, timeout=5)
+
+    def wait():
+        barrier.wait()
+        return ["done"]
+
+    nodes = [
+        BuildNode("left", [], wait, lambda: None),
+        BuildNode("right", [], wait, lambda: None),
+    ]
+    lines = list(run_build(nodes, build_state, max_workers=2))
+    assert lines[-1] == "Build complete: 2 built, 0 fresh, 0 failed, 0 blocked\n"
@@ -0,0 +1,98 @@
+"""
+Tests for the process-wide clean-data panel cache used by
+score_custom_configuration_fast.
+
+Jobs must get exactly the arrays a direct fetch returns while only fetching
+datasets that are missing from the panel or whose clean-data version moved.
+Dataset reads and the data version lookup are mocked.
+"""
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from sspi_flask_app.api.resources import fast_custom_scoring as fcs
+
+COUNTRIES = ["AAA", "BBB", "CCC"]
+
+
+def _versions(ds_one=1, ds_two=1, generation=0):
+    return {"Generation": generation, "Datasets": {"DS_ONE": ds_one, "DS_TWO": ds_two}}
+
+
+def _fetch(dataset_codes, country_codes, start_year, end_year):
+    return {
+        code: np.full((len(country_codes), end_year - start_year + 1), float(len(code)))
+        for code in dataset_codes
+    }
+
+
+def _arrays(cache, dataset_codes, versions):
+    with patch.object(fcs, "fetch_all_datasets_aggregated", side_effect=_fetch) as fetch:
+        arrays = cache.dataset_arrays(dataset_codes, COUNTRIES, 2000, 2004, versions)
+    return arrays, [sorted(call.args[0]) for call in fetch.call_args_list]
+
+
+def test_panel_fetches_only_missing_and_stale_datasets():
+    cache = fcs.CleanDataPanelCache()
+    arrays, fetched = _arrays(cache, ["DS_ONE"], _versions())
+    assert fetched == [["DS_ONE"]]
+    assert arrays["DS_ONE"].shape == (3, 5)
+    arrays, fetched = _arrays(cache, ["DS_ONE", "DS_TWO"], _versions())
+    assert fetched == [["DS_TWO"]]
+    first = arrays["DS_ONE"]
+    with pytest.raises(ValueError):
+        first[0, 0] = 1.0
+    _, fetched = _arrays(cache, ["DS_ONE", "DS_TWO"], _versions())
+    assert fetched == []
+    # Re-cleaning one dataset refetches only that dataset
+    _, fetched = _arrays(cache, ["DS_ONE", "DS_TWO"], _versions(ds_one=2))
+    assert fetched == [["DS_ONE"]]
+    # Views handed out earlier are not rewritten by the refresh
+    assert first.tolist() == _fetch(["DS_ONE"], COUNTRIES, 2000, 2004)["DS_ONE"].tolist()
+    # A Generation bump discards the whole panel
+    _, fetched = _arrays(cache, ["DS_ONE", "DS_TWO"], _versions(ds_one=2, generation=1))
+    assert fetched == [["DS_ONE", "DS_TWO"]]
+    assert len(cache) == 1
+
+
+def test_panel_cache_scores_like_direct_fetch():
+    metadata = [
+        {"ItemType": "SSPI", "ItemCode": "SSPI", "ItemName": "SSPI",
+         "PillarCodes": ["PIL"], "Children": ["PIL"]},
+        {"ItemType": "Pillar", "ItemCode": "PIL", "ItemName": "Pillar",
+         "CategoryCodes": ["CAT"], "Children": ["CAT"]},
+        {"ItemType": "Category", "ItemCode": "CAT", "ItemName": "Category",
+         "IndicatorCodes": ["ONE", "TWO"], "Children": ["ONE", "TWO"]},
+        {"ItemType": "Indicator", "ItemCode": "ONE", "ItemName": "One",
+         "DatasetCodes": ["DS_ONE"], "LowerGoalpost": 0, "UpperGoalpost": 100,
+         "ScoreFunction": "Score = goalpost(DS_ONE, LowerGoalpost, UpperGoalpost)"},
+        {"ItemType": "Indicator", "ItemCode": "TWO", "ItemName": "Two",
+         "DatasetCodes": ["DS_TWO"], "LowerGoalpost": 0, "UpperGoalpost": 50,
+         "ScoreFunction": "Score = goalpost(DS_TWO, LowerGoalpost, UpperGoalpost)"},
+    ]
+
+    def fetch(dataset_codes, country_codes, start_year, end_year):
+        rng = np.random.default_rng(4)
+        arrays = {
+            code: rng.uniform(0, 100, size=(len(country_codes), end_year - start_year + 1))
+            for code in ["DS_ONE", "DS_TWO"]
+        }
+        arrays["DS_TWO"][1] = np.nan
+        return {code: arrays[code] for code in dataset_codes}
+
+    def score(panel_cache):
+        with patch.object(fcs, "fetch_all_datasets_aggregated", side_effect=fetch) as fetch_mock, \
+             patch.object(fcs.sspi_clean_api_data, "data_versions", return_value=_versions()), \
+             patch.object(fcs.sspi_metadata, "country_group", return_value=COUNTRIES):
+            result = fcs.score_custom_configuration_fast(
+                metadata, country_codes=COUNTRIES, start_year=2000, end_year=2004,
+                panel_cache=panel_cache
+            )
+        return result, fetch_mock.call_count
+
+    cache = fcs.CleanDataPanelCache()
+    direct, _ = score(None)
+    cached, fetches = score(cache)
+    assert cached == direct and fetches == 1
+    repeat, fetches = score(cache)
+    assert repeat == direct and fetches == 0
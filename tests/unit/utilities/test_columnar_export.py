@@ -0,0 +1,91 @@
+import io
+import json
+import math
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from sspi_flask_app.api.resources.utilities import (
+    build_columnar_table,
+    serialize_columnar_table
+)
+from sspi_flask_app.models.errors import InvalidDocumentFormatError
+
+
+@pytest.fixture
+def item_documents():
+    return [
+        {
+            "ItemCode": code,
+            "CountryCode": country,
+            "Year": year,
+            "Score": score,
+            "Children": ["SUS", "MS", "PG"] if code == "SSPI" else [],
+        }
+        for code in ["SSPI", "BIODIV"]
+        for country in ["USA", "CAN"]
+        for year, score in [(2000, 0.5), (2001, None)]
+    ]
+
+
+def test_build_columnar_table_types(item_documents):
+    table = build_columnar_table(iter(item_documents))
+    assert table.num_rows == len(item_documents)
+    assert table.column_names == ["ItemCode", "CountryCode", "Year", "Score", "Children"]
+    assert table.schema.field("Year").type == pa.int16()
+    assert table.schema.field("Score").type == pa.float64()
+    assert pa.types.is_dictionary(table.schema.field("ItemCode").type)
+    assert pa.types.is_dictionary(table.schema.field("CountryCode").type)
+    assert table.column("Score").null_count == 4
+    assert json.loads(table.column("Children")[0].as_py()) == ["SUS", "MS", "PG"]
+
+
+def test_build_columnar_table_missing_and_mixed_columns():
+    documents = [
+        {"DatasetCode": "WB_POPULN", "Value": 1, "Note": "a"},
+        {"DatasetCode": "WB_POPULN", "Value": float("nan"), "Note": 3, "Extra": True},
+    ]
+    table = build_columnar_table(documents)
+    assert table.column_names == ["DatasetCode", "Value", "Note", "Extra"]
+    assert table.column("Note").to_pylist() == ["a", "3"]
+    assert table.column("Extra").to_pylist() == [None, True]
+    assert table.column("Value")[0].as_py() == 1.0
+    assert table.column("Value")[1].as_py() is None or math.isnan(table.column("Value")[1].as_py())
+
+
+def test_build_columnar_table_accepts_whole_float_years():
+    table = build_columnar_table([{"Year": 2000.0}, {"Year": None}, {"Year": 2001}])
+    assert table.column("Year").to_pylist() == [2000, None, 2001]
+
+
+@pytest.mark.parametrize("column, value", [
+    ("Year", 2000.5),
+    ("Year", "2000"),
+    ("Year", True),
+    ("Year", 40000),
+    ("Year", float("nan")),
+    ("Score", "0.5"),
+    ("Value", False),
+])
+def test_build_columnar_table_rejects_bad_typed_values(column, value):
+    documents = [{"CountryCode": "USA", column: 1}, {"CountryCode": "CAN", column: value}]
+    with pytest.raises(InvalidDocumentFormatError, match=f"Column '{column}'"):
+        build_columnar_table(documents)
+
+
+def test_build_columnar_table_empty():
+    assert build_columnar_table(iter([])).num_rows == 0
+
+
+@pytest.mark.parametrize("file_format", ["parquet", "arrow"])
+def test_serialize_columnar_table_round_trip(item_documents, file_format):
+    table = build_columnar_table(item_documents)
+    mem = serialize_columnar_table(table, file_format)
+    if file_format == "parquet":
+        loaded = pq.read_table(mem)
+    else:
+        loaded = pa.ipc.open_file(mem).read_all()
+    assert loaded.num_rows == table.num_rows
+    assert loaded.column("CountryCode").to_pylist() == table.column("CountryCode").to_pylist()
+    assert loaded.column("Score").to_pylist() == table.column("Score").to_pylist()
@@ -0,0 +1,49 @@
+import threading
+
+from sspi_flask_app.api.resources.dataset_scheduler import prefix_line, run_dataset_tasks
+
+
+def test_tasks_run_concurrently_and_lines_are_merged():
+    barrier = threading.Barrier(3, timeout=5)
+
+    def collector(n):
+        def task():
+            yield f"start {n}\n"
+            # Deadlocks (and times out) unless all three run at once
+            barrier.wait()
+            yield f"done {n}"
+        return task
+
+    tasks = [(f"DS_{n}", collector(n)) for n in range(3)]
+    lines = list(run_dataset_tasks(tasks, max_workers=3))
+    for n in range(3):
+        own = [line for line in lines if line.startswith(f"DS_{n}: ")]
+        assert own[:2] == [f"DS_{n}: start {n}\n", f"DS_{n}: done {n}\n"]
+        assert own[2].startswith(f"DS_{n}: finished in ")
+    assert lines[-1] == "Completed 3 of 3 datasets\n"
+
+
+def test_failures_are_reported_and_do_not_stop_other_tasks():
+    def broken():
+        yield "about to fail\n"
+        raise ValueError("bad page")
+
+    def cleaner():
+        return None
+
+    tasks = [("BROKEN", broken), ("GOOD", lambda: ["ok\n"]), ("CLEAN", cleaner)]
+    lines = list(run_dataset_tasks(tasks, max_workers=2))
+    assert "GOOD: ok\n" in lines
+    assert any(line.startswith("error: BROKEN failed after") and "bad page" in line for line in lines)
+    assert any(line.startswith("CLEAN: finished in ") for line in lines)
+    assert lines[-2:] == ["Completed 2 of 3 datasets\n", "Failed datasets: BROKEN\n"]
+
+
+def test_no_tasks():
+    assert list(run_dataset_tasks([])) == ["Completed 0 of 0 datasets\n"]
+
+
+def test_error_lines_keep_their_marker_first():
+    assert prefix_line("DS", "error: no data") == "error: DS: no data\n"
+    assert prefix_line("DS", "problem: gap\n") == "problem: DS: gap\n"
+    assert prefix_line("DS", "fetched 3 pages\n") == "DS: fetched 3 pages\n"
@@ -0,0 +1,48 @@
+from sspi_flask_app.api.resources.utilities import (
+    extrapolate_and_interpolate,
+    extrapolate_backward,
+    extrapolate_forward,
+    interpolate_linear,
+)
+
+
+def chained(data, backward_year, forward_year, series_id):
+    data = extrapolate_backward(data, backward_year, series_id=series_id)
+    data = extrapolate_forward(data, forward_year, series_id=series_id)
+    return interpolate_linear(data, series_id=series_id)
+
+
+def test_matches_chained_utilities():
+    series_id = ["CountryCode", "DatasetCode"]
+    data = [
+        {"CountryCode": "USA", "DatasetCode": "A", "Year": 2004, "Value": 10.0, "Unit": "%"},
+        {"CountryCode": "CAN", "DatasetCode": "A", "Year": 2003, "Value": 5, "Unit": "%"},
+        {"CountryCode": "USA", "DatasetCode": "A", "Year": 2001, "Value": 1.5, "Unit": "%"},
+        {"CountryCode": "USA", "DatasetCode": "B", "Year": 2002, "Unit": "%"},
+        {"CountryCode": "USA", "DatasetCode": "B", "Year": 2005, "Value": 3.0, "Unit": "%"},
+        {"CountryCode": "CAN", "DatasetCode": "A", "Year": 2000, "Value": 8, "Unit": "%"},
+        {"CountryCode": "USA", "DatasetCode": "A", "Year": 2008, "Value": -2.25, "Unit": "%"},
+    ]
+    result = extrapolate_and_interpolate(data, 1999, 2010, series_id=series_id)
+    assert result == chained(data, 1999, 2010, series_id)
+    imputed = extrapolate_and_interpolate(data, 1999, 2010, series_id=series_id, impute_only=True)
+    assert imputed == result[len(data):]
+    assert all(document["Imputed"] for document in imputed)
+    # B has no value at 2002, so its 2003-2004 gap is not interpolated
+    b_years = sorted(d["Year"] for d in result if d["DatasetCode"] == "B")
+    assert b_years == [1999, 2000, 2001, 2002, 2005, 2006, 2007, 2008, 2009, 2010]
+
+
+def test_input_documents_are_not_copied():
+    data = [
+        {"CountryCode": "USA", "IndicatorCode": "GDP", "Year": 2000, "Value": 100},
+        {"CountryCode": "USA", "IndicatorCode": "GDP", "Year": 2002, "Value": 200},
+    ]
+    result = extrapolate_and_interpolate(data, forward_year=2003)
+    assert result[0] is data[0] and result[1] is data[1]
+    assert [(d["Year"], d["Value"], d["ImputationMethod"]) for d in result[2:]] == [
+        (2003, 200, "Forward Extrapolation"),
+        (2001, 150, "Linear Interpolation"),
+    ]
+    assert "Imputed" not in data[0]
+    assert extrapolate_and_interpolate([], 2000, 2023) == []
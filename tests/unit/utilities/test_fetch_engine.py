@@ -0,0 +1,122 @@
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from sspi_flask_app.api.resources.fetch_engine import FetchEngine, TokenBucket, retry_after
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            hits = server.hits[self.path]
+        headers = {}
+        if self.path.startswith("/flaky") and hits <= 2:
+            status, body = 503, b"{}"
+        elif self.path.startswith("/throttled") and hits == 1:
+            status, body = 429, b"{}"
+            headers["Retry-After"] = "1"
+        else:
+            time.sleep(server.delay)
+            status, body = 200, json.dumps({"path": self.path}).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.lock = threading.Lock()
+    server.hits = {}
+    server.delay = 0.0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def base_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def test_fetch_pages_yields_in_order_and_in_parallel(stub_server):
+    stub_server.delay = 0.2
+    engine = FetchEngine(max_workers=8, rate_limits={"TEST": (100.0, 8)})
+    urls = [f"{base_url(stub_server)}/page/{p}" for p in range(8)]
+    start = time.monotonic()
+    paths = [r.json()["path"] for r in engine.fetch_pages(urls, "TEST")]
+    elapsed = time.monotonic() - start
+    assert paths == [f"/page/{p}" for p in range(8)]
+    # Eight sequential requests would take at least 1.6s
+    assert elapsed < 1.0
+
+
+def test_retries_transient_errors(stub_server):
+    engine = FetchEngine(retries=3, backoff=0.01)
+    response = engine.get(f"{base_url(stub_server)}/flaky", "TEST")
+    assert response.status_code == 200
+    assert stub_server.hits["/flaky"] == 3
+
+
+def test_gives_up_after_retries(stub_server):
+    engine = FetchEngine(retries=1, backoff=0.01)
+    response = engine.get(f"{base_url(stub_server)}/flaky", "TEST")
+    assert response.status_code == 503
+    assert stub_server.hits["/flaky"] == 2
+
+
+def test_honours_retry_after(stub_server):
+    engine = FetchEngine(retries=1, backoff=0.01)
+    start = time.monotonic()
+    response = engine.get(f"{base_url(stub_server)}/throttled", "TEST")
+    assert response.status_code == 200
+    assert stub_server.hits["/throttled"] == 2
+    assert time.monotonic() - start >= 1.0
+
+
+def test_retry_after_parses_seconds_and_dates():
+    response = requests.Response()
+    assert retry_after(response) is None
+    response.headers["Retry-After"] = "7"
+    assert retry_after(response) == 7.0
+    response.headers["Retry-After"] = "Wed, 21 Oct 2015 07:28:00 GMT"
+    assert retry_after(response) == 0.0
+    response.headers["Retry-After"] = "soon"
+    assert retry_after(response) is None
+
+
+def test_rate_limit_paces_requests(stub_server):
+    engine = FetchEngine(rate_limits={"SLOW": (10.0, 1)})
+    urls = [f"{base_url(stub_server)}/page/{p}" for p in range(4)]
+    start = time.monotonic()
+    list(engine.fetch_pages(urls, "SLOW"))
+    # One token up front, then one every 0.1s
+    assert time.monotonic() - start >= 0.29
+
+
+def test_one_session_per_host(stub_server):
+    engine = FetchEngine()
+    url = base_url(stub_server)
+    assert engine.session(f"{url}/a") is engine.session(f"{url}/b")
+    assert engine.session("https://api.worldbank.org/v2") is not engine.session(url)
+
+
+def test_token_bucket_rejects_invalid_limits():
+    with pytest.raises(ValueError):
+        TokenBucket(0, 1)
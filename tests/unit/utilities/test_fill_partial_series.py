@@ -0,0 +1,107 @@
+"""
+Unit tests for the array-based gap filling in fast_custom_scoring.
+
+fill_partial_series replaced a per-country loop that walked back and forth
+along each row to find neighbours. These tests pin it to that loop bit for
+bit (the loop is kept here as the reference) and check the stacked
+(n_datasets, n_countries, n_years) form against per-dataset calls.
+"""
+import numpy as np
+
+from sspi_flask_app.api.resources.fast_custom_scoring import (
+    fill_partial_series,
+    impute_dataset_vectorized,
+)
+
+
+def _reference_fill(data):
+    """The per-country loop previously used by impute_dataset_vectorized."""
+    imputed_data = data.copy()
+    n_countries, n_years = data.shape
+    for country_idx in range(n_countries):
+        country_data = imputed_data[country_idx, :]
+        missing_mask = np.isnan(country_data)
+        if not np.any(missing_mask):
+            continue
+        valid_indices = np.where(~missing_mask)[0]
+        if len(valid_indices) == 0:
+            continue
+        first_valid = valid_indices[0]
+        last_valid = valid_indices[-1]
+        if first_valid > 0:
+            imputed_data[country_idx, :first_valid] = country_data[first_valid]
+        if last_valid < n_years - 1:
+            imputed_data[country_idx, last_valid + 1:] = country_data[last_valid]
+        for year_idx in range(first_valid, last_valid + 1):
+            if np.isnan(imputed_data[country_idx, year_idx]):
+                prev_valid = year_idx - 1
+                while prev_valid >= first_valid and np.isnan(country_data[prev_valid]):
+                    prev_valid -= 1
+                next_valid = year_idx + 1
+                while next_valid <= last_valid and np.isnan(country_data[next_valid]):
+                    next_valid += 1
+                if prev_valid >= first_valid and next_valid <= last_valid:
+                    prev_value = country_data[prev_valid]
+                    next_value = country_data[next_valid]
+                    span = next_valid - prev_valid
+                    weight = (year_idx - prev_valid) / span
+                    imputed_data[country_idx, year_idx] = prev_value + weight * (next_value - prev_value)
+    return imputed_data
+
+
+def _random_panel(rng, shape, missing_rate):
+    data = rng.normal(50, 20, size=shape)
+    data[rng.random(shape) < missing_rate] = np.nan
+    return data
+
+
+def test_simple_row():
+    data = np.array([[np.nan, 1.0, np.nan, np.nan, 4.0, np.nan]])
+    np.testing.assert_array_equal(
+        fill_partial_series(data),
+        [[1.0, 1.0, 2.0, 3.0, 4.0, 4.0]]
+    )
+
+
+def test_empty_and_complete_rows_untouched():
+    data = np.array([[np.nan, np.nan, np.nan], [1.0, 2.0, 3.0]])
+    filled = fill_partial_series(data)
+    assert np.all(np.isnan(filled[0]))
+    np.testing.assert_array_equal(filled[1], data[1])
+
+
+def test_does_not_modify_input():
+    data = np.array([[1.0, np.nan, 3.0]])
+    fill_partial_series(data)
+    assert np.isnan(data[0, 1])
+
+
+def test_bit_identical_to_reference_loop():
+    rng = np.random.default_rng(7)
+    for missing_rate in (0.1, 0.5, 0.9):
+        data = _random_panel(rng, (60, 25), missing_rate)
+        expected = _reference_fill(data)
+        np.testing.assert_array_equal(fill_partial_series(data), expected)
+
+
+def test_stacked_tensor_matches_per_dataset():
+    rng = np.random.default_rng(11)
+    stacked = _random_panel(rng, (8, 30, 25), 0.6)
+    filled = fill_partial_series(stacked)
+    for i in range(stacked.shape[0]):
+        np.testing.assert_array_equal(filled[i], _reference_fill(stacked[i]))
+
+
+def test_impute_dataset_vectorized_partial_and_empty_countries():
+    rng = np.random.default_rng(3)
+    data = _random_panel(rng, (20, 15), 0.5)
+    data[4, :] = np.nan
+    reference_mask = np.zeros(20, dtype=bool)
+    reference_mask[:10] = True
+    imputed, flags = impute_dataset_vectorized(data, reference_mask)
+    assert not np.any(np.isnan(imputed))
+    np.testing.assert_array_equal(flags, np.isnan(data))
+    assert np.all(imputed[4, :] == np.nanmean(data[reference_mask, :]))
+    partial = np.ones(20, dtype=bool)
+    partial[4] = False
+    np.testing.assert_array_equal(imputed[partial], _reference_fill(data[partial]))
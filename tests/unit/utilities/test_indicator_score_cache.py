@@ -0,0 +1,117 @@
+"""
+Tests for the per-indicator score cache in score_custom_configuration_fast.
+
+A cached run must produce exactly the results of an uncached run while only
+fetching and scoring the indicators whose cache key changed. Dataset reads
+and the data version lookup are mocked; the clean-data version counters are
+exercised against the test collection.
+"""
+import numpy as np
+import pytest
+from unittest.mock import patch
+
+from sspi_flask_app.api.resources import fast_custom_scoring as fcs
+from sspi_flask_app.models.database import sspidb
+from sspi_flask_app.models.database.sspi_clean_api_data import SSPICleanAPIData
+
+COUNTRIES = ["AAA", "BBB", "CCC"]
+
+
+def _metadata(upper_goalpost=100):
+    return [
+        {"ItemType": "SSPI", "ItemCode": "SSPI", "ItemName": "SSPI",
+         "PillarCodes": ["PIL"], "Children": ["PIL"]},
+        {"ItemType": "Pillar", "ItemCode": "PIL", "ItemName": "Pillar",
+         "CategoryCodes": ["CAT"], "Children": ["CAT"]},
+        {"ItemType": "Category", "ItemCode": "CAT", "ItemName": "Category",
+         "IndicatorCodes": ["ONE", "TWO"], "Children": ["ONE", "TWO"]},
+        {"ItemType": "Indicator", "ItemCode": "ONE", "ItemName": "One",
+         "DatasetCodes": ["DS_ONE"], "LowerGoalpost": 0, "UpperGoalpost": upper_goalpost,
+         "ScoreFunction": "Score = goalpost(DS_ONE, LowerGoalpost, UpperGoalpost)"},
+        {"ItemType": "Indicator", "ItemCode": "TWO", "ItemName": "Two",
+         "DatasetCodes": ["DS_TWO"], "LowerGoalpost": 0, "UpperGoalpost": 50,
+         "ScoreFunction": "Score = goalpost(DS_TWO, LowerGoalpost, UpperGoalpost)"},
+    ]
+
+
+def _fetch(dataset_codes, country_codes, start_year, end_year):
+    rng = np.random.default_rng(4)
+    arrays = {
+        code: rng.uniform(0, 100, size=(len(country_codes), end_year - start_year + 1))
+        for code in ["DS_ONE", "DS_TWO"]
+    }
+    return {code: arrays[code] for code in dataset_codes}
+
+
+def _score(metadata, score_cache, versions=None):
+    versions = versions or {"Generation": 0, "Datasets": {"DS_ONE": 1, "DS_TWO": 1}}
+    with patch.object(fcs, "fetch_all_datasets_aggregated", side_effect=_fetch) as fetch, \
+         patch.object(fcs.sspi_clean_api_data, "data_versions", return_value=versions), \
+         patch.object(fcs.sspi_metadata, "country_group", return_value=COUNTRIES):
+        result = fcs.score_custom_configuration_fast(
+            metadata, country_codes=COUNTRIES, start_year=2000, end_year=2004,
+            score_cache=score_cache
+        )
+    fetched = [sorted(call.args[0]) for call in fetch.call_args_list]
+    return result, fetched
+
+
+def test_cache_lru_eviction_and_read_only():
+    cache = fcs.IndicatorScoreCache(max_bytes=2 * 8 * 4)
+    cache.put("a", np.zeros(4))
+    cache.put("b", np.ones(4))
+    cache.get("a")
+    cache.put("c", np.ones(4))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    with pytest.raises(ValueError):
+        cache.get("a")[0] = 1.0
+
+
+def test_goalpost_edit_rescores_only_that_indicator():
+    cache = fcs.IndicatorScoreCache()
+    first, fetched = _score(_metadata(), cache)
+    assert fetched == [["DS_ONE", "DS_TWO"]]
+    assert len(cache) == 2
+
+    repeat, fetched = _score(_metadata(), cache)
+    assert fetched == []
+    assert repeat == first
+
+    edited, fetched = _score(_metadata(upper_goalpost=80), cache)
+    assert fetched == [["DS_ONE"]]
+    uncached, _ = _score(_metadata(upper_goalpost=80), None)
+    assert edited == uncached
+
+
+def test_data_version_bump_invalidates_dependent_indicator():
+    cache = fcs.IndicatorScoreCache()
+    _score(_metadata(), cache)
+    bumped = {"Generation": 0, "Datasets": {"DS_ONE": 1, "DS_TWO": 2}}
+    _, fetched = _score(_metadata(), cache, versions=bumped)
+    assert fetched == [["DS_TWO"]]
+
+
+@pytest.fixture(scope="function")
+def clean_data():
+    collection = sspidb.sspi_test_clean_api_data
+    collection.delete_many({})
+    sspidb[f"{collection.name}_versions"].delete_many({})
+    yield SSPICleanAPIData(collection)
+    collection.delete_many({})
+    sspidb.drop_collection(collection)
+    sspidb.drop_collection(f"{collection.name}_versions")
+
+
+def test_clean_data_writes_bump_dataset_versions(clean_data):
+    document = {"DatasetCode": "DS_ONE", "CountryCode": "USA", "Year": 2018,
+                "Value": 1.0, "Unit": "Percent"}
+    assert clean_data.data_versions(["DS_ONE"]) == {"Generation": 0, "Datasets": {"DS_ONE": 0}}
+    clean_data.insert_many([document])
+    clean_data.delete_many({"DatasetCode": "DS_ONE"})
+    clean_data.delete_many({"DatasetCode": "DS_ONE"})  # no-op delete
+    versions = clean_data.data_versions(["DS_ONE", "DS_TWO"])
+    assert versions == {"Generation": 0, "Datasets": {"DS_ONE": 2, "DS_TWO": 0}}
+    clean_data.insert_many([document])
+    clean_data.delete_many({"CountryCode": "USA"})
+    assert clean_data.data_versions([])["Generation"] == 1
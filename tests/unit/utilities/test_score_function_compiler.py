@@ -0,0 +1,109 @@
+"""
+Tests for compile_score_function: the vectorized kernel must agree cell for
+cell with safe_eval, including NaN wherever safe_eval raises. Results are
+bit-identical except through pow/log, where NumPy's libm may differ from
+math.pow/math.log in the last place.
+"""
+
+import math
+
+import numpy as np
+import pytest
+
+from sspi_flask_app.api.resources.score_function_validator import (
+    validate_score_function,
+    compile_score_function,
+    safe_eval,
+    ScoreFunctionValidationError,
+)
+from sspi_flask_app.api.resources.fast_custom_scoring import (
+    _apply_custom_score_function,
+)
+
+
+COMPOSITE_SCORE_FUNCTIONS = [
+    "Score = average(goalpost(UNSDG_MARINE, 0, 100), goalpost(UNSDG_TERRST, 0, 100), goalpost(UNSDG_FRSHWT, 0, 100))",
+    "Score = goalpost(UNSDG_MARINE / UNSDG_TERRST * 100, -10, 50)",
+    "Score = max(goalpost(UNSDG_MARINE * pow(10, 8) / UNSDG_TERRST, 0, 1), goalpost(UNSDG_FRSHWT * pow(10, 6) / UNSDG_TERRST, 0, 500))",
+    "Score = min(goalpost(sqrt(UNSDG_MARINE), 0, 10), goalpost(log(UNSDG_TERRST), 0, 5))",
+    "Score = goalpost(abs(UNSDG_MARINE - UNSDG_TERRST), 100, 0)",
+    "Score = goalpost(pow(UNSDG_MARINE, 0.5), 0, 10)",
+    "Score = goalpost(pow(UNSDG_MARINE, -2), 0, 1)",
+    "Score = goalpost(UNSDG_MARINE, LowerGoalpost, UpperGoalpost)",
+    "Score = goalpost(UNSDG_MARINE, 5, 5)",
+    "Score = max(goalpost(UNSDG_MARINE, 0, 100))",
+]
+
+CODES = ["UNSDG_MARINE", "UNSDG_TERRST", "UNSDG_FRSHWT"]
+
+
+def _reference(validated, arrays, lower=None, upper=None):
+    shape = arrays[CODES[0]].shape
+    expected = np.full(shape, np.nan)
+    for idx in np.ndindex(shape):
+        values = {code: float(arrays[code][idx]) for code in CODES}
+        try:
+            expected[idx] = safe_eval(validated, values, lower, upper)
+        except Exception:
+            pass
+    return expected
+
+
+def _arrays():
+    rng = np.random.default_rng(5)
+    arrays = {code: rng.normal(20, 40, size=(12, 10)) for code in CODES}
+    # Edge cells: zeros (division, log, negative pow), negatives (sqrt, log),
+    # exact goalpost hits and overflow-sized values
+    arrays["UNSDG_TERRST"][0, :3] = 0.0
+    arrays["UNSDG_MARINE"][1, :] = [0.0, -4.0, 5.0, 1e200, -1e200, 100.0, -0.0, 1e-300, 25.0, 4.0]
+    arrays["UNSDG_TERRST"][2, :2] = [-1.0, 1e308]
+    return arrays
+
+
+@pytest.mark.parametrize("score_function", COMPOSITE_SCORE_FUNCTIONS)
+def test_kernel_matches_safe_eval(score_function):
+    validated = validate_score_function(score_function)
+    arrays = _arrays()
+    kernel = compile_score_function(validated)
+    result = kernel(arrays, lower_goalpost=0, upper_goalpost=100)
+    expected = _reference(validated, arrays, 0, 100)
+    np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+    if "pow" in score_function or "log" in score_function:
+        np.testing.assert_allclose(result, expected, rtol=1e-14, atol=0)
+    else:
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_missing_dataset_raises():
+    validated = validate_score_function("Score = goalpost(UNSDG_MARINE, 0, 100)")
+    with pytest.raises(ValueError):
+        compile_score_function(validated)({"UNSDG_TERRST": np.zeros((2, 2))})
+
+
+def test_missing_goalpost_variable_raises():
+    validated = validate_score_function("Score = goalpost(UNSDG_MARINE, LowerGoalpost, UpperGoalpost)")
+    with pytest.raises(ValueError):
+        compile_score_function(validated)({"UNSDG_MARINE": np.zeros((2, 2))})
+
+
+def test_unvalidated_function_rejected():
+    validated = validate_score_function("Score = goalpost(UNSDG_MARINE, 0, 100)")
+    validated.ast = None
+    with pytest.raises(ScoreFunctionValidationError):
+        compile_score_function(validated)
+
+
+def test_apply_custom_score_function_clamps_and_masks_nan():
+    score_function = COMPOSITE_SCORE_FUNCTIONS[0]
+    arrays = _arrays()
+    arrays["UNSDG_FRSHWT"][3, 4] = np.nan
+    stack = np.array([arrays[code] for code in CODES])
+    scores = _apply_custom_score_function(score_function, stack, CODES, None, None)
+    validated = validate_score_function(score_function)
+    for idx in np.ndindex(scores.shape):
+        values = {code: float(arrays[code][idx]) for code in CODES}
+        if any(math.isnan(v) for v in values.values()):
+            assert math.isnan(scores[idx])
+            continue
+        expected = max(0.0, min(1.0, safe_eval(validated, values)))
+        assert scores[idx] == expected
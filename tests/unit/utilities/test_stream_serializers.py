@@ -0,0 +1,66 @@
+import json
+import pandas as pd
+from sspi_flask_app.api.resources.utilities import stream_csv, stream_ndjson
+
+
+def sample_documents(n=5):
+    return [
+        {
+            "DatasetCode": "WB_POPULN",
+            "CountryCode": "USA",
+            "Year": 2000 + i,
+            "Value": None if i == 2 else 1.5 * i,
+            "Unit": "Persons, \"Total\"",
+            "Imputed": i % 2 == 0,
+        }
+        for i in range(n)
+    ]
+
+
+def test_stream_ndjson_one_line_per_document():
+    documents = sample_documents()
+    lines = list(stream_ndjson(iter(documents)))
+    assert len(lines) == len(documents)
+    assert all(line.endswith("\n") for line in lines)
+    assert [json.loads(line) for line in lines] == documents
+
+
+def test_stream_ndjson_empty():
+    assert list(stream_ndjson(iter([]))) == []
+
+
+def test_stream_csv_matches_pandas_layout():
+    documents = sample_documents()
+    streamed = "".join(stream_csv(iter(documents)))
+    assert streamed == pd.DataFrame(documents).to_csv()
+
+
+def test_stream_csv_nan_written_as_empty_cell():
+    documents = [{"CountryCode": "USA", "Value": float("nan")}]
+    assert "".join(stream_csv(documents)) == pd.DataFrame(documents).to_csv()
+
+
+def test_stream_csv_yields_in_batches():
+    documents = sample_documents(25)
+    chunks = list(stream_csv(iter(documents), batch_size=10))
+    assert len(chunks) == 3
+    assert "".join(chunks) == pd.DataFrame(documents).to_csv()
+
+
+def test_stream_csv_uses_first_document_columns():
+    documents = [
+        {"CountryCode": "USA", "Value": 1},
+        {"CountryCode": "CAN", "Value": 2, "Extra": "dropped"},
+        {"CountryCode": "MEX"},
+    ]
+    assert "".join(stream_csv(documents)) == ",CountryCode,Value\n0,USA,1\n1,CAN,2\n2,MEX,\n"
+
+
+def test_stream_csv_writes_values_without_pandas_upcasting():
+    documents = [{"Year": 2000, "Value": 1}, {"Year": 2001, "Value": None}]
+    assert "".join(stream_csv(documents)) == ",Year,Value\n0,2000,1\n1,2001,\n"
+    assert pd.DataFrame(documents).to_csv() == ",Year,Value\n0,2000,1.0\n1,2001,\n"
+
+
+def test_stream_csv_empty():
+    assert list(stream_csv(iter([]))) == []